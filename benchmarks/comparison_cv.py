@@ -0,0 +1,78 @@
+"""
+Microbenchmark: ComparisonCVBuilder.create_comparison_cv on CVs with many work
+items, optionally without the default loguru handler.
+
+Run from the repository root:
+    python -m benchmarks.comparison_cv --work-items 200 --iterations 20
+    python -m benchmarks.comparison_cv --work-items 200 --no-logging
+"""
+
+import argparse
+import os
+import timeit
+
+os.environ.setdefault("GOOGLE_API_KEY", "fake-api-key")
+
+from loguru import logger  # noqa: E402
+
+from benchmarks.load_test import large_cv  # noqa: E402
+from src.core.cv_builders.comparison_cv_builder import (  # noqa: E402
+    ComparisonCVBuilder,
+)
+from src.core.models.revised_cv_fields import (  # noqa: E402
+    RevisedCVResponseSchema,
+    RevisedWorkItem,
+)
+
+
+def suggestions_for(cv) -> RevisedCVResponseSchema:
+    """Revisions for every second work item."""
+    return RevisedCVResponseSchema(
+        explanations="Emphasized the ML work.",
+        suggestions="Lead with the most recent role.",
+        revised_professional_title="Machine Learning Engineer",
+        revised_professional_summary=None,
+        revised_skills=None,
+        revised_work_experience=[
+            RevisedWorkItem(
+                id=item.id,
+                revised_summary=f"Revised: {item.summary}",
+                revised_highlights=["Shipped a ranking model to production."],
+            )
+            for item in cv.work_experience[::2]
+        ],
+        revised_projects=None,
+        revised_awards=None,
+        revised_publications=None,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--work-items", type=int, default=200)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument(
+        "--no-logging",
+        action="store_true",
+        help="Remove the default loguru handler, which logs DEBUG lines.",
+    )
+    args = parser.parse_args()
+    if args.no_logging:
+        logger.remove()
+
+    cv = large_cv(0, args.work_items)
+    ai_suggestions = suggestions_for(cv)
+    builder = ComparisonCVBuilder()
+
+    seconds = min(
+        timeit.repeat(
+            lambda: builder.create_comparison_cv(cv, ai_suggestions),
+            number=args.iterations,
+            repeat=3,
+        )
+    )
+    print(f"build       {seconds / args.iterations * 1e3:8.3f} ms/build")
+
+
+if __name__ == "__main__":
+    main()
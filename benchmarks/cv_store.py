@@ -0,0 +1,84 @@
+"""
+Microbenchmark: the per-request CV work of /tailor_cv before the prompt is
+built. A request carrying the CV validates it from JSON and renders it to the
+LLM format; a request carrying cv_id validates the small body and looks the CV,
+validated and rendered when stored, up in the CV store.
+
+Run from the repository root:
+    python -m benchmarks.cv_store --iterations 200
+"""
+
+import argparse
+import os
+import timeit
+
+os.environ.setdefault("GOOGLE_API_KEY", "fake-api-key")
+
+from loguru import logger  # noqa: E402
+
+from benchmarks.request_validation import maximum_cv, small_cv  # noqa: E402
+from src.app.api.v1.endpoints.tailor_cv import ChatRequest  # noqa: E402
+from src.app.dependencies.cv_store import resolve_cv  # noqa: E402
+from src.app.dependencies.json_body import JSONBody  # noqa: E402
+from src.core.examples.test_template import cv_dmytro  # noqa: E402
+from src.core.models.job_description_fields import (  # noqa: E402
+    get_job_description_example,
+)
+from src.core.storage.cv_store import CVStore  # noqa: E402
+from src.core.templates.renderers.llm import (  # noqa: E402
+    TemplateLLMRenderer,
+    fragment_cache,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+    logger.remove()
+
+    json_body = JSONBody(ChatRequest)
+    store = CVStore(render_cv=TemplateLLMRenderer.cv_to_llm_format)
+    job_description = get_job_description_example()
+
+    def cv_work(body: bytes) -> str:
+        request = json_body.validate(body, "application/json")
+        cv, cv_string = resolve_cv(request, store)
+        if cv_string is None:
+            # A new CV per request, so no memoized fragment is reused.
+            fragment_cache.clear()
+            cv_string = TemplateLLMRenderer.cv_to_llm_format(cv)
+        return cv_string
+
+    for name, cv in (
+        ("small", small_cv()),
+        ("typical", cv_dmytro),
+        ("maximum", maximum_cv()),
+    ):
+        stored = store.create(cv)
+        full_body = ChatRequest(
+            cv=cv, cv_id=None, cv_etag=None, job_description=job_description
+        ).model_dump_json(exclude_none=True)
+        id_body = ChatRequest(
+            cv_id=stored.cv_id, cv_etag=stored.etag, job_description=job_description
+        ).model_dump_json(exclude_none=True)
+        assert cv_work(id_body.encode()) == stored.cv_string
+
+        results = {}
+        for path, body in (("cv", full_body), ("cv_id", id_body)):
+            body_bytes = body.encode("utf-8")
+            seconds = min(
+                timeit.repeat(
+                    lambda: cv_work(body_bytes), number=args.iterations, repeat=3
+                )
+            )
+            results[path] = seconds / args.iterations * 1e6
+        print(
+            f"{name:<8} cv {len(full_body) / 1024:7.1f} KiB {results['cv']:9.1f} us, "
+            f"cv_id {len(id_body) / 1024:5.1f} KiB {results['cv_id']:7.1f} us, "
+            f"speedup {results['cv'] / results['cv_id']:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
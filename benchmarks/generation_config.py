@@ -0,0 +1,99 @@
+"""
+Microbenchmark: per-request overhead of the CV tailoring generation config,
+building a GenerateContentConfig with the pydantic response schema on every call
+against the shared registry config with the schema converted once. Each case
+covers the config, the response cache key and the SDK request preparation; the
+HTTP call is replaced by a canned response, so no network is used.
+
+Run from the repository root:
+    python -m benchmarks.generation_config --iterations 200
+"""
+
+import argparse
+import asyncio
+import os
+import timeit
+from typing import Any, Dict, Optional
+
+os.environ.setdefault("GOOGLE_API_KEY", "fake-api-key")
+
+from google import genai  # noqa: E402
+from google.genai.types import GenerateContentConfig  # noqa: E402
+
+from src.core.ai.generation_config import GenerationConfigRegistry  # noqa: E402
+from src.core.ai.prompts import SUGGEST_IMPROVEMENTS_SYSTEM_PROMPT  # noqa: E402
+from src.core.ai.response_cache import make_cache_key  # noqa: E402
+from src.core.models.revised_cv_fields import RevisedCVResponseSchema  # noqa: E402
+
+PROMPT = "Tailor this CV to the job description. " * 200
+SUGGESTIONS_JSON = RevisedCVResponseSchema.model_validate(
+    {"explanations": "Reordered skills.", "suggestions": "Lead with the ML projects."}
+).model_dump_json()
+
+
+def build_config() -> GenerateContentConfig:
+    return GenerateContentConfig(
+        max_output_tokens=2048,
+        system_instruction=SUGGEST_IMPROVEMENTS_SYSTEM_PROMPT,
+        response_mime_type="application/json",
+        response_schema=RevisedCVResponseSchema,
+    )
+
+
+def offline_client() -> genai.Client:
+    client = genai.Client(api_key="fake-api-key")
+
+    async def canned_request(
+        http_method: str,
+        path: str,
+        request_dict: Dict[str, Any],
+        http_options: Optional[Any] = None,
+    ) -> Dict[str, Any]:
+        return {
+            "candidates": [
+                {"content": {"role": "model", "parts": [{"text": SUGGESTIONS_JSON}]}}
+            ]
+        }
+
+    client._api_client.async_request = canned_request  # type: ignore[method-assign]
+    return client
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    client = offline_client()
+    registry = GenerationConfigRegistry()
+    registry.register("suggest_improvements", build_config)
+    loop = asyncio.new_event_loop()
+
+    def request(config: GenerateContentConfig) -> None:
+        make_cache_key("model", PROMPT, config)
+        loop.run_until_complete(
+            client.aio.models.generate_content(
+                model="gemini-2.0-flash", contents=PROMPT, config=config
+            )
+        )
+
+    cases = {
+        "config only, built per request": lambda: make_cache_key(
+            "model", PROMPT, build_config()
+        ),
+        "config only, registry": lambda: make_cache_key(
+            "model", PROMPT, registry.get("suggest_improvements")
+        ),
+        "with SDK call, built per request": lambda: request(build_config()),
+        "with SDK call, registry": lambda: request(
+            registry.get("suggest_improvements")
+        ),
+    }
+    for name, case in cases.items():
+        seconds = min(timeit.repeat(case, number=args.iterations, repeat=3))
+        print(f"{name:<34} {seconds / args.iterations * 1e3:8.3f} ms/request")
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
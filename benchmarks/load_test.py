@@ -0,0 +1,134 @@
+"""
+Load test for CVTailorService against the offline fake Gemini backend.
+
+Run from the repository root:
+    python -m benchmarks.load_test --requests 200 --concurrency 20
+
+Compare event loop lag with CPU-bound stages on and off the loop:
+    python -m benchmarks.load_test --requests 20 --concurrency 4 --work-items 200 --cpu-executor inline
+    python -m benchmarks.load_test --requests 20 --concurrency 4 --work-items 200 --cpu-executor thread
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+os.environ.setdefault("GEMINI_BACKEND", "fake")
+os.environ.setdefault("GOOGLE_API_KEY", "fake-api-key")
+
+from loguru import logger  # noqa: E402
+
+from src.core.ai.loop_lag import EventLoopLagMonitor  # noqa: E402
+from src.core.ai.offload import CPUExecutor  # noqa: E402
+from src.core.examples.test_template import cv_dmytro  # noqa: E402
+from src.core.models.input_cv_fields import CVBody  # noqa: E402
+from src.core.models.job_description_fields import (  # noqa: E402
+    get_job_description_example,
+)
+from src.core.services.base_service import BaseAIService  # noqa: E402
+from src.core.services.cv_tailor_service import CVTailorService  # noqa: E402
+
+
+def percentile(values, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def large_cv(index: int, work_items: int) -> CVBody:
+    """A CV with work_items distinct work items, so no rendered fragment is reused."""
+    assert cv_dmytro.work_experience
+    template = cv_dmytro.work_experience[0]
+    return cv_dmytro.model_copy(
+        update={
+            "work_experience": [
+                template.model_copy(
+                    update={
+                        "id": f"{template.id[:-8]}{item:08d}",
+                        "summary": f"{template.summary} ({index}-{item})",
+                    }
+                )
+                for item in range(work_items)
+            ]
+        }
+    )
+
+
+async def run(requests: int, concurrency: int, distinct: bool, work_items: int) -> None:
+    service = CVTailorService()
+    cvs = [
+        large_cv(index, work_items) if work_items else cv_dmytro
+        for index in range(requests)
+    ]
+    job_description = get_job_description_example()
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    failures = 0
+
+    async def one(index: int) -> None:
+        nonlocal failures
+        job = (
+            job_description.model_copy(update={"job_title": f"Job {index}"})
+            if distinct
+            else job_description
+        )
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                await service.tailor_cv(cvs[index], job)
+            except Exception:
+                failures += 1
+            latencies.append(time.perf_counter() - started)
+
+    monitor = EventLoopLagMonitor(interval_seconds=0.005)
+    monitor.start()
+    started = time.perf_counter()
+    await asyncio.gather(*(one(index) for index in range(requests)))
+    elapsed = time.perf_counter() - started
+    await monitor.stop()
+
+    print(f"requests:    {requests} ({failures} failed)")
+    print(f"throughput:  {requests / elapsed:.1f} req/s")
+    print(f"mean:        {statistics.mean(latencies) * 1000:.0f} ms")
+    for fraction in (0.5, 0.95, 0.99):
+        print(
+            f"p{int(fraction * 100):<10} {percentile(latencies, fraction) * 1000:.0f} ms"
+        )
+    lag = monitor.stats
+    print(
+        f"loop lag:    p50 {lag['p50_ms']:.1f} ms, p99 {lag['p99_ms']:.1f} ms, "
+        f"max {lag['max_ms']:.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument(
+        "--same-job",
+        action="store_true",
+        help="Reuse one job description, so response caching and coalescing apply.",
+    )
+    parser.add_argument(
+        "--work-items",
+        type=int,
+        default=0,
+        help="Send per-request CVs with this many distinct work items.",
+    )
+    parser.add_argument(
+        "--cpu-executor", choices=["inline", "thread"], default="thread"
+    )
+    args = parser.parse_args()
+
+    logger.remove()
+    BaseAIService.cpu_executor = CPUExecutor(kind=args.cpu_executor)
+    asyncio.run(
+        run(
+            args.requests,
+            args.concurrency,
+            distinct=not args.same_job,
+            work_items=args.work_items,
+        )
+    )
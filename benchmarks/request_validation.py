@@ -0,0 +1,99 @@
+"""
+Microbenchmark: validating a /tailor_cv request body the way FastAPI does for a
+body parameter (json.loads, then validation of the dict) against JSONBody's
+direct validation of the JSON bytes, on small, typical and maximum-size CVs.
+
+Run from the repository root:
+    python -m benchmarks.request_validation --iterations 200
+"""
+
+import argparse
+import json
+import os
+import timeit
+
+os.environ.setdefault("GOOGLE_API_KEY", "fake-api-key")
+
+from pydantic import TypeAdapter  # noqa: E402
+
+from src.app.api.v1.endpoints.tailor_cv import ChatRequest  # noqa: E402
+from src.app.dependencies.json_body import JSONBody  # noqa: E402
+from src.core.examples.test_template import cv_dmytro  # noqa: E402
+from src.core.models.input_cv_fields import CVBody  # noqa: E402
+from src.core.models.job_description_fields import (  # noqa: E402
+    get_job_description_example,
+)
+
+
+def small_cv() -> CVBody:
+    return CVBody(
+        header=cv_dmytro.header, professional_summary=cv_dmytro.professional_summary
+    )
+
+
+def maximum_cv(work_items: int = 50) -> CVBody:
+    """work_items work items, each with a summary and highlights at their length limit."""
+    assert cv_dmytro.work_experience
+    template = cv_dmytro.work_experience[0]
+    return cv_dmytro.model_copy(
+        update={
+            "work_experience": [
+                template.model_copy(
+                    update={
+                        "id": f"{template.id[:-8]}{item:08d}",
+                        "summary": ("Built and shipped ML systems. " * 170)[:5000],
+                        "highlights": [
+                            f"Highlight {item}-{n} " * 10 for n in range(10)
+                        ],
+                    }
+                )
+                for item in range(work_items)
+            ]
+        }
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    adapter = TypeAdapter(ChatRequest)
+    json_body = JSONBody(ChatRequest, validate_json_min_bytes=0)
+    job_description = get_job_description_example()
+
+    for name, cv in (
+        ("small", small_cv()),
+        ("typical", cv_dmytro),
+        ("maximum", maximum_cv()),
+    ):
+        body = ChatRequest(
+            cv=cv, cv_id=None, cv_etag=None, job_description=job_description
+        ).model_dump_json()
+        body_bytes = body.encode("utf-8")
+        assert json_body.validate(
+            body_bytes, "application/json"
+        ) == adapter.validate_python(json.loads(body_bytes), from_attributes=True)
+
+        results = {}
+        for path, func in (
+            (
+                "dict",
+                lambda: adapter.validate_python(
+                    json.loads(body_bytes), from_attributes=True
+                ),
+            ),
+            ("bytes", lambda: json_body.validate(body_bytes, "application/json")),
+        ):
+            seconds = min(timeit.repeat(func, number=args.iterations, repeat=3))
+            results[path] = seconds / args.iterations * 1e6
+        print(
+            f"{name:<8} {len(body_bytes) / 1024:7.1f} KiB: "
+            f"json.loads + dict {results['dict']:9.1f} us, "
+            f"validate_json {results['bytes']:9.1f} us, "
+            f"speedup {results['dict'] / results['bytes']:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
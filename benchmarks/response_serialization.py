@@ -0,0 +1,90 @@
+"""
+Microbenchmark: serializing the /tailor_cv ChatResponse for a CV with many work
+items. Compares FastAPI's response_model handling (revalidation, then either a
+Python dict encoded with json.dumps, as older FastAPI versions do, or
+pydantic-core's dump_json) with model_json_response in the full and slim views
+and with the JSON Patch response of /tailor_cv/patch, and reports the payload
+size of each. --work-items 0 uses the example CV instead.
+
+Run from the repository root:
+    python -m benchmarks.response_serialization --work-items 50 --iterations 200
+    python -m benchmarks.response_serialization --work-items 0
+"""
+
+import argparse
+import asyncio
+import os
+import timeit
+
+os.environ.setdefault("GOOGLE_API_KEY", "fake-api-key")
+
+from fastapi.responses import JSONResponse  # noqa: E402
+from fastapi.routing import serialize_response  # noqa: E402
+from fastapi.utils import create_model_field  # noqa: E402
+from loguru import logger  # noqa: E402
+
+from benchmarks.comparison_cv import suggestions_for  # noqa: E402
+from benchmarks.load_test import large_cv  # noqa: E402
+from src.app.api.v1.endpoints.tailor_cv import (  # noqa: E402
+    ChatResponse,
+    chat_response,
+)
+from src.app.api.v1.responses import (  # noqa: E402
+    ResponseView,
+    model_json_response,
+)
+from src.core.cv_builders.comparison_cv_builder import (  # noqa: E402
+    ComparisonCVBuilder,
+)
+from src.core.cv_builders.cv_patch_builder import CVPatchBuilder  # noqa: E402
+from src.core.examples.test_template import cv_dmytro  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--work-items", type=int, default=50)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+    logger.remove()
+
+    cv = large_cv(0, args.work_items) if args.work_items else cv_dmytro
+    ai_suggestions = suggestions_for(cv)
+    comparison_cv = ComparisonCVBuilder().create_comparison_cv(cv, ai_suggestions)
+    cv_patch = CVPatchBuilder.create_cv_patch(cv, ai_suggestions)
+    response = ChatResponse(response=comparison_cv)
+    field = create_model_field("Response_chat", ChatResponse, mode="serialization")
+    loop = asyncio.new_event_loop()
+
+    def fastapi_response(dump_json: bool) -> bytes:
+        content = loop.run_until_complete(
+            serialize_response(
+                field=field, response_content=response, dump_json=dump_json
+            )
+        )
+        return content if dump_json else bytes(JSONResponse(content).body)
+
+    cases = {
+        "response_model, dict + json.dumps": lambda: fastapi_response(False),
+        "response_model, dump_json": lambda: fastapi_response(True),
+        "model_json_response, full": lambda: chat_response(
+            comparison_cv, ResponseView.FULL
+        ).body,
+        "model_json_response, slim": lambda: chat_response(
+            comparison_cv, ResponseView.SLIM
+        ).body,
+        "model_json_response, patch": lambda: model_json_response(
+            cv_patch, exclude_unset=True
+        ).body,
+    }
+    for name, case in cases.items():
+        size = len(case())
+        seconds = min(timeit.repeat(case, number=args.iterations, repeat=3))
+        print(
+            f"{name:<36} {size / 1024:8.1f} KiB "
+            f"{seconds / args.iterations * 1e3:8.3f} ms/response"
+        )
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Microbenchmark: rendering the LLM CV and job description with templates compiled
+per request, precompiled, and precompiled with memoized CV fragments after a
+single work item edit.
+
+Run from the repository root:
+    python -m benchmarks.template_rendering --iterations 200
+"""
+
+import argparse
+import os
+import timeit
+
+os.environ.setdefault("GOOGLE_API_KEY", "fake-api-key")
+
+from jinja2 import Template  # noqa: E402
+
+from src.core.examples.test_template import cv_dmytro  # noqa: E402
+from src.core.models.job_description_fields import (  # noqa: E402
+    get_job_description_example,
+)
+from src.core.templates.md_job_description_template import (  # noqa: E402
+    JOB_DESCRIPTION_TEMPLATE_MD,
+)
+from src.core.templates.renderers.environment import (  # noqa: E402
+    JOB_DESCRIPTION_TEMPLATE,
+    TEMPLATE_SOURCES,
+    render_template,
+)
+from src.core.templates.renderers.llm import (  # noqa: E402
+    FragmentCache,
+    TemplateLLMRenderer,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    job_description = get_job_description_example()
+    no_cache = FragmentCache(max_entries=0)
+    compiling_cache = FragmentCache(
+        max_entries=0,
+        render=lambda name, **context: Template(TEMPLATE_SOURCES[name]).render(
+            **context
+        ),
+    )
+    memoized_cache = FragmentCache()
+    edits = 0
+
+    def compile_per_request() -> None:
+        TemplateLLMRenderer.cv_to_llm_format(cv_dmytro, compiling_cache)
+        Template(JOB_DESCRIPTION_TEMPLATE_MD).render(
+            job_description_data=job_description
+        )
+
+    def precompiled() -> None:
+        TemplateLLMRenderer.cv_to_llm_format(cv_dmytro, no_cache)
+        render_template(JOB_DESCRIPTION_TEMPLATE, job_description_data=job_description)
+
+    def memoized_after_edit() -> None:
+        nonlocal edits
+        edits += 1
+        work_experience = list(cv_dmytro.work_experience or [])
+        work_experience[0] = work_experience[0].model_copy(
+            update={"summary": f"{work_experience[0].summary} ({edits})"}
+        )
+        cv = cv_dmytro.model_copy(update={"work_experience": work_experience})
+        TemplateLLMRenderer.cv_to_llm_format(cv, memoized_cache)
+        render_template(JOB_DESCRIPTION_TEMPLATE, job_description_data=job_description)
+
+    results = {}
+    for name, func in (
+        ("compile per request", compile_per_request),
+        ("precompiled", precompiled),
+        ("memoized fragments", memoized_after_edit),
+    ):
+        func()
+        seconds = min(timeit.repeat(func, number=args.iterations, repeat=3))
+        results[name] = seconds / args.iterations * 1e6
+        print(f"{name:<28} {results[name]:10.1f} us/request")
+
+    for name in ("precompiled", "memoized fragments"):
+        speedup = results["compile per request"] / results[name]
+        print(f"{'speedup, ' + name:<28} {speedup:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,37 +1,104 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel
 
-from src.app.dependencies.common import get_generate_cover_letter_service
-from src.core.models.input_cv_fields import CVBody
+from src.app.api.v1.streaming import sse_response
+from src.app.dependencies.common import (
+    ensure_gemini_available,
+    gateway_timeout_exception,
+    get_generate_cover_letter_service,
+    request_deadline,
+    service_unavailable_exception,
+)
+from src.app.dependencies.cv_store import get_cv_store, resolve_cv
+from src.app.dependencies.json_body import json_body
+from src.core.config import settings
 from src.core.models.job_description_fields import JobDescriptionFields
+from src.core.models.prompt_preview import PromptPreview
+from src.core.models.stored_cv_fields import CVReference
 from src.core.services.cover_letter_service import GenerateCoverLetterService
+from src.core.storage.cv_store import CVStore
+from src.core.utils.exceptions import CircuitOpenError, DeadlineExceededError
 
 router = APIRouter()
 
 
-class CoverLetterChatRequest(BaseModel):
-    cv: CVBody
+class CoverLetterChatRequest(CVReference):
     job_description: JobDescriptionFields
 
 
+cover_letter_request_body = json_body(CoverLetterChatRequest)
+
+
 class CoverLetterChatResponse(BaseModel):
     response: str
 
 
-@router.post("/cover_letter", response_model=CoverLetterChatResponse)
+@router.post(
+    "/cover_letter",
+    response_model=CoverLetterChatResponse,
+    dependencies=[Depends(request_deadline(settings.COVER_LETTER_TIMEOUT_SECONDS))],
+    openapi_extra=cover_letter_request_body.openapi_extra,
+)
 async def chat_with_gemini(
-    request: CoverLetterChatRequest,
+    request: CoverLetterChatRequest = Depends(cover_letter_request_body),
     generate_cover_letter_service: GenerateCoverLetterService = Depends(
         get_generate_cover_letter_service
     ),
+    cv_store: CVStore = Depends(get_cv_store),
 ):
+    cv, cv_string = resolve_cv(request, cv_store)
     try:
         generated_text = await generate_cover_letter_service.generate_cover_letter(
-            request.cv, request.job_description
+            cv, request.job_description, cv_string=cv_string
         )
         return CoverLetterChatResponse(response=generated_text)
+    except CircuitOpenError as e:
+        raise service_unavailable_exception(e)
+    except DeadlineExceededError as e:
+        raise gateway_timeout_exception(e)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error interacting with Gemini API: {e}",
         )
+
+
+@router.post(
+    "/cover_letter/dry_run",
+    response_model=PromptPreview,
+    openapi_extra=cover_letter_request_body.openapi_extra,
+)
+def preview_cover_letter_prompt(
+    request: CoverLetterChatRequest = Depends(cover_letter_request_body),
+    generate_cover_letter_service: GenerateCoverLetterService = Depends(
+        get_generate_cover_letter_service
+    ),
+    cv_store: CVStore = Depends(get_cv_store),
+):
+    cv, cv_string = resolve_cv(request, cv_store)
+    return generate_cover_letter_service.preview_prompt(
+        cv, request.job_description, cv_string=cv_string
+    )
+
+
+@router.post(
+    "/cover_letter/stream",
+    dependencies=[
+        Depends(request_deadline(settings.COVER_LETTER_TIMEOUT_SECONDS)),
+        Depends(ensure_gemini_available),
+    ],
+    openapi_extra=cover_letter_request_body.openapi_extra,
+)
+async def stream_chat_with_gemini(
+    request: CoverLetterChatRequest = Depends(cover_letter_request_body),
+    generate_cover_letter_service: GenerateCoverLetterService = Depends(
+        get_generate_cover_letter_service
+    ),
+    cv_store: CVStore = Depends(get_cv_store),
+):
+    cv, cv_string = resolve_cv(request, cv_store)
+    return sse_response(
+        generate_cover_letter_service.stream_cover_letter(
+            cv, request.job_description, cv_string=cv_string
+        )
+    )
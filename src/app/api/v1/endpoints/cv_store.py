@@ -0,0 +1,72 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, Response, status
+
+from src.app.dependencies.cv_store import (
+    cv_not_found_exception,
+    cv_precondition_failed_exception,
+    get_cv_store,
+)
+from src.app.dependencies.json_body import json_body
+from src.core.models.input_cv_fields import CVBody
+from src.core.models.stored_cv_fields import StoredCVInfo, StoredCVResponse
+from src.core.storage.cv_store import CVStore, StoredCV
+from src.core.utils.exceptions import CVNotFoundError, CVPreconditionFailedError
+
+router = APIRouter()
+
+cv_body = json_body(CVBody)
+
+
+def _info(stored: StoredCV, response: Response) -> StoredCVInfo:
+    response.headers["ETag"] = stored.etag
+    return StoredCVInfo(cv_id=stored.cv_id, version=stored.version, etag=stored.etag)
+
+
+@router.post(
+    "/cvs",
+    response_model=StoredCVInfo,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra=cv_body.openapi_extra,
+)
+def create_cv(
+    response: Response,
+    cv: CVBody = Depends(cv_body),
+    cv_store: CVStore = Depends(get_cv_store),
+):
+    stored = cv_store.create(cv)
+    response.headers["Location"] = f"/api/v1/cvs/{stored.cv_id}"
+    return _info(stored, response)
+
+
+@router.put(
+    "/cvs/{cv_id}",
+    response_model=StoredCVInfo,
+    openapi_extra=cv_body.openapi_extra,
+)
+def update_cv(
+    cv_id: str,
+    response: Response,
+    cv: CVBody = Depends(cv_body),
+    if_match: Optional[str] = Header(None),
+    cv_store: CVStore = Depends(get_cv_store),
+):
+    try:
+        return _info(cv_store.update(cv_id, cv, if_match=if_match), response)
+    except CVNotFoundError as e:
+        raise cv_not_found_exception(e)
+    except CVPreconditionFailedError as e:
+        raise cv_precondition_failed_exception(e)
+
+
+@router.get("/cvs/{cv_id}", response_model=StoredCVResponse)
+def get_cv(
+    cv_id: str,
+    response: Response,
+    cv_store: CVStore = Depends(get_cv_store),
+):
+    try:
+        stored = cv_store.get_matching(cv_id)
+    except CVNotFoundError as e:
+        raise cv_not_found_exception(e)
+    return StoredCVResponse(**_info(stored, response).model_dump(), cv=stored.cv)
@@ -1,11 +1,22 @@
+from typing import List
+
 from fastapi import APIRouter, Depends, HTTPException, status
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, Field, field_validator
 
-from src.app.dependencies.common import get_improve_cv_section_service
+from src.app.api.v1.streaming import sse_response
+from src.app.dependencies.common import (
+    ensure_gemini_available,
+    gateway_timeout_exception,
+    get_improve_cv_section_service,
+    request_deadline,
+    service_unavailable_exception,
+)
+from src.core.config import settings
 from src.core.services.improve_cv_section_service import (
     ImproveCVSectionService,
     Instruction,
 )
+from src.core.utils.exceptions import CircuitOpenError, DeadlineExceededError
 
 router = APIRouter()
 
@@ -26,7 +37,19 @@ class CVSectionChatResponse(BaseModel):
     response: str
 
 
-@router.post("/improve_section", response_model=CVSectionChatResponse)
+class CVSectionsBatchChatRequest(BaseModel):
+    sections: List[CVSectionChatRequest] = Field(..., min_length=1, max_length=50)
+
+
+class CVSectionsBatchChatResponse(BaseModel):
+    responses: List[str]
+
+
+@router.post(
+    "/improve_section",
+    response_model=CVSectionChatResponse,
+    dependencies=[Depends(request_deadline(settings.IMPROVE_SECTION_TIMEOUT_SECONDS))],
+)
 async def chat_with_gemini(
     request: CVSectionChatRequest,
     improve_cv_section_service: ImproveCVSectionService = Depends(
@@ -38,6 +61,57 @@ async def chat_with_gemini(
             request.cv_section, request.instruction
         )
         return CVSectionChatResponse(response=generated_text)
+    except CircuitOpenError as e:
+        raise service_unavailable_exception(e)
+    except DeadlineExceededError as e:
+        raise gateway_timeout_exception(e)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error interacting with Gemini API: {e}",
+        )
+
+
+@router.post(
+    "/improve_section/stream",
+    dependencies=[
+        Depends(request_deadline(settings.IMPROVE_SECTION_TIMEOUT_SECONDS)),
+        Depends(ensure_gemini_available),
+    ],
+)
+async def stream_chat_with_gemini(
+    request: CVSectionChatRequest,
+    improve_cv_section_service: ImproveCVSectionService = Depends(
+        get_improve_cv_section_service
+    ),
+):
+    return sse_response(
+        improve_cv_section_service.stream_cv_section_improvements(
+            request.cv_section, request.instruction
+        )
+    )
+
+
+@router.post(
+    "/improve_section/batch",
+    response_model=CVSectionsBatchChatResponse,
+    dependencies=[Depends(request_deadline(settings.BATCH_TIMEOUT_SECONDS))],
+)
+async def batch_chat_with_gemini(
+    request: CVSectionsBatchChatRequest,
+    improve_cv_section_service: ImproveCVSectionService = Depends(
+        get_improve_cv_section_service
+    ),
+):
+    try:
+        generated_texts = await improve_cv_section_service.get_cv_sections_improvements(
+            [(section.cv_section, section.instruction) for section in request.sections]
+        )
+        return CVSectionsBatchChatResponse(responses=generated_texts)
+    except CircuitOpenError as e:
+        raise service_unavailable_exception(e)
+    except DeadlineExceededError as e:
+        raise gateway_timeout_exception(e)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -0,0 +1,66 @@
+from typing import Any, Dict, Optional, Union
+
+from fastapi import APIRouter, Depends
+from pydantic import BaseModel
+
+from src.app.dependencies.common import (
+    get_cv_tailor_service,
+    get_event_loop_lag_monitor,
+    get_generate_cover_letter_service,
+)
+from src.core.ai.loop_lag import EventLoopLagMonitor
+from src.core.services.base_service import BaseAIService
+from src.core.services.cover_letter_service import GenerateCoverLetterService
+from src.core.services.cv_tailor_service import CVTailorService
+from src.core.templates.renderers.llm import fragment_cache
+
+router = APIRouter()
+
+
+class MetricsResponse(BaseModel):
+    response_cache: Optional[Dict[str, int]] = None
+    single_flight: Dict[str, int]
+    rate_limiter: Optional[Dict[str, float]] = None
+    circuit_breaker: Optional[Dict[str, Union[str, int]]] = None
+    hedging: Optional[Dict[str, Any]] = None
+    models: Dict[str, Dict[str, Union[int, float, None]]] = {}
+    token_estimator: Dict[str, float] = {}
+    context_cache: Dict[str, Dict[str, int]] = {}
+    template_fragments: Dict[str, int] = {}
+    cpu_executor: Dict[str, Union[str, int]] = {}
+    event_loop_lag: Dict[str, Optional[float]] = {}
+
+
+@router.get("/metrics", response_model=MetricsResponse)
+async def get_metrics(
+    cv_tailor_service: CVTailorService = Depends(get_cv_tailor_service),
+    generate_cover_letter_service: GenerateCoverLetterService = Depends(
+        get_generate_cover_letter_service
+    ),
+    event_loop_lag_monitor: EventLoopLagMonitor = Depends(get_event_loop_lag_monitor),
+):
+    response_cache = cv_tailor_service.response_cache
+    rate_limiter = BaseAIService.rate_limiter
+    circuit_breaker = BaseAIService.circuit_breaker
+    hedger = BaseAIService.hedger
+    context_caches = {
+        "tailor_cv": cv_tailor_service.context_cache,
+        "cover_letter": generate_cover_letter_service.context_cache,
+    }
+    return MetricsResponse(
+        response_cache=response_cache.stats if response_cache else None,
+        single_flight=BaseAIService.single_flight.stats,
+        rate_limiter=rate_limiter.stats if rate_limiter else None,
+        circuit_breaker=circuit_breaker.stats if circuit_breaker else None,
+        hedging=hedger.stats if hedger else None,
+        models=BaseAIService.model_stats.stats,
+        token_estimator=BaseAIService.token_estimator.stats,
+        context_cache={
+            name: context_cache.stats
+            for name, context_cache in context_caches.items()
+            if context_cache is not None
+        },
+        template_fragments=fragment_cache.stats,
+        cpu_executor=BaseAIService.cpu_executor.stats,
+        event_loop_lag=event_loop_lag_monitor.stats,
+    )
@@ -1,17 +1,38 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from pydantic import BaseModel
+from typing import AsyncIterator, List, Optional
 
-from src.app.dependencies.common import get_cv_tailor_service
-from src.core.models.comparison_cv_fields import ComparisonCV
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import Response
+from pydantic import BaseModel, Field, ValidationError
+
+from src.app.api.v1.responses import ResponseView, model_json_response
+from src.app.api.v1.streaming import ndjson_response, sse_event_response
+from src.app.dependencies.common import (
+    ensure_gemini_available,
+    gateway_timeout_exception,
+    get_cv_tailor_service,
+    request_deadline,
+)
+from src.app.dependencies.cv_store import get_cv_store, resolve_cv
+from src.app.dependencies.json_body import json_body
+from src.core.config import settings
+from src.core.cv_builders.cv_patch_builder import apply_cv_patch
+from src.core.models.comparison_cv_fields import (
+    SLIM_COMPARISON_CV_EXCLUDE,
+    ComparisonCV,
+)
+from src.core.models.cv_patch_fields import CVPatch, JSONPatchOperation
 from src.core.models.input_cv_fields import CVBody
 from src.core.models.job_description_fields import JobDescriptionFields
+from src.core.models.prompt_preview import PromptPreview
+from src.core.models.stored_cv_fields import CVReference
 from src.core.services.cv_tailor_service import CVTailorService
+from src.core.storage.cv_store import CVStore
+from src.core.utils.exceptions import CVPatchError, DeadlineExceededError
 
 router = APIRouter()
 
 
-class ChatRequest(BaseModel):
-    cv: CVBody
+class ChatRequest(CVReference):
     job_description: JobDescriptionFields
 
 
@@ -19,18 +40,181 @@ class ChatResponse(BaseModel):
     response: ComparisonCV
 
 
-@router.post("/tailor_cv", response_model=ChatResponse)
+def chat_response(comparison_cv: ComparisonCV, view: ResponseView) -> Response:
+    response = ChatResponse(response=comparison_cv)
+    if view is ResponseView.SLIM:
+        return model_json_response(
+            response,
+            exclude={"response": SLIM_COMPARISON_CV_EXCLUDE},
+            exclude_none=True,
+        )
+    return model_json_response(response)
+
+
+class BatchChatRequest(BaseModel):
+    cv: CVBody
+    job_descriptions: List[JobDescriptionFields] = Field(
+        ..., min_length=1, max_length=settings.BATCH_MAX_JOB_DESCRIPTIONS
+    )
+
+
+class ApplyCVPatchRequest(BaseModel):
+    cv: CVBody
+    operations: List[JSONPatchOperation]
+
+
+chat_request_body = json_body(ChatRequest)
+batch_chat_request_body = json_body(BatchChatRequest)
+apply_cv_patch_request_body = json_body(ApplyCVPatchRequest)
+
+
+class BatchChatResponseItem(BaseModel):
+    index: int
+    job_title: str
+    response: Optional[ComparisonCV] = None
+    error: Optional[str] = None
+
+
+@router.post(
+    "/tailor_cv",
+    response_model=ChatResponse,
+    dependencies=[Depends(request_deadline(settings.TAILOR_CV_TIMEOUT_SECONDS))],
+    openapi_extra=chat_request_body.openapi_extra,
+)
 async def chat_with_gemini(
-    request: ChatRequest,
+    request: ChatRequest = Depends(chat_request_body),
+    view: ResponseView = Query(
+        ResponseView.FULL,
+        description="'slim' omits originals repeated in the comparison fields "
+        "and null values, such as suggestions that were not made.",
+    ),
     cv_tailor_service: CVTailorService = Depends(get_cv_tailor_service),
+    cv_store: CVStore = Depends(get_cv_store),
 ):
+    cv, cv_string = resolve_cv(request, cv_store)
     try:
         generated_text = await cv_tailor_service.tailor_cv(
-            request.cv, request.job_description
+            cv, request.job_description, cv_string=cv_string
+        )
+        return chat_response(generated_text, view)
+    except DeadlineExceededError as e:
+        raise gateway_timeout_exception(e)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error interacting with Gemini API: {e}",
+        )
+
+
+@router.post(
+    "/tailor_cv/patch",
+    response_model=CVPatch,
+    dependencies=[Depends(request_deadline(settings.TAILOR_CV_TIMEOUT_SECONDS))],
+    openapi_extra=chat_request_body.openapi_extra,
+)
+async def tailor_cv_patch(
+    request: ChatRequest = Depends(chat_request_body),
+    cv_tailor_service: CVTailorService = Depends(get_cv_tailor_service),
+    cv_store: CVStore = Depends(get_cv_store),
+):
+    cv, cv_string = resolve_cv(request, cv_store)
+    try:
+        cv_patch = await cv_tailor_service.tailor_cv_patch(
+            cv, request.job_description, cv_string=cv_string
         )
-        return ChatResponse(response=generated_text)
+        return model_json_response(cv_patch, exclude_unset=True)
+    except DeadlineExceededError as e:
+        raise gateway_timeout_exception(e)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error interacting with Gemini API: {e}",
         )
+
+
+@router.post(
+    "/tailor_cv/patch/apply",
+    response_model=CVBody,
+    openapi_extra=apply_cv_patch_request_body.openapi_extra,
+)
+def apply_tailor_cv_patch(
+    request: ApplyCVPatchRequest = Depends(apply_cv_patch_request_body),
+):
+    try:
+        return apply_cv_patch(request.cv, request.operations)
+    except CVPatchError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=e.errors(
+                include_url=False, include_context=False, include_input=False
+            ),
+        )
+
+
+@router.post(
+    "/tailor_cv/dry_run",
+    response_model=PromptPreview,
+    openapi_extra=chat_request_body.openapi_extra,
+)
+def preview_tailor_cv_prompt(
+    request: ChatRequest = Depends(chat_request_body),
+    cv_tailor_service: CVTailorService = Depends(get_cv_tailor_service),
+    cv_store: CVStore = Depends(get_cv_store),
+):
+    cv, cv_string = resolve_cv(request, cv_store)
+    return cv_tailor_service.preview_prompt(
+        cv, request.job_description, cv_string=cv_string
+    )
+
+
+@router.post(
+    "/tailor_cv/stream",
+    dependencies=[
+        Depends(request_deadline(settings.TAILOR_CV_TIMEOUT_SECONDS)),
+        Depends(ensure_gemini_available),
+    ],
+    openapi_extra=chat_request_body.openapi_extra,
+)
+async def stream_chat_with_gemini(
+    request: ChatRequest = Depends(chat_request_body),
+    cv_tailor_service: CVTailorService = Depends(get_cv_tailor_service),
+    cv_store: CVStore = Depends(get_cv_store),
+):
+    cv, cv_string = resolve_cv(request, cv_store)
+    return sse_event_response(
+        cv_tailor_service.stream_tailor_cv(
+            cv, request.job_description, cv_string=cv_string
+        )
+    )
+
+
+@router.post(
+    "/tailor_cv/batch",
+    dependencies=[Depends(request_deadline(settings.BATCH_TIMEOUT_SECONDS))],
+    openapi_extra=batch_chat_request_body.openapi_extra,
+)
+async def batch_chat_with_gemini(
+    request: BatchChatRequest = Depends(batch_chat_request_body),
+    cv_tailor_service: CVTailorService = Depends(get_cv_tailor_service),
+):
+    async def _results() -> AsyncIterator[BatchChatResponseItem]:
+        async for index, result in cv_tailor_service.tailor_cv_batch(
+            request.cv,
+            request.job_descriptions,
+            max_concurrency=settings.BATCH_MAX_CONCURRENCY,
+        ):
+            job_title = request.job_descriptions[index].job_title
+            if isinstance(result, Exception):
+                yield BatchChatResponseItem(
+                    index=index,
+                    job_title=job_title,
+                    error=f"Error interacting with Gemini API: {result}",
+                )
+            else:
+                yield BatchChatResponseItem(
+                    index=index, job_title=job_title, response=result
+                )
+
+    return ndjson_response(_results())
@@ -0,0 +1,23 @@
+from enum import Enum
+from typing import Any
+
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+
+class ResponseView(str, Enum):
+    FULL = "full"
+    SLIM = "slim"
+
+
+def model_json_response(model: BaseModel, **dump_options: Any) -> Response:
+    """
+    Serializes model to JSON bytes with its compiled pydantic-core serializer.
+    Unlike returning the model with a response_model, the response is neither
+    revalidated nor re-encoded, whichever FastAPI version is installed.
+    dump_options (exclude, exclude_none, ...) are passed to the serializer.
+    """
+    content = type(model).__pydantic_serializer__.to_json(
+        model, by_alias=True, **dump_options
+    )
+    return Response(content=content, media_type="application/json")
@@ -0,0 +1,81 @@
+import json
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from loguru import logger
+from pydantic import BaseModel
+
+from src.core.utils.exceptions import DeadlineExceededError
+
+STREAMING_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",
+}
+
+
+def format_sse_event(data: Any, event: Optional[str] = None) -> str:
+    """Formats a single Server-Sent Event with a JSON payload."""
+    message = f"data: {json.dumps(jsonable_encoder(data), ensure_ascii=False)}\n\n"
+    if event:
+        message = f"event: {event}\n{message}"
+    return message
+
+
+async def events_to_sse(
+    events: AsyncIterator[Tuple[Optional[str], Dict[str, Any]]],
+) -> AsyncIterator[str]:
+    """
+    Wraps a stream of (event name, payload) pairs into SSE events.
+    Errors raised after the response has started are reported as an 'error' event,
+    because the status code has already been sent. A deadline error keeps its own
+    detail, matching the 504 of the non-streamed routes.
+    """
+    try:
+        async for event, data in events:
+            yield format_sse_event(data, event=event)
+    except DeadlineExceededError as e:
+        logger.error(f"Deadline exceeded while streaming response: {e}")
+        yield format_sse_event({"detail": str(e)}, event="error")
+        return
+    except Exception as e:
+        logger.error(f"Error while streaming response: {e}")
+        yield format_sse_event(
+            {"detail": f"Error interacting with Gemini API: {e}"}, event="error"
+        )
+        return
+    yield format_sse_event({}, event="done")
+
+
+async def _text_chunks_to_events(
+    chunks: AsyncIterator[str],
+) -> AsyncIterator[Tuple[Optional[str], Dict[str, Any]]]:
+    async for chunk in chunks:
+        yield None, {"text": chunk}
+
+
+def sse_response(chunks: AsyncIterator[str]) -> StreamingResponse:
+    return sse_event_response(_text_chunks_to_events(chunks))
+
+
+def sse_event_response(
+    events: AsyncIterator[Tuple[Optional[str], Dict[str, Any]]],
+) -> StreamingResponse:
+    return StreamingResponse(
+        events_to_sse(events),
+        media_type="text/event-stream",
+        headers=STREAMING_HEADERS,
+    )
+
+
+async def _models_to_ndjson(items: AsyncIterator[BaseModel]) -> AsyncIterator[str]:
+    async for item in items:
+        yield item.model_dump_json() + "\n"
+
+
+def ndjson_response(items: AsyncIterator[BaseModel]) -> StreamingResponse:
+    return StreamingResponse(
+        _models_to_ndjson(items),
+        media_type="application/x-ndjson",
+        headers=STREAMING_HEADERS,
+    )
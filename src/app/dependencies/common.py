@@ -1,7 +1,16 @@
-from src.core.config import Settings, get_settings
+import math
+from typing import Awaitable, Callable, Optional
+
+from fastapi import Header, HTTPException, status
+
+from src.core.ai.deadline import set_deadline
+from src.core.ai.loop_lag import EventLoopLagMonitor
+from src.core.config import Settings, get_settings, settings
+from src.core.services.base_service import BaseAIService
 from src.core.services.cover_letter_service import cover_letter_service
 from src.core.services.cv_tailor_service import cv_tailor_service
 from src.core.services.improve_cv_section_service import improve_cv_section_service
+from src.core.utils.exceptions import CircuitOpenError, DeadlineExceededError
 
 
 def get_cv_tailor_service():
@@ -19,6 +28,62 @@ def get_generate_cover_letter_service():
     return cover_letter_service
 
 
+event_loop_lag_monitor = EventLoopLagMonitor(
+    interval_seconds=settings.EVENT_LOOP_LAG_INTERVAL_MS / 1000
+)
+
+
+def get_event_loop_lag_monitor() -> EventLoopLagMonitor:
+    """Dependency to provide the event loop lag monitor."""
+    return event_loop_lag_monitor
+
+
 def get_app_settings() -> Settings:
     """Dependency to provide application settings."""
     return get_settings()
+
+
+def service_unavailable_exception(error: CircuitOpenError) -> HTTPException:
+    """Fast 503 returned instead of calling Gemini while the circuit is open."""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=str(error),
+        headers={"Retry-After": str(math.ceil(error.retry_after))},
+    )
+
+
+def ensure_gemini_available():
+    """Dependency that rejects a request up front while the circuit is open."""
+    circuit_breaker = BaseAIService.circuit_breaker
+    if circuit_breaker is None:
+        return
+    retry_after = circuit_breaker.retry_after()
+    if retry_after > 0:
+        raise service_unavailable_exception(CircuitOpenError(retry_after))
+
+
+def gateway_timeout_exception(error: DeadlineExceededError) -> HTTPException:
+    """504 returned when the request deadline ran out before Gemini answered."""
+    return HTTPException(
+        status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+        detail=str(error),
+    )
+
+
+def request_deadline(
+    default_timeout_seconds: float,
+) -> Callable[..., Awaitable[None]]:
+    """
+    Dependency factory setting the request deadline from the X-Request-Timeout
+    header (seconds), or from the endpoint default when the header is absent.
+    """
+
+    async def _set_request_deadline(
+        x_request_timeout: Optional[float] = Header(default=None, gt=0),
+    ) -> None:
+        timeout_seconds = (
+            default_timeout_seconds if x_request_timeout is None else x_request_timeout
+        )
+        set_deadline(min(timeout_seconds, settings.REQUEST_TIMEOUT_MAX_SECONDS))
+
+    return _set_request_deadline
@@ -0,0 +1,52 @@
+from functools import lru_cache
+from typing import Optional, Tuple, cast
+
+from fastapi import HTTPException, status
+
+from src.core.config import settings
+from src.core.models.input_cv_fields import CVBody
+from src.core.models.stored_cv_fields import CVReference
+from src.core.storage.cv_store import CVStore
+from src.core.templates.renderers.llm import TemplateLLMRenderer
+from src.core.utils.exceptions import CVNotFoundError, CVPreconditionFailedError
+
+
+@lru_cache
+def get_cv_store() -> CVStore:
+    """Dependency to provide the CV store, opened on first use."""
+    return CVStore(
+        render_cv=TemplateLLMRenderer.cv_to_llm_format,
+        sqlite_path=settings.CV_STORE_SQLITE_PATH,
+        max_entries=settings.CV_STORE_MAX_ENTRIES,
+    )
+
+
+def cv_not_found_exception(error: CVNotFoundError) -> HTTPException:
+    return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(error))
+
+
+def cv_precondition_failed_exception(
+    error: CVPreconditionFailedError,
+) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_412_PRECONDITION_FAILED,
+        detail=str(error),
+        headers={"ETag": error.etag},
+    )
+
+
+def resolve_cv(request: CVReference, cv_store: CVStore) -> Tuple[CVBody, Optional[str]]:
+    """
+    The request's CV and, for a stored CV, its LLM format rendered when it was
+    stored. Stored CVs were validated when stored, so neither step is repeated.
+    """
+    if request.cv_id is None:
+        # CVReference guarantees the CV itself when there is no cv_id.
+        return cast(CVBody, request.cv), None
+    try:
+        stored = cv_store.get_matching(request.cv_id, request.cv_etag)
+    except CVNotFoundError as e:
+        raise cv_not_found_exception(e)
+    except CVPreconditionFailedError as e:
+        raise cv_precondition_failed_exception(e)
+    return stored.cv, stored.cv_string
@@ -0,0 +1,179 @@
+import email.message
+import json
+from typing import Any, Dict, Generic, List, Optional, Type, TypeVar
+
+from fastapi import FastAPI, HTTPException, Request, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from src.core.ai.offload import CPUExecutor
+from src.core.config import settings
+from src.core.services.base_service import BaseAIService
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+OPENAPI_REF_TEMPLATE = "#/components/schemas/{model}"
+
+
+def _is_json_content_type(content_type: Optional[str]) -> bool:
+    if not content_type:
+        return False
+    message = email.message.Message()
+    message["content-type"] = content_type
+    subtype = message.get_content_subtype()
+    return message.get_content_maintype() == "application" and (
+        subtype == "json" or subtype.endswith("+json")
+    )
+
+
+def _request_validation_error(
+    error: ValidationError, body: Any = None
+) -> RequestValidationError:
+    return RequestValidationError(
+        [
+            {**detail, "loc": ("body", *detail["loc"])}
+            for detail in error.errors(include_url=False)
+        ],
+        body=body,
+    )
+
+
+class JSONBody(Generic[ModelT]):
+    """
+    Dependency validating the raw request body with a cached TypeAdapter.
+    Bodies of at least validate_json_min_bytes are validated straight from the
+    JSON bytes, instead of FastAPI's json.loads followed by validation of the
+    resulting dict; smaller bodies gain nothing from it and take FastAPI's path.
+    Failures raise the RequestValidationError FastAPI raises for a body
+    parameter. Above the threshold its details come from JSON mode, which words
+    some errors differently. Bodies of at least offload_min_bytes are validated
+    on the executor. Routes using it pass openapi_extra to keep the body documented.
+    """
+
+    def __init__(
+        self,
+        model: Type[ModelT],
+        executor: Optional[CPUExecutor] = None,
+        offload_min_bytes: int = 65536,
+        validate_json_min_bytes: int = 16384,
+    ):
+        self.model = model
+        self.adapter: TypeAdapter[ModelT] = TypeAdapter(model)
+        self.executor = executor
+        self.offload_min_bytes = offload_min_bytes
+        self.validate_json_min_bytes = validate_json_min_bytes
+
+    async def __call__(self, request: Request) -> ModelT:
+        body = await request.body()
+        content_type = request.headers.get("content-type")
+        if self.executor is not None and len(body) >= self.offload_min_bytes:
+            return await self.executor.run(self.validate, body, content_type)
+        return self.validate(body, content_type)
+
+    def validate(self, body: bytes, content_type: Optional[str]) -> ModelT:
+        if not body:
+            raise RequestValidationError(
+                [
+                    {
+                        "type": "missing",
+                        "loc": ("body",),
+                        "msg": "Field required",
+                        "input": None,
+                    }
+                ]
+            )
+        if not _is_json_content_type(content_type):
+            return self._validate_python(body)
+        if len(body) < self.validate_json_min_bytes:
+            return self._validate_python(self._decode(body))
+        try:
+            return self.adapter.validate_json(body)
+        except ValidationError as e:
+            raise _request_validation_error(e) from e
+
+    @staticmethod
+    def _decode(body: bytes) -> Any:
+        try:
+            return json.loads(body)
+        except json.JSONDecodeError as e:
+            raise RequestValidationError(
+                [
+                    {
+                        "type": "json_invalid",
+                        "loc": ("body", e.pos),
+                        "msg": "JSON decode error",
+                        "input": {},
+                        "ctx": {"error": e.msg},
+                    }
+                ],
+                body=e.doc,
+            ) from e
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="There was an error parsing the body",
+            ) from e
+
+    def _validate_python(self, value: Any) -> ModelT:
+        try:
+            return self.adapter.validate_python(value, from_attributes=True)
+        except ValidationError as e:
+            raise _request_validation_error(e, body=value) from e
+
+    @property
+    def openapi_extra(self) -> Dict[str, Any]:
+        """Request body section for the route, referencing openapi_schemas."""
+        return {
+            "requestBody": {
+                "content": {
+                    "application/json": {
+                        "schema": {
+                            "$ref": OPENAPI_REF_TEMPLATE.format(
+                                model=self.model.__name__
+                            )
+                        }
+                    }
+                },
+                "required": True,
+            }
+        }
+
+    def openapi_schemas(self) -> Dict[str, Any]:
+        """Component schemas of the body model and every model nested in it."""
+        schema = self.adapter.json_schema(ref_template=OPENAPI_REF_TEMPLATE)
+        components = schema.pop("$defs", {})
+        components[self.model.__name__] = schema
+        return components
+
+
+json_bodies: List[JSONBody] = []
+
+
+def json_body(model: Type[ModelT]) -> JSONBody[ModelT]:
+    """JSONBody for model, registered so add_json_body_schemas documents it."""
+    body = JSONBody(
+        model,
+        executor=BaseAIService.cpu_executor,
+        offload_min_bytes=settings.JSON_BODY_OFFLOAD_MIN_BYTES,
+        validate_json_min_bytes=settings.JSON_BODY_VALIDATE_JSON_MIN_BYTES,
+    )
+    json_bodies.append(body)
+    return body
+
+
+def add_json_body_schemas(app: FastAPI) -> None:
+    """Adds the schemas of the json_body request bodies to the app's OpenAPI document."""
+    build_openapi = app.openapi
+
+    def openapi() -> Dict[str, Any]:
+        if app.openapi_schema is not None:
+            return app.openapi_schema
+        # build_openapi caches the document it returns in app.openapi_schema.
+        openapi_schema = build_openapi()
+        schemas = openapi_schema.setdefault("components", {}).setdefault("schemas", {})
+        for body in json_bodies:
+            for name, schema in body.openapi_schemas().items():
+                schemas.setdefault(name, schema)
+        return openapi_schema
+
+    app.openapi = openapi  # type: ignore[method-assign]
@@ -1,11 +1,22 @@
 import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from loguru import logger as loguru_logger
 
-from src.app.api.v1.endpoints import cover_letter, improve_section, tailor_cv
+from src.app.api.v1.endpoints import (
+    cover_letter,
+    cv_store,
+    improve_section,
+    metrics,
+    tailor_cv,
+)
+from src.app.dependencies.common import event_loop_lag_monitor
+from src.app.dependencies.json_body import add_json_body_schemas
 from src.core.config import settings  # Access settings for configuration
+from src.core.services.base_service import BaseAIService
 
 loguru_logger.level("INFO")
 
@@ -14,12 +25,22 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    if settings.EVENT_LOOP_LAG_MONITOR_ENABLED:
+        event_loop_lag_monitor.start()
+    yield
+    await event_loop_lag_monitor.stop()
+    BaseAIService.cpu_executor.shutdown()
+
+
 def create_app() -> FastAPI:
     app = FastAPI(
         title=settings.APP_NAME,
         version="1.0.0",
         description="FastAPI application interacting with Google Gemini API",
         debug=settings.ENVIRONMENT == "development",
+        lifespan=lifespan,
     )
 
     # CORS middleware setup (adjust origins as needed for your frontend)
@@ -37,6 +58,9 @@ def create_app() -> FastAPI:
         improve_section.router, prefix="/api/v1", tags=["improve_section"]
     )
     app.include_router(cover_letter.router, prefix="/api/v1", tags=["cover_letter"])
+    app.include_router(cv_store.router, prefix="/api/v1", tags=["cv_store"])
+    app.include_router(metrics.router, prefix="/api/v1", tags=["metrics"])
+    add_json_body_schemas(app)
     return app
 
 
@@ -0,0 +1,160 @@
+import time
+from collections import deque
+from contextlib import contextmanager
+from enum import Enum
+from typing import Callable, Deque, Dict, Iterator, Tuple, Union
+
+from loguru import logger
+
+from src.core.utils.exceptions import CircuitOpenError, DeadlineExceededError
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Fails calls fast while the upstream is degraded.
+    Opens when, over the last window_size calls, the failure rate or the rate of
+    calls slower than slow_call_seconds reaches its threshold. After open_seconds
+    it lets half_open_max_calls probe calls through; the circuit closes if they all
+    succeed and opens again on the first failure. Calls that end with an error
+    is_failure rejects say nothing about the upstream and are not recorded; a call
+    cut off by the request deadline is recorded only when it was already slow.
+    """
+
+    def __init__(
+        self,
+        window_size: int = 20,
+        min_calls: int = 10,
+        failure_rate_threshold: float = 0.5,
+        slow_call_seconds: float = 30,
+        slow_call_rate_threshold: float = 0.8,
+        open_seconds: float = 30,
+        half_open_max_calls: int = 1,
+        is_failure: Callable[[BaseException], bool] = lambda _: True,
+    ):
+        self.window_size = window_size
+        self.min_calls = min_calls
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.open_seconds = open_seconds
+        self.half_open_max_calls = half_open_max_calls
+        self.is_failure = is_failure
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._outcomes: Deque[Tuple[bool, bool]] = deque(maxlen=window_size)
+        self._half_open_in_flight = 0
+        self._half_open_successes = 0
+        self.rejected = 0
+        self.times_opened = 0
+
+    @property
+    def state(self) -> CircuitState:
+        if (
+            self._state == CircuitState.OPEN
+            and time.monotonic() - self._opened_at >= self.open_seconds
+        ):
+            self._transition(CircuitState.HALF_OPEN)
+        return self._state
+
+    def retry_after(self) -> float:
+        """Seconds until calls are let through again; 0 while calls are allowed."""
+        state = self.state
+        if state == CircuitState.OPEN:
+            return max(self.open_seconds - (time.monotonic() - self._opened_at), 0)
+        if (
+            state == CircuitState.HALF_OPEN
+            and self._half_open_in_flight >= self.half_open_max_calls
+        ):
+            return self.open_seconds
+        return 0
+
+    def before_call(self) -> None:
+        retry_after = self.retry_after()
+        if retry_after > 0:
+            self.rejected += 1
+            raise CircuitOpenError(retry_after)
+        if self._state == CircuitState.HALF_OPEN:
+            self._half_open_in_flight += 1
+
+    def record_success(self, latency_seconds: float) -> None:
+        self._record(failed=False, slow=latency_seconds >= self.slow_call_seconds)
+
+    def record_failure(self) -> None:
+        self._record(failed=True, slow=False)
+
+    def release(self) -> None:
+        """Frees a half-open probe slot for a call that ended without an outcome."""
+        if self._state == CircuitState.HALF_OPEN and self._half_open_in_flight > 0:
+            self._half_open_in_flight -= 1
+
+    @contextmanager
+    def guard(self) -> Iterator[None]:
+        self.before_call()
+        started = time.monotonic()
+        try:
+            yield
+        except Exception as e:
+            latency_seconds = time.monotonic() - started
+            if self.is_failure(e):
+                self.record_failure()
+            elif (
+                isinstance(e, DeadlineExceededError)
+                and latency_seconds >= self.slow_call_seconds
+            ):
+                self._record(failed=False, slow=True)
+            else:
+                self.release()
+            raise
+        except BaseException:
+            self.release()
+            raise
+        self.record_success(time.monotonic() - started)
+
+    def _record(self, failed: bool, slow: bool) -> None:
+        if self._state == CircuitState.HALF_OPEN:
+            self._half_open_in_flight = max(self._half_open_in_flight - 1, 0)
+            if failed or slow:
+                self._transition(CircuitState.OPEN)
+                return
+            self._half_open_successes += 1
+            if self._half_open_successes >= self.half_open_max_calls:
+                self._transition(CircuitState.CLOSED)
+            return
+        if self._state == CircuitState.OPEN:
+            return
+
+        self._outcomes.append((failed, slow))
+        if len(self._outcomes) < self.min_calls:
+            return
+        failure_rate = sum(failed for failed, _ in self._outcomes) / len(self._outcomes)
+        slow_rate = sum(slow for _, slow in self._outcomes) / len(self._outcomes)
+        if (
+            failure_rate >= self.failure_rate_threshold
+            or slow_rate >= self.slow_call_rate_threshold
+        ):
+            self._transition(CircuitState.OPEN)
+
+    def _transition(self, state: CircuitState) -> None:
+        logger.warning(f"Circuit breaker {self._state.value} -> {state.value}.")
+        self._state = state
+        self._half_open_in_flight = 0
+        self._half_open_successes = 0
+        if state == CircuitState.OPEN:
+            self._opened_at = time.monotonic()
+            self.times_opened += 1
+        elif state == CircuitState.CLOSED:
+            self._outcomes.clear()
+
+    @property
+    def stats(self) -> Dict[str, Union[str, int]]:
+        return {
+            "state": self.state.value,
+            "rejected": self.rejected,
+            "times_opened": self.times_opened,
+        }
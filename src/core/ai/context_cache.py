@@ -0,0 +1,215 @@
+import asyncio
+import hashlib
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import nullcontext
+from typing import Dict, Optional, Tuple
+from uuid import uuid4
+
+from google import genai
+from google.genai.types import Content, CreateCachedContentConfig, Part
+from loguru import logger
+from pydantic import BaseModel
+
+from src.core.ai.circuit_breaker import CircuitBreaker
+from src.core.ai.deadline import remaining_time
+from src.core.ai.helpers import estimate_token_count
+from src.core.ai.single_flight import SingleFlight
+from src.core.utils.exceptions import CircuitOpenError
+
+
+class ContextCacheBackend(ABC):
+    @abstractmethod
+    async def create(
+        self, model: str, system_instruction: str, content: str, ttl_seconds: int
+    ) -> str:
+        """Creates cached content and returns its name."""
+
+    @abstractmethod
+    async def delete(self, name: str) -> None:
+        """Deletes cached content by name."""
+
+
+class GeminiContextCacheBackend(ContextCacheBackend):
+    def __init__(self, client: genai.Client):
+        self.client = client
+
+    async def create(
+        self, model: str, system_instruction: str, content: str, ttl_seconds: int
+    ) -> str:
+        cached_content = await self.client.aio.caches.create(
+            model=model,
+            config=CreateCachedContentConfig(
+                system_instruction=system_instruction,
+                contents=[Content(role="user", parts=[Part(text=content)])],
+                ttl=f"{ttl_seconds}s",
+            ),
+        )
+        if not cached_content.name:
+            raise ValueError("Cached content was created without a name.")
+        return cached_content.name
+
+    async def delete(self, name: str) -> None:
+        await self.client.aio.caches.delete(name=name)
+
+
+class LocalContextCacheBackend(ContextCacheBackend):
+    """
+    In-process stand-in for offline tests and the fake client.
+    The names it returns are not valid for the real Gemini API.
+    """
+
+    def __init__(self):
+        self.contents: Dict[str, Tuple[str, str, str]] = {}
+
+    async def create(
+        self, model: str, system_instruction: str, content: str, ttl_seconds: int
+    ) -> str:
+        name = f"cachedContents/local-{uuid4().hex}"
+        self.contents[name] = (model, system_instruction, content)
+        return name
+
+    async def delete(self, name: str) -> None:
+        self.contents.pop(name, None)
+
+
+class ContextCacheEntry(BaseModel):
+    name: str
+    expires_at: float
+
+
+class ContextCacheManager:
+    """
+    Keeps one explicit cached content per (model, system prompt, CV) and reuses it
+    until shortly before it expires. Least recently used entries beyond max_entries
+    are deleted upstream. Contents below min_tokens are not cached, because the API
+    rejects them. A failed creation is not retried for failure_ttl_seconds, so a
+    content the API keeps rejecting does not cost an extra call on every request.
+    Creation waits at most create_timeout_seconds, clipped to the request deadline,
+    and goes through circuit_breaker when one is given.
+    """
+
+    def __init__(
+        self,
+        backend: ContextCacheBackend,
+        ttl_seconds: int = 3600,
+        max_entries: int = 100,
+        min_tokens: int = 4096,
+        refresh_margin_seconds: int = 60,
+        failure_ttl_seconds: int = 60,
+        create_timeout_seconds: float = 10,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+    ):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.min_tokens = min_tokens
+        self.refresh_margin_seconds = refresh_margin_seconds
+        self.failure_ttl_seconds = failure_ttl_seconds
+        self.create_timeout_seconds = create_timeout_seconds
+        self.circuit_breaker = circuit_breaker
+        self._entries: OrderedDict[str, ContextCacheEntry] = OrderedDict()
+        # Key -> time until which creating it is not retried.
+        self._failures: OrderedDict[str, float] = OrderedDict()
+        self._single_flight = SingleFlight()
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.skipped = 0
+
+    @staticmethod
+    def make_key(model: str, system_instruction: str, content: str) -> str:
+        digest = hashlib.sha256()
+        for part in (model, system_instruction, content):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    async def get_or_create(
+        self, model: str, system_instruction: str, content: str
+    ) -> Optional[str]:
+        if estimate_token_count(system_instruction + content) < self.min_tokens:
+            self.skipped += 1
+            return None
+
+        key = self.make_key(model, system_instruction, content)
+        entry = self._entries.get(key)
+        if entry and entry.expires_at - self.refresh_margin_seconds > time.time():
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.name
+
+        failed_until = self._failures.get(key)
+        if failed_until is not None:
+            if failed_until > time.time():
+                self.skipped += 1
+                return None
+            del self._failures[key]
+
+        timeout = self.create_timeout_seconds
+        remaining = remaining_time()
+        if remaining is not None:
+            if remaining <= 0:
+                self.skipped += 1
+                return None
+            timeout = min(timeout, remaining)
+
+        try:
+            async with asyncio.timeout(timeout):
+                return await self._single_flight.do(
+                    key, lambda: self._create(key, model, system_instruction, content)
+                )
+        except (TimeoutError, CircuitOpenError) as e:
+            # Says nothing about the content, so creating it is retried next time.
+            logger.warning(f"Skipping context cache, sending full prompt: {e!r}")
+            self.errors += 1
+            return None
+        except Exception as e:
+            logger.warning(f"Could not create context cache, sending full prompt: {e}")
+            self.errors += 1
+            self._failures[key] = time.time() + self.failure_ttl_seconds
+            self._failures.move_to_end(key)
+            while len(self._failures) > self.max_entries:
+                self._failures.popitem(last=False)
+            return None
+
+    def invalidate(self, model: str, system_instruction: str, content: str) -> None:
+        key = self.make_key(model, system_instruction, content)
+        self._entries.pop(key, None)
+        self._failures.pop(key, None)
+
+    async def _create(
+        self, key: str, model: str, system_instruction: str, content: str
+    ) -> str:
+        with self.circuit_breaker.guard() if self.circuit_breaker else nullcontext():
+            name = await self.backend.create(
+                model, system_instruction, content, self.ttl_seconds
+            )
+        logger.info(f"Created context cache {name}.")
+        self.misses += 1
+        self._entries[key] = ContextCacheEntry(
+            name=name, expires_at=time.time() + self.ttl_seconds
+        )
+        self._entries.move_to_end(key)
+        await self._evict()
+        return name
+
+    async def _evict(self) -> None:
+        while len(self._entries) > self.max_entries:
+            _, entry = self._entries.popitem(last=False)
+            try:
+                await self.backend.delete(entry.name)
+                logger.info(f"Evicted context cache {entry.name}.")
+            except Exception as e:
+                logger.warning(f"Could not delete context cache {entry.name}: {e}")
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "skipped": self.skipped,
+            "entries": len(self._entries),
+        }
@@ -0,0 +1,61 @@
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+from tenacity import RetryCallState
+from tenacity.stop import stop_base
+
+from src.core.utils.exceptions import DeadlineExceededError
+
+_deadline: ContextVar[Optional[float]] = ContextVar("deadline", default=None)
+
+
+def set_deadline(timeout_seconds: Optional[float]) -> None:
+    """
+    Sets the deadline of the current request, timeout_seconds from now.
+    The deadline is inherited by tasks started afterwards from the same context.
+    """
+    _deadline.set(
+        time.monotonic() + timeout_seconds if timeout_seconds is not None else None
+    )
+
+
+def remaining_time() -> Optional[float]:
+    """Seconds left until the current deadline, or None if there is no deadline."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def attempt_timeout(
+    operation_timeout: float, min_attempt_seconds: float = 0.0
+) -> float:
+    """
+    Timeout for a single upstream call: the operation timeout clipped to the time
+    left. Raises DeadlineExceededError if less than min_attempt_seconds remain.
+    """
+    remaining = remaining_time()
+    if remaining is None:
+        return operation_timeout
+    if remaining <= min_attempt_seconds:
+        raise DeadlineExceededError(
+            f"Request deadline leaves {max(remaining, 0):.1f}s, not enough for another call."
+        )
+    return min(operation_timeout, remaining)
+
+
+class stop_before_deadline(stop_base):
+    """
+    Tenacity stop condition: stop retrying when the time left after the upcoming
+    wait would be below min_attempt_seconds.
+    """
+
+    def __init__(self, min_attempt_seconds: float = 0.0):
+        self.min_attempt_seconds = min_attempt_seconds
+
+    def __call__(self, retry_state: RetryCallState) -> bool:
+        remaining = remaining_time()
+        if remaining is None:
+            return False
+        return remaining - retry_state.upcoming_sleep <= self.min_attempt_seconds
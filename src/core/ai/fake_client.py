@@ -0,0 +1,298 @@
+import asyncio
+import inspect
+import random
+import re
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple, Type
+from uuid import uuid4
+
+from google.genai import errors
+from google.genai.types import (
+    CachedContent,
+    Candidate,
+    Content,
+    CreateCachedContentConfig,
+    FinishReason,
+    GenerateContentConfig,
+    GenerateContentResponse,
+    GenerateContentResponseUsageMetadata,
+    Part,
+)
+from loguru import logger
+from pydantic import BaseModel
+
+from src.core.ai.helpers import estimate_token_count
+from src.core.models.revised_cv_fields import (
+    RevisedCVResponseSchema,
+    RevisedCVSection,
+    RevisedCVSectionsResponseSchema,
+)
+
+
+class FakeGeminiConfig(BaseModel):
+    latency_median_ms: float = 800
+    latency_sigma: float = 0.5
+    stream_chunk_chars: int = 40
+    server_error_rate: float = 0.0
+    rate_limit_error_rate: float = 0.0
+    seed: Optional[int] = None
+
+
+FAKE_HIGHLIGHT = "Delivered measurable results aligned with the job requirements."
+FAKE_SUMMARY = (
+    "Results-driven professional whose experience closely matches the requirements "
+    "of the role, with a focus on measurable impact."
+)
+FAKE_CV_SECTION = (
+    "**Delivered** measurable results aligned with the *job requirements*."
+)
+FAKE_COVER_LETTER = (
+    "Dear Hiring Manager,\n\n"
+    "I am excited to apply for this role. My experience maps directly to the "
+    "responsibilities you describe, and I have repeatedly delivered measurable "
+    "results in similar environments.\n\n"
+    "I would welcome the opportunity to discuss how I can contribute to your team.\n\n"
+    "Best regards"
+)
+
+_SECTION_HEADER = re.compile(r"^## (.+)$", re.MULTILINE)
+_ITEM_ID = re.compile(r"^ID: (\S+)$", re.MULTILINE)
+_PIECE_HEADER = re.compile(r"^### Piece (\d+)$", re.MULTILINE)
+_CV_SECTION_PROMPT = re.compile(r"^Isolated piece of text from a CV:$", re.MULTILINE)
+
+
+def _ids_by_section(text: str) -> Dict[str, List[str]]:
+    """Collects item IDs from a CV rendered in the LLM format, grouped by section."""
+    ids: Dict[str, List[str]] = {}
+    headers = list(_SECTION_HEADER.finditer(text))
+    for header, next_header in zip(headers, headers[1:] + [None]):
+        end = next_header.start() if next_header else len(text)
+        section_ids = _ITEM_ID.findall(text, header.end(), end)
+        if section_ids:
+            ids[header.group(1).strip()] = section_ids
+    return ids
+
+
+def _fake_revised_cv(text: str) -> RevisedCVResponseSchema:
+    ids = _ids_by_section(text)
+    return RevisedCVResponseSchema.model_validate(
+        {
+            "explanations": "Aligned the CV with the key requirements of the job.",
+            "revised_professional_title": "Machine Learning Engineer",
+            "revised_professional_summary": {
+                "summary": FAKE_SUMMARY,
+                "highlights": [FAKE_HIGHLIGHT],
+            },
+            "revised_skills": [
+                {"name": "Python", "level": "Expert", "keywords": ["pandas", "numpy"]}
+            ],
+            "revised_work_experience": [
+                {
+                    "id": item_id,
+                    "revised_summary": FAKE_SUMMARY,
+                    "revised_highlights": [FAKE_HIGHLIGHT],
+                }
+                for item_id in ids.get("Work Experience", [])
+            ],
+            "revised_projects": [
+                {"id": item_id, "revised_summary": FAKE_SUMMARY}
+                for item_id in ids.get("Projects", [])
+            ],
+            "revised_awards": [
+                {"id": item_id, "revised_summary": FAKE_SUMMARY}
+                for item_id in ids.get("Awards", [])
+            ],
+            "revised_publications": [
+                {"id": item_id, "revised_summary": FAKE_SUMMARY}
+                for item_id in ids.get("Publications", [])
+            ],
+            "suggestions": "Quantify the impact of the most recent role.",
+        }
+    )
+
+
+def _fake_revised_sections(text: str) -> RevisedCVSectionsResponseSchema:
+    return RevisedCVSectionsResponseSchema(
+        sections=[
+            RevisedCVSection(index=int(index), revised_text=FAKE_HIGHLIGHT)
+            for index in _PIECE_HEADER.findall(text)
+        ]
+    )
+
+
+FAKE_STRUCTURED_RESPONSES: Dict[Type[BaseModel], Callable[[str], BaseModel]] = {
+    RevisedCVResponseSchema: _fake_revised_cv,
+    RevisedCVSectionsResponseSchema: _fake_revised_sections,
+}
+
+
+class FakeCaches:
+    def __init__(self):
+        self.contents: Dict[str, str] = {}
+
+    async def create(
+        self, *, model: str, config: Optional[CreateCachedContentConfig] = None
+    ) -> CachedContent:
+        name = f"cachedContents/fake-{uuid4().hex}"
+        texts = [
+            part.text or ""
+            for content in (config.contents if config else None) or []
+            if isinstance(content, Content)
+            for part in content.parts or []
+        ]
+        self.contents[name] = "".join(texts)
+        return CachedContent(name=name, model=model)
+
+    async def delete(self, *, name: str, config: Any = None) -> None:
+        self.contents.pop(name, None)
+
+
+class FakeModels:
+    def __init__(self, config: FakeGeminiConfig, caches: FakeCaches):
+        self.config = config
+        self.caches = caches
+        self.random = random.Random(config.seed)
+
+    def _latency_seconds(self) -> float:
+        return (
+            self.random.lognormvariate(0, self.config.latency_sigma)
+            * self.config.latency_median_ms
+            / 1000
+        )
+
+    def _maybe_raise(self) -> None:
+        roll = self.random.random()
+        if roll < self.config.server_error_rate:
+            raise errors.ServerError(
+                503, {"error": {"message": "Fake overload.", "status": "UNAVAILABLE"}}
+            )
+        if roll < self.config.server_error_rate + self.config.rate_limit_error_rate:
+            raise errors.ClientError(
+                429,
+                {"error": {"message": "Fake quota.", "status": "RESOURCE_EXHAUSTED"}},
+            )
+
+    def _prompt_text(
+        self, contents: Any, config: Optional[GenerateContentConfig]
+    ) -> str:
+        prompt = contents if isinstance(contents, str) else str(contents)
+        if config and config.cached_content:
+            prompt = self.caches.contents.get(config.cached_content, "") + prompt
+        return prompt
+
+    def _build_output(
+        self, prompt: str, config: Optional[GenerateContentConfig]
+    ) -> Tuple[str, Optional[BaseModel]]:
+        schema = (
+            getattr(config, "output_model", None) or config.response_schema
+            if config
+            else None
+        )
+        if inspect.isclass(schema) and issubclass(schema, BaseModel):
+            builder = FAKE_STRUCTURED_RESPONSES.get(schema)
+            if builder is None:
+                raise ValueError(f"No fake response registered for {schema.__name__}")
+            parsed = builder(prompt)
+            return parsed.model_dump_json(exclude_none=True), parsed
+        if _CV_SECTION_PROMPT.search(prompt):
+            return FAKE_CV_SECTION, None
+        return FAKE_COVER_LETTER, None
+
+    def _usage(
+        self, prompt: str, config: Optional[GenerateContentConfig], output: str
+    ) -> GenerateContentResponseUsageMetadata:
+        system_instruction = str(config.system_instruction or "") if config else ""
+        prompt_tokens = estimate_token_count(prompt + system_instruction)
+        output_tokens = estimate_token_count(output)
+        return GenerateContentResponseUsageMetadata(
+            prompt_token_count=prompt_tokens,
+            candidates_token_count=output_tokens,
+            total_token_count=prompt_tokens + output_tokens,
+        )
+
+    @staticmethod
+    def _response(
+        text: str,
+        finish_reason: Optional[FinishReason] = None,
+        usage_metadata: Optional[GenerateContentResponseUsageMetadata] = None,
+        parsed: Optional[BaseModel] = None,
+    ) -> GenerateContentResponse:
+        return GenerateContentResponse(
+            candidates=[
+                Candidate(
+                    content=Content(role="model", parts=[Part(text=text)]),
+                    finish_reason=finish_reason,
+                )
+            ],
+            usage_metadata=usage_metadata,
+            parsed=parsed,
+        )
+
+    async def generate_content(
+        self,
+        *,
+        model: str,
+        contents: Any,
+        config: Optional[GenerateContentConfig] = None,
+    ) -> GenerateContentResponse:
+        await asyncio.sleep(self._latency_seconds())
+        self._maybe_raise()
+        prompt = self._prompt_text(contents, config)
+        output, parsed = self._build_output(prompt, config)
+        logger.debug(f"Fake Gemini generated {len(output)} chars for {model}.")
+        return self._response(
+            output,
+            finish_reason=FinishReason.STOP,
+            usage_metadata=self._usage(prompt, config, output),
+            parsed=parsed,
+        )
+
+    async def generate_content_stream(
+        self,
+        *,
+        model: str,
+        contents: Any,
+        config: Optional[GenerateContentConfig] = None,
+    ) -> AsyncIterator[GenerateContentResponse]:
+        prompt = self._prompt_text(contents, config)
+        output, _ = self._build_output(prompt, config)
+        chunk_chars = self.config.stream_chunk_chars
+        chunks = [
+            output[i : i + chunk_chars] for i in range(0, len(output), chunk_chars)
+        ]
+        time_to_first_chunk = self._latency_seconds() / 4
+        per_chunk_delay = (self._latency_seconds() - time_to_first_chunk) / max(
+            len(chunks), 1
+        )
+
+        async def _stream() -> AsyncIterator[GenerateContentResponse]:
+            await asyncio.sleep(time_to_first_chunk)
+            self._maybe_raise()
+            for index, chunk in enumerate(chunks):
+                is_last = index == len(chunks) - 1
+                yield self._response(
+                    chunk,
+                    finish_reason=FinishReason.STOP if is_last else None,
+                    usage_metadata=(
+                        self._usage(prompt, config, output) if is_last else None
+                    ),
+                )
+                await asyncio.sleep(per_chunk_delay)
+
+        return _stream()
+
+
+class FakeAsyncClient:
+    def __init__(self, config: FakeGeminiConfig):
+        self.caches = FakeCaches()
+        self.models = FakeModels(config, self.caches)
+
+
+class FakeGeminiClient:
+    """
+    Offline stand-in for genai.Client covering the calls the services make.
+    Returns schema-valid structured output and text with simulated latency,
+    errors and token usage, for load tests and benchmarks.
+    """
+
+    def __init__(self, config: Optional[FakeGeminiConfig] = None):
+        self.aio = FakeAsyncClient(config or FakeGeminiConfig())
@@ -0,0 +1,254 @@
+import inspect
+import json
+import threading
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Mapping,
+    Optional,
+    Self,
+    Tuple,
+    Type,
+    TypeGuard,
+)
+
+from google.genai.types import (
+    GenerateContentConfig,
+    GenerateContentResponse,
+    Schema,
+)
+from loguru import logger
+from pydantic import BaseModel, Field, PrivateAttr, ValidationError
+
+
+@lru_cache(maxsize=64)
+def _model_schema_fingerprint(schema: Type[BaseModel]) -> str:
+    return json.dumps(schema.model_json_schema(), sort_keys=True)
+
+
+def _gemini_schema(schema: Dict[str, Any], defs: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    A pydantic JSON schema node rewritten as the SDK does for the Gemini API:
+    references inlined, null types turned into nullable and property order kept.
+    """
+    schema = dict(schema)
+    if schema.get("type") == "null":
+        schema["nullable"] = True
+        del schema["type"]
+    elif "anyOf" in schema:
+        non_null = [item for item in schema["anyOf"] if item.get("type") != "null"]
+        if len(non_null) < len(schema["anyOf"]):
+            schema["nullable"] = True
+            schema["anyOf"] = non_null
+            if len(non_null) == 1:
+                del schema["anyOf"]
+                schema.update(non_null[0])
+
+    ref = schema.pop("$ref", None)
+    if ref is not None:
+        # As in the SDK, the referenced definition wins over the node's own keys.
+        schema.update(defs[ref.split("/")[-1]])
+
+    def convert(sub_schema: Dict[str, Any]) -> Dict[str, Any]:
+        ref = sub_schema.get("$ref")
+        if ref is not None:
+            sub_schema = defs[ref.split("/")[-1]]
+        return _gemini_schema(sub_schema, defs)
+
+    if "anyOf" in schema:
+        schema["anyOf"] = [convert(item) for item in schema["anyOf"]]
+        return schema
+
+    if "const" in schema:
+        if schema.get("type") != "string":
+            raise ValueError("Literal values must be strings.")
+        schema["enum"] = [schema.pop("const")]
+
+    if schema.get("type") == "object":
+        properties = schema.get("properties")
+        if properties is not None:
+            schema["properties"] = {
+                name: convert(sub_schema) for name, sub_schema in properties.items()
+            }
+            if len(properties) > 1 and "propertyOrdering" not in schema:
+                schema["property_ordering"] = list(properties)
+        if isinstance(schema.get("additionalProperties"), dict):
+            schema["additionalProperties"] = convert(schema["additionalProperties"])
+    elif schema.get("type") == "array":
+        if "items" in schema:
+            schema["items"] = convert(schema["items"])
+        if "prefixItems" in schema:
+            schema["prefixItems"] = [convert(item) for item in schema["prefixItems"]]
+    return schema
+
+
+@lru_cache(maxsize=64)
+def convert_response_schema(output_model: Type[BaseModel]) -> Schema:
+    """The Gemini schema the SDK would derive from output_model on every call."""
+    json_schema = output_model.model_json_schema()
+    defs = json_schema.pop("$defs", {})
+    return Schema.model_validate(_gemini_schema(json_schema, defs))
+
+
+def _is_model_class(value: Any) -> TypeGuard[Type[BaseModel]]:
+    return inspect.isclass(value) and issubclass(value, BaseModel)
+
+
+def config_fingerprint(config: GenerateContentConfig) -> str:
+    """
+    Canonical string for a generation config, including the system prompt and
+    the response schema. Structured configs compute it once.
+    """
+    if isinstance(config, StructuredGenerateContentConfig):
+        return config.fingerprint
+    return _compute_fingerprint(config, None)
+
+
+def _compute_fingerprint(
+    config: GenerateContentConfig, output_model: Optional[Type[BaseModel]]
+) -> str:
+    response_schema = output_model or config.response_schema
+    if _is_model_class(response_schema):
+        schema_repr = _model_schema_fingerprint(response_schema)
+    else:
+        schema_repr = repr(response_schema)
+    return json.dumps(
+        {
+            "config": config.model_dump(
+                mode="json", exclude_none=True, exclude={"response_schema"}
+            ),
+            "response_schema": schema_repr,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+
+
+class StructuredGenerateContentConfig(GenerateContentConfig):
+    """
+    GenerateContentConfig whose response schema is already converted to a Gemini
+    Schema, with the pydantic model kept in output_model to parse responses.
+    Instances handed out by GenerationConfigRegistry are shared between requests
+    and read-only; model_copy returns a private, mutable copy.
+    """
+
+    output_model: Optional[Type[BaseModel]] = Field(default=None, exclude=True)
+    _read_only: bool = PrivateAttr(default=False)
+    _fingerprint: Optional[str] = PrivateAttr(default=None)
+
+    @classmethod
+    def from_config(
+        cls, config: GenerateContentConfig
+    ) -> "StructuredGenerateContentConfig":
+        fields = {
+            name: getattr(config, name)
+            for name in config.model_fields_set
+            if name in GenerateContentConfig.model_fields
+        }
+        output_model = getattr(config, "output_model", None)
+        response_schema = config.response_schema
+        if _is_model_class(response_schema):
+            output_model = response_schema
+            fields["response_schema"] = convert_response_schema(response_schema)
+        structured = cls(**fields, output_model=output_model)
+        structured._read_only = True
+        structured._fingerprint = _compute_fingerprint(structured, output_model)
+        return structured
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if not name.startswith("_") and getattr(self, "_read_only", False):
+            raise TypeError(
+                f"Shared generation configs are read-only, use model_copy(update={{'{name}': ...}})."
+            )
+        super().__setattr__(name, value)
+
+    def model_copy(
+        self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False
+    ) -> Self:
+        copy = super().model_copy(update=update, deep=deep)
+        copy._read_only = False
+        copy._fingerprint = None
+        return copy
+
+    @property
+    def fingerprint(self) -> str:
+        if self._fingerprint is None:
+            return _compute_fingerprint(self, self.output_model)
+        return self._fingerprint
+
+
+def parse_structured_response(
+    response: GenerateContentResponse, output_model: Type[BaseModel]
+) -> Optional[BaseModel]:
+    """
+    Parses the response text into output_model, as the SDK does when it is given
+    the pydantic model itself. Returns None when the text is missing or invalid.
+    """
+    if isinstance(response.parsed, output_model):
+        return response.parsed
+    text = response.text
+    if not text:
+        return None
+    try:
+        return output_model.model_validate_json(text)
+    except (ValidationError, ValueError):
+        return None
+
+
+class GenerationConfigRegistry:
+    """
+    Builds each named generation config once and hands out the same read-only
+    StructuredGenerateContentConfig on every call, so pydantic response schemas
+    are converted to Gemini schemas once instead of on every request.
+    Builders taking arguments are memoized per argument tuple. Call rebuild()
+    after changing prompts or limits the builders read.
+    """
+
+    def __init__(self) -> None:
+        self._builders: Dict[str, Callable[..., GenerateContentConfig]] = {}
+        self._configs: Dict[
+            Tuple[str, Tuple[Hashable, ...]], StructuredGenerateContentConfig
+        ] = {}
+        self._lock = threading.Lock()
+
+    def register(
+        self,
+        name: str,
+        build: Callable[..., GenerateContentConfig],
+        eager: bool = True,
+    ) -> None:
+        """eager builds the argument-less config right away, i.e. at startup."""
+        with self._lock:
+            self._builders[name] = build
+            for key in [key for key in self._configs if key[0] == name]:
+                del self._configs[key]
+        if eager:
+            self.get(name)
+        logger.info(f"Generation config registered: {name}")
+
+    def get(self, name: str, *args: Hashable) -> StructuredGenerateContentConfig:
+        key = (name, args)
+        config = self._configs.get(key)
+        if config is not None:
+            return config
+
+        build = self._builders.get(name)
+        if build is None:
+            raise KeyError(f"No generation config registered as {name!r}")
+        config = StructuredGenerateContentConfig.from_config(build(*args))
+        with self._lock:
+            return self._configs.setdefault(key, config)
+
+    def rebuild(self) -> None:
+        """Drops every built config; argument-less ones are built again right away."""
+        with self._lock:
+            rebuilt_names = {name for name, args in self._configs if not args}
+            self._configs.clear()
+        for name in rebuilt_names:
+            self.get(name)
+
+    def __len__(self) -> int:
+        return len(self._configs)
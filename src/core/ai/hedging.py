@@ -0,0 +1,131 @@
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, TypeVar
+
+from loguru import logger
+
+T = TypeVar("T")
+
+
+class LatencyTracker:
+    """Rolling window of successful call latencies for a single operation."""
+
+    def __init__(self, window_size: int = 200):
+        self._samples: Deque[float] = deque(maxlen=window_size)
+
+    def record(self, latency_seconds: float) -> None:
+        self._samples.append(latency_seconds)
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        index = max(math.ceil(percentile / 100 * len(ordered)) - 1, 0)
+        return ordered[index]
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+
+class RequestHedger:
+    """
+    Issues a second identical call when the first has not finished within the
+    rolling latency percentile of its operation. The first successful call wins and
+    the other one is cancelled. Hedges are capped at budget_ratio of all calls and
+    are not sent until min_samples latencies have been observed. Latency is measured
+    from the start of the first call to the first success, so a hedge win does not
+    hide how long the call it replaced had already taken.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95,
+        budget_ratio: float = 0.05,
+        min_samples: int = 20,
+        min_delay_seconds: float = 0.0,
+        window_size: int = 200,
+    ):
+        self.percentile = percentile
+        self.budget_ratio = budget_ratio
+        self.min_samples = min_samples
+        self.min_delay_seconds = min_delay_seconds
+        self.window_size = window_size
+        self._trackers: Dict[str, LatencyTracker] = {}
+        self.calls = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+
+    def _tracker(self, operation_name: str) -> LatencyTracker:
+        tracker = self._trackers.get(operation_name)
+        if tracker is None:
+            tracker = LatencyTracker(self.window_size)
+            self._trackers[operation_name] = tracker
+        return tracker
+
+    def hedge_delay(self, operation_name: str) -> Optional[float]:
+        tracker = self._tracker(operation_name)
+        if len(tracker) < self.min_samples:
+            return None
+        threshold = tracker.percentile(self.percentile)
+        if threshold is None:
+            return None
+        return max(threshold, self.min_delay_seconds)
+
+    def _has_budget(self) -> bool:
+        return self.hedged + 1 <= self.budget_ratio * self.calls
+
+    async def run(self, operation_name: str, func: Callable[[], Awaitable[T]]) -> T:
+        self.calls += 1
+        tracker = self._tracker(operation_name)
+        delay = self.hedge_delay(operation_name)
+        started = time.perf_counter()
+
+        if delay is None:
+            result = await func()
+            tracker.record(time.perf_counter() - started)
+            return result
+
+        primary = asyncio.ensure_future(func())
+        tasks = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done and self._has_budget():
+                self.hedged += 1
+                logger.debug(
+                    f"No response for {operation_name} after {delay:.2f}s, hedging."
+                )
+                tasks.add(asyncio.ensure_future(func()))
+
+            pending = tasks
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        tracker.record(time.perf_counter() - started)
+                        if task is not primary:
+                            self.hedge_wins += 1
+                        return task.result()
+                    error = task.exception()
+            assert error is not None
+            raise error
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "thresholds": {
+                operation_name: self.hedge_delay(operation_name)
+                for operation_name in self._trackers
+            },
+        }
@@ -1,7 +1,7 @@
 import re
 from typing import Any, Dict, Optional
 
-from google.genai.types import GenerateContentResponse
+from google.genai.types import FinishReason, GenerateContentResponse
 from loguru import logger
 
 
@@ -21,33 +21,132 @@ def get_token_usage_metadata(
     return metadata
 
 
+def is_response_truncated(response: GenerateContentResponse) -> bool:
+    """True when generation stopped because it hit max_output_tokens."""
+    return bool(
+        response.candidates
+        and response.candidates[0].finish_reason == FinishReason.MAX_TOKENS
+    )
+
+
+CHARS_PER_TOKEN = 4
+
+
+def estimate_token_count(text: str) -> int:
+    """Rough token estimate used before the real count is known."""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
 def format_prompt(prompt: str, **inputs: Any) -> str:
     return prompt.format(**inputs)
 
 
+# Inline markup, replaced by its (recursively stripped) text. Images are dropped
+# entirely, and are matched before links so "[alt](url)" is never read as a link.
+# Every branch starts with a literal, which lets the regex engine skip plain text.
+_INLINE_MARKUP = re.compile(
+    r"!\[.*?\]\(.*?\)"
+    r"|\[(.*?)\]\(.*?\)"
+    r"|\*\*\*(.*?)\*\*\*"
+    r"|___(.*?)___"
+    r"|\*\*(.*?)\*\*"
+    r"|__(.*?)__"
+    r"|\*(.*?)\*"
+    r"|_(.*?)_"
+)
+_LIST_MARKER_PATTERN = r"(?:[-+][^\S\n]*|\*(?:[^\S\n]+|$))"
+_NUMBER_MARKER_PATTERN = r"\d+\.[^\S\n]*"
+# Line-level markup: headings and horizontal rules drop the line, blockquote and
+# list markers are stripped. A "*" only counts as a list marker when followed by
+# whitespace, so "*text* ..." at the start of a line is left to _INLINE_MARKUP.
+_LINE_MARKUP = re.compile(
+    r"^(?:\#.*"
+    r"|[^\S\n]*[-*_]{3,}[^\S\n]*$"
+    r"|[^\S\n]*"
+    rf"(?:>[^\S\n]*{_LIST_MARKER_PATTERN}?(?:{_NUMBER_MARKER_PATTERN})?"
+    rf"|{_LIST_MARKER_PATTERN}(?:{_NUMBER_MARKER_PATTERN})?"
+    rf"|{_NUMBER_MARKER_PATTERN}))",
+    re.MULTILINE,
+)
+_SPACE_BEFORE_PUNCTUATION = re.compile(r" (?=[.,!?;:])")
+_WHITESPACE_BEFORE_PUNCTUATION = re.compile(r"\s+(?=[.,!?;:])")
+
+
+def _replace_inline_markup(match: re.Match) -> str:
+    if match.lastindex is None:
+        return ""
+    return _INLINE_MARKUP.sub(_replace_inline_markup, match.group(match.lastindex))
+
+
 def postprocess_text_response(text_response: str) -> str:
-    #  Remove Markdown headings '# Heading'
-    text_response = re.sub(r"^[#]+\s*.*$", "", text_response, flags=re.MULTILINE)
-    #  Remove **bold** and *italic* Markdown
-    text_response = re.sub(r"(\*\*|__)(.*?)\1", r"\2", text_response)  # For bold
-    text_response = re.sub(r"(\*|_)(.*?)\1", r"\2", text_response)  # For italic
-    #  Remove blockquotes '>'
-    text_response = re.sub(r"^\s*>\s*", "", text_response, flags=re.MULTILINE)
-    #  Remove lists '-' item, '*' item, '1.' item
-    text_response = re.sub(r"^\s*[-*+]\s*", "", text_response, flags=re.MULTILINE)
-    text_response = re.sub(r"^\s*\d+\.\s*", "", text_response, flags=re.MULTILINE)
-    #  Remove horizontal rules (e.g., ---, ***, ___)
-    text_response = re.sub(r"^\s*[-*_]{3,}\s*$", "", text_response, flags=re.MULTILINE)
-    #  Remove links (e.g., [text](url)) - keep only the text
-    text_response = re.sub(r"\[(.*?)\]\(.*?\)", r"\1", text_response)
-    #  Remove images (e.g., ![alt text](url)) - remove entirely
-    text_response = re.sub(r"!\[.*?\]\(.*?\)", "", text_response)
-    #  Remove extra spaces around punctuation that might be left from Markdown removal
-    text_response = re.sub(r"\s+([.,!?;:])", r"\1", text_response)
-    text_response = text_response.replace("\\n", " ")
-    text_response = text_response.replace("\\t", " ")
-    text_response = text_response.replace("\n", " ")
-    text_response = text_response.replace("\t", " ")
-    text_response = text_response.replace("\r", " ")
-    text_response = re.sub(r"\s+", " ", text_response).strip()
-    return text_response
+    """
+    Strips Markdown from an LLM text response and collapses it to a single line.
+    Line markup and inline markup are each removed in one scan with a precompiled
+    pattern, then whitespace is collapsed and dropped before punctuation.
+    """
+    text_response = _LINE_MARKUP.sub("", text_response)
+    text_response = _INLINE_MARKUP.sub(_replace_inline_markup, text_response)
+    if "\\" in text_response:
+        # Literal "\n" / "\t" escapes become spaces, but unlike real whitespace
+        # they do not get removed before punctuation.
+        text_response = _WHITESPACE_BEFORE_PUNCTUATION.sub("", text_response)
+        text_response = text_response.replace("\\n", " ").replace("\\t", " ")
+        return " ".join(text_response.split())
+    return _SPACE_BEFORE_PUNCTUATION.sub("", " ".join(text_response.split()))
+
+
+class IncrementalTextPostprocessor:
+    """
+    Applies postprocess_text_response to a stream of text chunks.
+    Complete lines are processed as they arrive; the open line is re-processed up to
+    its last whitespace and only the new part is emitted, unless it still contains
+    markup that may be closed by a later chunk.
+    """
+
+    _PENDING_MARKUP = ("*", "_", "[")
+    _LEADING_PUNCTUATION = ".,!?;:"
+
+    def __init__(self):
+        self._line = ""
+        self._line_emitted = 0
+        self._needs_separator = False
+
+    def feed(self, chunk: str) -> str:
+        self._line += chunk
+        *complete_lines, self._line = self._line.split("\n")
+        output = "".join(self._finish_line(line) for line in complete_lines)
+        return output + self._emit_open_line()
+
+    def flush(self) -> str:
+        output = self._finish_line(self._line)
+        self._line = ""
+        return output
+
+    def _finish_line(self, line: str) -> str:
+        output = self._emit(postprocess_text_response(line))
+        if self._line_emitted:
+            self._needs_separator = True
+        self._line_emitted = 0
+        return output
+
+    def _emit_open_line(self) -> str:
+        if self._line.lstrip().startswith("#"):
+            return ""
+        cut = max(self._line.rfind(" "), self._line.rfind("\t"))
+        if cut <= 0:
+            return ""
+        processed = postprocess_text_response(self._line[:cut])
+        if any(marker in processed for marker in self._PENDING_MARKUP):
+            return ""
+        return self._emit(processed)
+
+    def _emit(self, processed_line: str) -> str:
+        new_text = processed_line[self._line_emitted :]
+        if not new_text:
+            return ""
+        if self._line_emitted == 0 and self._needs_separator:
+            if new_text[0] not in self._LEADING_PUNCTUATION:
+                new_text = " " + new_text
+            self._needs_separator = False
+        self._line_emitted = len(processed_line)
+        return new_text
@@ -0,0 +1,119 @@
+import json
+from typing import Any, List, Optional
+
+from pydantic import BaseModel
+
+
+class JSONStreamEvent(BaseModel):
+    key: str
+    value: Any
+    is_array_item: bool = False
+
+
+class IncrementalJSONObjectParser:
+    """
+    Parses a JSON object that arrives in chunks.
+    Reports every top-level field once its value is closed and, for top-level arrays,
+    every element as soon as it closes, without re-scanning already seen text.
+    """
+
+    def __init__(self):
+        self.buffer = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._key_start: Optional[int] = None
+        self._key: Optional[str] = None
+        self._value_start: Optional[int] = None
+        self._value_is_array = False
+        self._item_start: Optional[int] = None
+
+    def feed(self, chunk: str) -> List[JSONStreamEvent]:
+        self.buffer += chunk
+        events: List[JSONStreamEvent] = []
+        buffer = self.buffer
+
+        for i in range(self._pos, len(buffer)):
+            char = buffer[i]
+
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._key_start is not None:
+                        self._key = json.loads(buffer[self._key_start : i + 1])
+                        self._key_start = None
+                continue
+
+            if char.isspace():
+                continue
+
+            if self._depth == 0:
+                if char == "{":
+                    self._depth = 1
+                continue
+
+            if self._depth == 1:
+                if self._key is None:
+                    if char == '"':
+                        self._key_start = i
+                        self._in_string = True
+                    elif char == "}":
+                        self._depth = 0
+                    continue
+                if self._value_start is None:
+                    if char == ":":
+                        continue
+                    self._value_start = i
+                    self._value_is_array = char == "["
+                elif char in ",}":
+                    events.append(self._close_field(i))
+                    if char == "}":
+                        self._depth = 0
+                    continue
+
+            in_array = self._value_is_array and self._depth == 2
+            if in_array and self._item_start is not None and char in ",]":
+                events.append(self._close_item(i))
+            elif in_array and self._item_start is None and char not in ",]":
+                self._item_start = i
+
+            if char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if (
+                    self._value_is_array
+                    and self._depth == 2
+                    and self._item_start is not None
+                ):
+                    events.append(self._close_item(i + 1))
+
+        self._pos = len(buffer)
+        return events
+
+    def _close_field(self, end: int) -> JSONStreamEvent:
+        assert self._key is not None and self._value_start is not None
+        event = JSONStreamEvent(
+            key=self._key, value=json.loads(self.buffer[self._value_start : end])
+        )
+        self._key = None
+        self._value_start = None
+        self._value_is_array = False
+        return event
+
+    def _close_item(self, end: int) -> JSONStreamEvent:
+        assert self._key is not None and self._item_start is not None
+        event = JSONStreamEvent(
+            key=self._key,
+            value=json.loads(self.buffer[self._item_start : end]),
+            is_array_item=True,
+        )
+        self._item_start = None
+        return event
@@ -0,0 +1,60 @@
+import asyncio
+from typing import Dict, Optional
+
+from loguru import logger
+
+from src.core.ai.hedging import LatencyTracker
+
+
+class EventLoopLagMonitor:
+    """
+    Measures how late the event loop wakes up a task sleeping for interval_seconds.
+    The lag is the time the loop was busy running something else, e.g. CPU-bound
+    code that blocks every other in-flight request.
+    """
+
+    def __init__(self, interval_seconds: float = 0.1, window_size: int = 600):
+        self.interval_seconds = interval_seconds
+        self._lags = LatencyTracker(window_size)
+        self._task: Optional[asyncio.Task] = None
+        self.max_lag_seconds = 0.0
+
+    def record(self, lag_seconds: float) -> None:
+        self._lags.record(lag_seconds)
+        self.max_lag_seconds = max(self.max_lag_seconds, lag_seconds)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval_seconds)
+            self.record(max(loop.time() - started - self.interval_seconds, 0.0))
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+            logger.info(
+                f"Event loop lag monitor started ({self.interval_seconds * 1000:.0f} ms interval)."
+            )
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    @property
+    def stats(self) -> Dict[str, Optional[float]]:
+        def _ms(value: Optional[float]) -> Optional[float]:
+            return None if value is None else round(value * 1000, 3)
+
+        return {
+            "samples": len(self._lags),
+            "p50_ms": _ms(self._lags.percentile(50)),
+            "p99_ms": _ms(self._lags.percentile(99)),
+            "max_ms": _ms(self.max_lag_seconds),
+        }
@@ -0,0 +1,76 @@
+from typing import Dict, Literal, Optional, Union
+
+from src.core.ai.hedging import LatencyTracker
+
+
+class ModelStats:
+    def __init__(self, window_size: int = 200):
+        self.latencies = LatencyTracker(window_size)
+        self.calls = 0
+        self.successes = 0
+        self.escalations = 0
+        self.failures = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+
+    def as_dict(self) -> Dict[str, Union[int, float, None]]:
+        p50 = self.latencies.percentile(50)
+        p95 = self.latencies.percentile(95)
+        return {
+            "calls": self.calls,
+            "successes": self.successes,
+            "escalations": self.escalations,
+            "failures": self.failures,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "p50_latency_ms": p50 * 1000 if p50 is not None else None,
+            "p95_latency_ms": p95 * 1000 if p95 is not None else None,
+        }
+
+
+class ModelStatsRecorder:
+    """
+    Per-model outcome, latency and token counters for cascaded calls.
+    An escalation is a response that was received but rejected in favour of the
+    next model in the cascade; a failure is an error from the last model or the API.
+    """
+
+    def __init__(self):
+        self._models: Dict[str, ModelStats] = {}
+
+    def _get(self, model_name: str) -> ModelStats:
+        stats = self._models.get(model_name)
+        if stats is None:
+            stats = ModelStats()
+            self._models[model_name] = stats
+        return stats
+
+    def record_response(
+        self,
+        model_name: str,
+        latency_seconds: float,
+        usage: Dict[str, Optional[int]],
+        outcome: Literal["success", "escalation", "failure"],
+    ) -> None:
+        stats = self._get(model_name)
+        stats.calls += 1
+        stats.latencies.record(latency_seconds)
+        stats.input_tokens += usage.get("input_tokens_count") or 0
+        stats.output_tokens += usage.get("output_tokens_count") or 0
+        if outcome == "success":
+            stats.successes += 1
+        elif outcome == "escalation":
+            stats.escalations += 1
+        else:
+            stats.failures += 1
+
+    def record_error(self, model_name: str) -> None:
+        stats = self._get(model_name)
+        stats.calls += 1
+        stats.failures += 1
+
+    @property
+    def stats(self) -> Dict[str, Dict[str, Union[int, float, None]]]:
+        return {
+            model_name: stats.as_dict() for model_name, stats in self._models.items()
+        }
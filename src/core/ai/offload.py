@@ -0,0 +1,98 @@
+import asyncio
+import contextvars
+import functools
+import multiprocessing
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Literal, Optional, TypeVar, Union
+
+T = TypeVar("T")
+
+ExecutorKind = Literal["inline", "thread"]
+
+
+class CPUExecutor:
+    """
+    Runs CPU-bound request stages (prompt rendering, response post-processing,
+    comparison CV building) off the event loop so they do not stall other
+    in-flight awaits. kind="inline" runs them on the loop, e.g. for comparisons.
+    Stages submitted with heavy=True go to a process pool when process_workers > 0;
+    their function, arguments and result must then be picklable. Pools are
+    created on first use, so shutdown() can be followed by further calls.
+    """
+
+    def __init__(
+        self,
+        kind: ExecutorKind = "thread",
+        max_workers: Optional[int] = None,
+        process_workers: int = 0,
+    ):
+        self.kind = kind
+        self.max_workers = max_workers
+        self.process_workers = process_workers
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.inline_calls = 0
+        self.thread_calls = 0
+        self.process_calls = 0
+
+    @property
+    def uses_process_pool(self) -> bool:
+        """Whether stages submitted with heavy=True run in another process."""
+        return self.process_workers > 0
+
+    def _executor(self, heavy: bool) -> Optional[Executor]:
+        with self._lock:
+            if heavy and self.uses_process_pool:
+                self.process_calls += 1
+                if self._process_pool is None:
+                    self._process_pool = ProcessPoolExecutor(
+                        self.process_workers,
+                        # forkserver: forking the multi-threaded server process is unsafe.
+                        mp_context=multiprocessing.get_context("forkserver"),
+                    )
+                return self._process_pool
+            if self.kind == "inline":
+                self.inline_calls += 1
+                return None
+            self.thread_calls += 1
+            if self._thread_pool is None:
+                self._thread_pool = ThreadPoolExecutor(
+                    self.max_workers, thread_name_prefix="cpu-stage"
+                )
+            return self._thread_pool
+
+    async def run(
+        self, func: Callable[..., T], *args: Any, heavy: bool = False, **kwargs: Any
+    ) -> T:
+        call = functools.partial(func, *args, **kwargs)
+        executor = self._executor(heavy)
+        if executor is None:
+            return call()
+
+        loop = asyncio.get_running_loop()
+        if isinstance(executor, ProcessPoolExecutor):
+            return await loop.run_in_executor(executor, call)
+        # Threads see the caller's context variables, as with asyncio.to_thread.
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(executor, context.run, call)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shuts the pools down; later calls start new ones."""
+        with self._lock:
+            pools = (self._thread_pool, self._process_pool)
+            self._thread_pool = None
+            self._process_pool = None
+        for pool in pools:
+            if pool is not None:
+                pool.shutdown(wait=wait)
+
+    @property
+    def stats(self) -> Dict[str, Union[str, int]]:
+        return {
+            "kind": self.kind,
+            "inline_calls": self.inline_calls,
+            "thread_calls": self.thread_calls,
+            "process_calls": self.process_calls,
+        }
@@ -14,15 +14,29 @@ Analyze the provided job description and the provided CV. Your goal is to refine
 """
 
 
+# The CV comes first, so this is CACHED_CV_PROMPT + JOB_DESC_FOR_CACHED_CV_PROMPT
+# and the context-cached and uncached requests send the same text.
 JOB_DESC_W_CV_PROMPT = """
+## CV
+{cv}
+
 ## Job Description
 {job_description}
+"""
+
 
+CACHED_CV_PROMPT = """
 ## CV
 {cv}
 """
 
 
+JOB_DESC_FOR_CACHED_CV_PROMPT = """
+## Job Description
+{job_description}
+"""
+
+
 REWRITE_CV_SECTION_SYSTEM_PROMPT = """
 You are a professional CV editor specializing in optimizing individual CV sections.
 You will receive an isolated piece of text from a CV along with instructions on how to improve it.
@@ -40,6 +54,25 @@ Make it more {instruction}.
 """
 
 
+REWRITE_CV_SECTIONS_SYSTEM_PROMPT = """
+You are a professional CV editor specializing in optimizing individual CV sections.
+You will receive several numbered, isolated pieces of text from a CV, each with its own instructions on how to improve it.
+Rewrite every piece independently, following only its own instructions.
+Return exactly one revised text per piece, using the same index as the piece.
+Do not offer explanations or additional advice. Only output the improved texts.
+"""
+
+
+CV_SECTION_ITEM_PROMPT = """
+### Piece {index}
+Isolated piece of text from a CV:
+{text}
+
+Instructions:
+Make it more {instruction}.
+"""
+
+
 GENERATE_COVER_LETTER_SYSTEM_PROMPT = """
 You are a cover letter generator.
 You will be given a job description along with the job applicant's CV.
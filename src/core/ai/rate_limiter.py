@@ -0,0 +1,134 @@
+import asyncio
+import time
+from typing import Dict, Optional
+
+from loguru import logger
+from pydantic import BaseModel
+
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously up to a per-minute capacity.
+    The level may go negative when a reservation is reconciled upwards,
+    which simply delays the next callers.
+    """
+
+    def __init__(self, capacity_per_minute: float):
+        self.capacity = float(capacity_per_minute)
+        self.refill_rate = self.capacity / 60
+        self.level = self.capacity
+        self.updated_at = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.level = min(
+            self.capacity, self.level + (now - self.updated_at) * self.refill_rate
+        )
+        self.updated_at = now
+
+    def time_until_available(self, amount: float) -> float:
+        self._refill()
+        amount = min(amount, self.capacity)
+        if self.level >= amount:
+            return 0.0
+        return (amount - self.level) / self.refill_rate
+
+    def consume(self, amount: float) -> None:
+        self._refill()
+        self.level -= amount
+
+    def refund(self, amount: float) -> None:
+        self._refill()
+        self.level = min(self.capacity, self.level + amount)
+
+
+class RateLimitReservation(BaseModel):
+    input_tokens: int
+    output_tokens: int
+
+
+class RateLimiter:
+    """
+    Async limiter over requests, input tokens and output tokens per minute.
+    Callers queue in FIFO order behind a lock instead of failing, reserve an
+    estimate up front and reconcile it with the real usage afterwards.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int,
+        input_tokens_per_minute: int,
+        output_tokens_per_minute: int,
+    ):
+        self.requests = TokenBucket(requests_per_minute)
+        self.input_tokens = TokenBucket(input_tokens_per_minute)
+        self.output_tokens = TokenBucket(output_tokens_per_minute)
+        self._lock = asyncio.Lock()
+        self.throttled_calls = 0
+        self.total_wait_seconds = 0.0
+
+    async def acquire(
+        self, input_tokens: int, output_tokens: int
+    ) -> RateLimitReservation:
+        async with self._lock:
+            while True:
+                wait = max(
+                    self.requests.time_until_available(1),
+                    self.input_tokens.time_until_available(input_tokens),
+                    self.output_tokens.time_until_available(output_tokens),
+                )
+                if wait <= 0:
+                    break
+                logger.debug(f"Rate limit reached, waiting {wait:.2f}s.")
+                self.throttled_calls += 1
+                self.total_wait_seconds += wait
+                await asyncio.sleep(wait)
+
+            self.requests.consume(1)
+            self.input_tokens.consume(input_tokens)
+            self.output_tokens.consume(output_tokens)
+        return RateLimitReservation(
+            input_tokens=input_tokens, output_tokens=output_tokens
+        )
+
+    def reconcile(
+        self,
+        reservation: RateLimitReservation,
+        usage: Dict[str, Optional[int]],
+    ) -> None:
+        """Replaces the reserved estimate with the usage reported by the API."""
+        self._adjust(
+            self.input_tokens,
+            reservation.input_tokens,
+            usage.get("input_tokens_count"),
+        )
+        self._adjust(
+            self.output_tokens,
+            reservation.output_tokens,
+            usage.get("output_tokens_count"),
+        )
+
+    def release(self, reservation: RateLimitReservation) -> None:
+        """Returns a reservation whose call was never sent."""
+        self.requests.refund(1)
+        self.input_tokens.refund(reservation.input_tokens)
+        self.output_tokens.refund(reservation.output_tokens)
+
+    @staticmethod
+    def _adjust(bucket: TokenBucket, reserved: int, actual: Optional[int]) -> None:
+        if actual is None:
+            return
+        if actual > reserved:
+            bucket.consume(actual - reserved)
+        elif actual < reserved:
+            bucket.refund(reserved - actual)
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        return {
+            "throttled_calls": self.throttled_calls,
+            "total_wait_seconds": round(self.total_wait_seconds, 3),
+            "requests_available": round(self.requests.level, 3),
+            "input_tokens_available": round(self.input_tokens.level),
+            "output_tokens_available": round(self.output_tokens.level),
+        }
@@ -0,0 +1,126 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from google.genai.types import GenerateContentConfig
+from loguru import logger
+
+from src.core.ai.generation_config import config_fingerprint
+
+
+def make_cache_key(model_name: str, prompt: str, config: GenerateContentConfig) -> str:
+    """
+    Content-addressed key for an LLM call.
+    Covers the model, the rendered prompt and the full generation config,
+    including the system prompt and the response schema.
+    """
+    payload = {
+        "model": model_name,
+        "prompt": prompt,
+        "config": config_fingerprint(config),
+    }
+    serialized = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """
+    Two-tier cache for serialized LLM responses.
+    The first tier is an in-memory LRU with TTL, the second an optional SQLite file
+    that survives restarts. Disk hits are promoted to memory.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: float = 3600,
+        sqlite_path: Optional[str] = None,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._memory: OrderedDict[str, Tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self.hits = 0
+        self.misses = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+
+        if sqlite_path:
+            self._db = sqlite3.connect(sqlite_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS response_cache ("
+                "key TEXT PRIMARY KEY, expires_at REAL NOT NULL, value TEXT NOT NULL)"
+            )
+            self._db.commit()
+            logger.info(f"Response cache SQLite tier enabled: {sqlite_path}")
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._memory.move_to_end(key)
+                    self.hits += 1
+                    self.memory_hits += 1
+                    return value
+                del self._memory[key]
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT expires_at, value FROM response_cache WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is not None:
+                    expires_at, value = row
+                    if expires_at > now:
+                        self._store_in_memory(key, expires_at, value)
+                        self.hits += 1
+                        self.disk_hits += 1
+                        return value
+                    self._db.execute("DELETE FROM response_cache WHERE key = ?", (key,))
+                    self._db.commit()
+
+            self.misses += 1
+            return None
+
+    def set(self, key: str, value: str) -> None:
+        expires_at = time.time() + self.ttl_seconds
+        with self._lock:
+            self._store_in_memory(key, expires_at, value)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO response_cache (key, expires_at, value) "
+                    "VALUES (?, ?, ?)",
+                    (key, expires_at, value),
+                )
+                self._db.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM response_cache")
+                self._db.commit()
+
+    def _store_in_memory(self, key: str, expires_at: float, value: str) -> None:
+        self._memory[key] = (expires_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "memory_entries": len(self._memory),
+        }
@@ -0,0 +1,61 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Generic, TypeVar
+
+from loguru import logger
+
+T = TypeVar("T")
+
+
+class _Call(Generic[T]):
+    def __init__(self, task: "asyncio.Future[T]"):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls into a single upstream call.
+    Every caller awaits a shielded view of the shared task, so a cancelled caller
+    only stops waiting; the shared call is cancelled once nobody is waiting for it.
+    """
+
+    def __init__(self):
+        self._calls: Dict[str, _Call[Any]] = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, func: Callable[[], Awaitable[T]]) -> T:
+        call = self._calls.get(key)
+        if call is None:
+            call = _Call(asyncio.ensure_future(func()))
+            self._calls[key] = call
+            call.task.add_done_callback(lambda _: self._forget(key, call))
+            self.leaders += 1
+        else:
+            self.coalesced += 1
+            logger.debug(f"Joining in-flight call {key[:12]}.")
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        except asyncio.CancelledError:
+            if call.waiters == 1 and not call.task.done():
+                logger.debug(f"Last waiter left, cancelling call {key[:12]}.")
+                # Forget it now, a new caller must not join a call being cancelled.
+                self._forget(key, call)
+                call.task.cancel()
+            raise
+        finally:
+            call.waiters -= 1
+
+    def _forget(self, key: str, call: _Call[Any]) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {
+            "leaders": self.leaders,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._calls),
+        }
@@ -0,0 +1,160 @@
+import math
+import threading
+from datetime import date
+from typing import Callable, Dict, List, Optional, Tuple
+
+from loguru import logger
+from pydantic import BaseModel
+
+from src.core.ai.helpers import CHARS_PER_TOKEN
+from src.core.models.input_cv_fields import CVBody
+from src.core.models.job_description_fields import JobDescriptionFields
+
+
+class TokenEstimator:
+    """
+    Character-based token estimate calibrated against the prompt_token_count the
+    API reports. The tokens-per-character ratio is an exponential moving average.
+    """
+
+    def __init__(
+        self,
+        tokens_per_char: float = 1 / CHARS_PER_TOKEN,
+        smoothing: float = 0.1,
+    ):
+        self.tokens_per_char = tokens_per_char
+        self.smoothing = smoothing
+        self.observations = 0
+        self._lock = threading.Lock()
+
+    def estimate(self, text: str) -> int:
+        return math.ceil(len(text) * self.tokens_per_char) + 1
+
+    def observe(self, chars: int, actual_tokens: Optional[int]) -> None:
+        if not chars or not actual_tokens:
+            return
+        with self._lock:
+            ratio = actual_tokens / chars
+            self.tokens_per_char += self.smoothing * (ratio - self.tokens_per_char)
+            self.observations += 1
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        return {
+            "tokens_per_char": self.tokens_per_char,
+            "observations": self.observations,
+        }
+
+
+# Lowest priority first. Job description fields are dropped whole, CV sections
+# lose their oldest item one at a time, keeping MIN_KEPT_ITEMS items.
+TRIM_ORDER: List[str] = [
+    "job_description.other",
+    "job_description.nice_to_have",
+    "job_description.about_company",
+    "publications",
+    "awards",
+    "projects",
+    "work_experience",
+]
+MIN_KEPT_ITEMS: Dict[str, int] = {"work_experience": 1}
+
+
+class PromptFit(BaseModel):
+    cv: CVBody
+    job_description: JobDescriptionFields
+    cv_string: str
+    job_description_string: str
+    prompt: str
+    estimated_tokens: int
+    trimmed: List[str] = []
+
+
+def _item_date(item: object) -> date:
+    for field in ("start_date", "date", "releaseDate"):
+        value = getattr(item, field, None)
+        if isinstance(value, date):
+            return value
+    return date.min
+
+
+def _trim_step(
+    cv: CVBody, job_description: JobDescriptionFields, step: str
+) -> Optional[Tuple[CVBody, JobDescriptionFields, str]]:
+    """Applies one trimming step, or returns None if the step has nothing left."""
+    if step.startswith("job_description."):
+        field = step.split(".", 1)[1]
+        if getattr(job_description.job_description, field) is None:
+            return None
+        content = job_description.job_description.model_copy(update={field: None})
+        return (
+            cv,
+            job_description.model_copy(update={"job_description": content}),
+            step,
+        )
+
+    items = getattr(cv, step) or []
+    if len(items) <= MIN_KEPT_ITEMS.get(step, 0):
+        return None
+    oldest = min(items, key=_item_date)
+    remaining = [item for item in items if item is not oldest]
+    label = f"{step}[{getattr(oldest, 'id', '')}]"
+    return cv.model_copy(update={step: remaining or None}), job_description, label
+
+
+def fit_prompt_to_budget(
+    cv: CVBody,
+    job_description: JobDescriptionFields,
+    render_cv: Callable[[CVBody], str],
+    render_job_description: Callable[[JobDescriptionFields], str],
+    build_prompt: Callable[[str, str], str],
+    estimator: TokenEstimator,
+    max_tokens: Optional[int],
+    fixed_text: str = "",
+    cv_string: Optional[str] = None,
+) -> PromptFit:
+    """
+    Renders the prompt and, while its estimate (plus fixed_text, e.g. the system
+    prompt) exceeds max_tokens, drops the lowest-priority content in TRIM_ORDER.
+    Returns the last attempt even if it is still over budget.
+    """
+    cv_string = cv_string if cv_string is not None else render_cv(cv)
+    job_description_string = render_job_description(job_description)
+    prompt = build_prompt(cv_string, job_description_string)
+    estimated_tokens = estimator.estimate(fixed_text + prompt)
+    trimmed: List[str] = []
+
+    steps = iter(TRIM_ORDER)
+    step = next(steps, None)
+    while max_tokens is not None and estimated_tokens > max_tokens and step:
+        result = _trim_step(cv, job_description, step)
+        if result is None:
+            step = next(steps, None)
+            continue
+        new_cv, new_job_description, label = result
+        if new_cv is not cv:
+            cv_string = render_cv(new_cv)
+        if new_job_description is not job_description:
+            job_description_string = render_job_description(new_job_description)
+        cv, job_description = new_cv, new_job_description
+        trimmed.append(label)
+        prompt = build_prompt(cv_string, job_description_string)
+        estimated_tokens = estimator.estimate(fixed_text + prompt)
+
+    if trimmed:
+        logger.warning(
+            f"Prompt trimmed to ~{estimated_tokens} tokens (budget {max_tokens}): {trimmed}"
+        )
+    if max_tokens is not None and estimated_tokens > max_tokens:
+        logger.warning(
+            f"Prompt is still over budget after trimming: ~{estimated_tokens} > {max_tokens}"
+        )
+    return PromptFit(
+        cv=cv,
+        job_description=job_description,
+        cv_string=cv_string,
+        job_description_string=job_description_string,
+        prompt=prompt,
+        estimated_tokens=estimated_tokens,
+        trimmed=trimmed,
+    )
@@ -1,6 +1,6 @@
 import os
 from functools import lru_cache
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic_settings import BaseSettings
 
@@ -9,10 +9,75 @@ class Settings(BaseSettings):
     GOOGLE_API_KEY: Optional[str] = os.getenv("GOOGLE_API_KEY")
     MAX_OUTPUT_TOKENS: int = 2048
     MODEL_NAME: str = "gemini-2.0-flash"
+    LITE_MODEL_NAME: str = "gemini-2.0-flash-lite"
+    GEMINI_BACKEND: Literal["gemini", "fake"] = "gemini"
+    TEMPLATE_BYTECODE_CACHE_DIR: Optional[str] = None
+    TEMPLATE_FRAGMENT_CACHE_MAX_ENTRIES: int = 4096
+
+    FAKE_GEMINI_LATENCY_MEDIAN_MS: float = 800
+    FAKE_GEMINI_LATENCY_SIGMA: float = 0.5
+    FAKE_GEMINI_SERVER_ERROR_RATE: float = 0.0
+    FAKE_GEMINI_RATE_LIMIT_ERROR_RATE: float = 0.0
+    FAKE_GEMINI_SEED: Optional[int] = None
 
     APP_NAME: str = "My FastAPI GenAI App"
     ENVIRONMENT: str = os.getenv("ENVIRONMENT", "development")
 
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_MAX_ENTRIES: int = 1024
+    RESPONSE_CACHE_TTL_SECONDS: int = 3600
+    RESPONSE_CACHE_SQLITE_PATH: Optional[str] = None
+
+    SINGLE_FLIGHT_ENABLED: bool = True
+
+    CV_STORE_SQLITE_PATH: str = "cv_store.sqlite3"
+    CV_STORE_MAX_ENTRIES: int = 1024
+
+    TAILOR_CV_TIMEOUT_SECONDS: float = 60
+    COVER_LETTER_TIMEOUT_SECONDS: float = 45
+    IMPROVE_SECTION_TIMEOUT_SECONDS: float = 20
+    BATCH_TIMEOUT_SECONDS: float = 300
+    REQUEST_TIMEOUT_MAX_SECONDS: float = 300
+
+    CIRCUIT_BREAKER_ENABLED: bool = True
+    CIRCUIT_BREAKER_WINDOW_SIZE: int = 20
+    CIRCUIT_BREAKER_MIN_CALLS: int = 10
+    CIRCUIT_BREAKER_FAILURE_RATE: float = 0.5
+    CIRCUIT_BREAKER_SLOW_CALL_SECONDS: float = 30
+    CIRCUIT_BREAKER_SLOW_CALL_RATE: float = 0.8
+    CIRCUIT_BREAKER_OPEN_SECONDS: float = 30
+    CIRCUIT_BREAKER_HALF_OPEN_CALLS: int = 1
+
+    HEDGING_ENABLED: bool = False
+    HEDGING_PERCENTILE: float = 95
+    HEDGING_BUDGET_PERCENT: float = 5
+    HEDGING_MIN_SAMPLES: int = 20
+    HEDGING_MIN_DELAY_MS: int = 500
+
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_REQUESTS_PER_MINUTE: int = 2000
+    RATE_LIMIT_INPUT_TOKENS_PER_MINUTE: int = 4_000_000
+    RATE_LIMIT_OUTPUT_TOKENS_PER_MINUTE: int = 4_000_000
+
+    CONTEXT_CACHE_ENABLED: bool = False
+    CONTEXT_CACHE_BACKEND: Literal["gemini", "local"] = "gemini"
+    CONTEXT_CACHE_TTL_SECONDS: int = 3600
+    CONTEXT_CACHE_MAX_ENTRIES: int = 100
+    CONTEXT_CACHE_MIN_TOKENS: int = 4096
+    CONTEXT_CACHE_FAILURE_TTL_SECONDS: int = 60
+    CONTEXT_CACHE_CREATE_TIMEOUT_SECONDS: float = 10
+
+    BATCH_MAX_JOB_DESCRIPTIONS: int = 50
+    BATCH_MAX_CONCURRENCY: int = 5
+
+    CPU_EXECUTOR_KIND: Literal["inline", "thread"] = "thread"
+    CPU_EXECUTOR_MAX_WORKERS: Optional[int] = None
+    CPU_EXECUTOR_PROCESS_WORKERS: int = 0
+    JSON_BODY_OFFLOAD_MIN_BYTES: int = 65536
+    JSON_BODY_VALIDATE_JSON_MIN_BYTES: int = 16384
+    EVENT_LOOP_LAG_MONITOR_ENABLED: bool = True
+    EVENT_LOOP_LAG_INTERVAL_MS: int = 100
+
     class Config:
         env_file = ".env"
 
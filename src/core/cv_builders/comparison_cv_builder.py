@@ -1,7 +1,9 @@
-from typing import Any, Callable, Dict, List, Optional, TypeVar
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar
 
 from loguru import logger
+from pydantic import ValidationError
 
+from src.core.ai.json_stream import JSONStreamEvent
 from src.core.models.comparison_cv_fields import (
     ComparisonAwardItem,
     ComparisonCV,
@@ -12,7 +14,7 @@ from src.core.models.comparison_cv_fields import (
     ComparisonWorkItem,
 )
 from src.core.models.input_cv_fields import AwardItem as OriginalAwardItem
-from src.core.models.input_cv_fields import CVBody
+from src.core.models.input_cv_fields import CVBody, ProfessionalSummary
 from src.core.models.input_cv_fields import ProjectItem as OriginalProjectItem
 from src.core.models.input_cv_fields import PublicationItem as OriginalPublicationItem
 from src.core.models.input_cv_fields import WorkItem as OriginalWorkItem
@@ -21,20 +23,31 @@ from src.core.models.revised_cv_fields import (
     RevisedCVResponseSchema,
     RevisedProjectItem,
     RevisedPublicationItem,
+    RevisedSkillItem,
     RevisedWorkItem,
 )
 
 OriginalItemT = TypeVar("OriginalItemT", bound=Any)
 RevisedAISuggestionT = TypeVar("RevisedAISuggestionT", bound=Any)
 ComparisonOutputT = TypeVar("ComparisonOutputT")
+FieldValueT = TypeVar("FieldValueT")
+
+# Parametrized once, matching the field annotations of the comparison models,
+# so their instances are accepted as they are.
+StrField = ComparisonField[str]
+OptionalStrField = ComparisonField[Optional[str]]
+StrListField = ComparisonField[List[str]]
+OptionalStrListField = ComparisonField[Optional[List[str]]]
 
 
 class ComparisonCVBuilder:
     @staticmethod
-    def _create_comparison_field[T](
-        original_value: T, suggested_value: Optional[T]
-    ) -> ComparisonField[T]:
-        return ComparisonField[T](original=original_value, suggested=suggested_value)
+    def _create_comparison_field(
+        field_type: Type[ComparisonField[FieldValueT]],
+        original_value: FieldValueT,
+        suggested_value: Optional[FieldValueT],
+    ) -> ComparisonField[FieldValueT]:
+        return field_type(original=original_value, suggested=suggested_value)
 
     @staticmethod
     def _create_comparison_work_item(
@@ -43,10 +56,12 @@ class ComparisonCVBuilder:
         return ComparisonWorkItem(
             id=original_item.id,
             summary=ComparisonCVBuilder._create_comparison_field(
+                StrField,
                 original_item.summary,
                 revised_suggestion.revised_summary if revised_suggestion else None,
             ),
             highlights=ComparisonCVBuilder._create_comparison_field(
+                StrListField,
                 original_item.highlights,
                 revised_suggestion.revised_highlights if revised_suggestion else None,
             ),
@@ -61,10 +76,12 @@ class ComparisonCVBuilder:
         return ComparisonProjectItem(
             id=original_item.id,
             summary=ComparisonCVBuilder._create_comparison_field(
+                StrField,
                 original_item.summary,
                 revised_suggestion.revised_summary if revised_suggestion else None,
             ),
             highlights=ComparisonCVBuilder._create_comparison_field(
+                StrListField,
                 original_item.highlights,
                 revised_suggestion.revised_highlights if revised_suggestion else None,
             ),
@@ -78,6 +95,7 @@ class ComparisonCVBuilder:
         return ComparisonAwardItem(
             id=original_item.id,
             summary=ComparisonCVBuilder._create_comparison_field(
+                OptionalStrField,
                 original_item.summary,
                 revised_suggestion.revised_summary if revised_suggestion else None,
             ),
@@ -92,6 +110,7 @@ class ComparisonCVBuilder:
         return ComparisonPublicationItem(
             id=original_item.id,
             summary=ComparisonCVBuilder._create_comparison_field(
+                OptionalStrField,
                 original_item.summary,
                 revised_suggestion.revised_summary if revised_suggestion else None,
             ),
@@ -106,16 +125,23 @@ class ComparisonCVBuilder:
             [OriginalItemT, Optional[RevisedAISuggestionT]], ComparisonOutputT
         ],
         item_type_name: str = "Item",
+        id_aliases: Optional[Dict[str, str]] = None,
     ) -> List[ComparisonOutputT]:
+        """
+        Pairs original items with AI suggestions by ID. Suggestion IDs that are
+        aliases from the LLM format are mapped back through id_aliases first.
+        """
         comparison_results: List[ComparisonOutputT] = []
         if not original_items:
             return comparison_results
 
+        id_aliases = id_aliases or {}
         ai_suggestions_map: Dict[str, RevisedAISuggestionT] = {}
         if ai_suggestions_list:
             for suggestion in ai_suggestions_list:
                 if hasattr(suggestion, "id"):
-                    ai_suggestions_map[suggestion.id] = suggestion
+                    original_id = id_aliases.get(suggestion.id, suggestion.id)
+                    ai_suggestions_map[original_id] = suggestion
                 else:
                     logger.warning(
                         f"AI suggestion for {item_type_name} missing 'id' attribute."
@@ -130,50 +156,158 @@ class ComparisonCVBuilder:
                 continue
 
             corresponding_ai_suggestion = ai_suggestions_map.get(original_item.id)
-            comparison_item = creator_func(original_item, corresponding_ai_suggestion)
-            comparison_results.append(comparison_item)
-            if corresponding_ai_suggestion:
-                logger.debug(
-                    f"Compared {item_type_name} ID '{original_item.id}' with AI suggestion."
-                )
-            else:
-                logger.debug(
-                    f"Included original {item_type_name} ID '{original_item.id}' (no AI suggestion)."
-                )
+            comparison_results.append(
+                creator_func(original_item, corresponding_ai_suggestion)
+            )
+        # One line per section: per-item lines cost more than building the items.
+        logger.debug(
+            f"Compared {len(ai_suggestions_map)} of {len(original_items)} {item_type_name} items with AI suggestions."
+        )
 
         if ai_suggestions_list:
             original_item_ids = {
                 item.id for item in original_items if hasattr(item, "id")
             }
             for suggestion in ai_suggestions_list:
-                if hasattr(suggestion, "id") and suggestion.id not in original_item_ids:
+                if (
+                    hasattr(suggestion, "id")
+                    and id_aliases.get(suggestion.id, suggestion.id)
+                    not in original_item_ids
+                ):
                     logger.warning(
                         f"AI suggestion for {item_type_name} ID '{suggestion.id}' did not match any original item."
                     )
         return comparison_results
 
+    @staticmethod
+    def _create_comparison_professional_summary(
+        original_ps: ProfessionalSummary,
+        revised_ps_suggestion: Optional[ProfessionalSummary],
+    ) -> ComparisonProfessionalSummary:
+        return ComparisonProfessionalSummary(
+            summary=ComparisonCVBuilder._create_comparison_field(
+                OptionalStrField,
+                original_ps.summary,
+                revised_ps_suggestion.summary if revised_ps_suggestion else None,
+            ),
+            highlights=ComparisonCVBuilder._create_comparison_field(
+                OptionalStrListField,
+                original_ps.highlights,
+                revised_ps_suggestion.highlights if revised_ps_suggestion else None,
+            ),
+        )
+
+    def create_partial_comparison_cv(
+        self,
+        original_cv: CVBody,
+        event: JSONStreamEvent,
+        id_aliases: Optional[Dict[str, str]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Builds the ComparisonCV fields affected by one streamed section of the AI
+        response. Work, project, award and publication items are compared one by one;
+        other sections once their value is complete.
+        Returns None for events that change nothing or cannot be validated yet.
+        """
+        comparable_sections: Dict[str, Tuple[str, Any, Callable[..., Any]]] = {
+            "revised_work_experience": (
+                "work_experience",
+                RevisedWorkItem,
+                ComparisonCVBuilder._create_comparison_work_item,
+            ),
+            "revised_projects": (
+                "projects",
+                RevisedProjectItem,
+                ComparisonCVBuilder._create_comparison_project_item,
+            ),
+            "revised_awards": (
+                "awards",
+                RevisedAwardItem,
+                ComparisonCVBuilder._create_comparison_award_item,
+            ),
+            "revised_publications": (
+                "publications",
+                RevisedPublicationItem,
+                ComparisonCVBuilder._create_comparison_publication_item,
+            ),
+        }
+
+        try:
+            if event.key in comparable_sections:
+                if not event.is_array_item:
+                    return None
+                section, revised_model, creator_func = comparable_sections[event.key]
+                suggestion = revised_model.model_validate(event.value)
+                original_id = (id_aliases or {}).get(suggestion.id, suggestion.id)
+                original_item = next(
+                    (
+                        item
+                        for item in getattr(original_cv, section) or []
+                        if item.id == original_id
+                    ),
+                    None,
+                )
+                if original_item is None:
+                    logger.warning(
+                        f"Streamed suggestion for {section} ID '{suggestion.id}' did not match any original item."
+                    )
+                    return None
+                return {section: [creator_func(original_item, suggestion)]}
+
+            if event.is_array_item:
+                return None
+            if event.key == "explanations":
+                return {"ai_general_explanations": event.value}
+            if event.key == "suggestions":
+                return {"ai_suggestions": event.value}
+            if event.key == "revised_professional_title":
+                return {
+                    "professional_title": ComparisonCVBuilder._create_comparison_field(
+                        StrField, original_cv.header.professional_title, event.value
+                    )
+                }
+            if event.key == "revised_professional_summary":
+                revised_ps = (
+                    ProfessionalSummary.model_validate(event.value)
+                    if event.value
+                    else None
+                )
+                return {
+                    "professional_summary": ComparisonCVBuilder._create_comparison_professional_summary(
+                        original_cv.professional_summary, revised_ps
+                    )
+                }
+            if event.key == "revised_skills":
+                return {
+                    "suggested_skills": [
+                        RevisedSkillItem.model_validate(skill)
+                        for skill in event.value or []
+                    ]
+                }
+        except ValidationError as e:
+            logger.warning(f"Skipping invalid streamed section '{event.key}': {e}")
+            return None
+
+        logger.warning(f"Unknown streamed section '{event.key}'.")
+        return None
+
     def create_comparison_cv(
-        self, original_cv: CVBody, ai_suggestions: RevisedCVResponseSchema
+        self,
+        original_cv: CVBody,
+        ai_suggestions: RevisedCVResponseSchema,
+        id_aliases: Optional[Dict[str, str]] = None,
     ) -> ComparisonCV:
         logger.info("Starting to create comparison CV structure.")
 
         compared_prof_title = ComparisonCVBuilder._create_comparison_field(
+            StrField,
             original_cv.header.professional_title,
             ai_suggestions.revised_professional_title,
         )
 
-        original_ps = original_cv.professional_summary
-        revised_ps_suggestion = ai_suggestions.revised_professional_summary
-
-        compared_ps = ComparisonProfessionalSummary(
-            summary=ComparisonCVBuilder._create_comparison_field(
-                original_ps.summary,
-                revised_ps_suggestion.summary if revised_ps_suggestion else None,
-            ),
-            highlights=ComparisonCVBuilder._create_comparison_field(
-                original_ps.highlights,
-                revised_ps_suggestion.highlights if revised_ps_suggestion else None,
-            ),
+        compared_ps = ComparisonCVBuilder._create_comparison_professional_summary(
+            original_cv.professional_summary,
+            ai_suggestions.revised_professional_summary,
         )
 
         compared_work_experience = ComparisonCVBuilder._process_comparable_list(
@@ -181,24 +315,28 @@ class ComparisonCVBuilder:
             ai_suggestions.revised_work_experience,
             ComparisonCVBuilder._create_comparison_work_item,
             "WorkExperience",
+            id_aliases,
         )
         compared_projects = ComparisonCVBuilder._process_comparable_list(
             original_cv.projects,
             ai_suggestions.revised_projects,
             ComparisonCVBuilder._create_comparison_project_item,
             "Project",
+            id_aliases,
         )
         compared_awards = ComparisonCVBuilder._process_comparable_list(
             original_cv.awards,
             ai_suggestions.revised_awards,
             ComparisonCVBuilder._create_comparison_award_item,
             "Award",
+            id_aliases,
         )
         compared_publications = ComparisonCVBuilder._process_comparable_list(
             original_cv.publications,
             ai_suggestions.revised_publications,
             ComparisonCVBuilder._create_comparison_publication_item,
             "Publication",
+            id_aliases,
         )
 
         return ComparisonCV(
@@ -219,3 +357,17 @@ class ComparisonCVBuilder:
             ai_general_explanations=ai_suggestions.explanations,
             ai_suggestions=ai_suggestions.suggestions,
         )
+
+    def create_comparison_cv_json(
+        self,
+        original_cv: CVBody,
+        ai_suggestions: RevisedCVResponseSchema,
+        id_aliases: Optional[Dict[str, str]] = None,
+    ) -> str:
+        """
+        create_comparison_cv dumped to JSON, for building in a worker process:
+        ComparisonField's generic subclasses cannot be pickled back.
+        """
+        return self.create_comparison_cv(
+            original_cv, ai_suggestions, id_aliases
+        ).model_dump_json(exclude_unset=True)
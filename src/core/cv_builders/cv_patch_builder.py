@@ -0,0 +1,245 @@
+import copy
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from loguru import logger
+from pydantic import BaseModel
+
+from src.core.models.cv_patch_fields import CVPatch, JSONPatchOperation
+from src.core.models.input_cv_fields import CVBody
+from src.core.models.revised_cv_fields import RevisedCVResponseSchema
+from src.core.utils.exceptions import CVPatchError
+
+# CVBody list section, RevisedCVResponseSchema section, revisable item fields.
+PATCHABLE_SECTIONS: Tuple[Tuple[str, str, Tuple[str, ...]], ...] = (
+    ("work_experience", "revised_work_experience", ("summary", "highlights")),
+    ("projects", "revised_projects", ("summary", "highlights")),
+    ("awards", "revised_awards", ("summary",)),
+    ("publications", "revised_publications", ("summary",)),
+)
+
+
+def _json_value(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, list):
+        return [_json_value(item) for item in value]
+    return value
+
+
+def _set_value(
+    operations: List[JSONPatchOperation], path: str, original: Any, suggested: Any
+) -> None:
+    """Appends the operation setting path to suggested, unless nothing changes."""
+    if suggested is None:
+        return
+    suggested = _json_value(suggested)
+    if suggested == _json_value(original):
+        return
+    operations.append(
+        JSONPatchOperation.model_validate(
+            {
+                "op": "add" if original is None else "replace",
+                "path": path,
+                "value": suggested,
+            }
+        )
+    )
+
+
+class CVPatchBuilder:
+    @staticmethod
+    def create_cv_patch(
+        original_cv: CVBody,
+        ai_suggestions: RevisedCVResponseSchema,
+        id_aliases: Optional[Dict[str, str]] = None,
+    ) -> CVPatch:
+        """
+        JSON Patch operations turning original_cv into the CV with every AI
+        suggestion accepted. Items are addressed by their index in original_cv;
+        suggestion IDs that are aliases are mapped back through id_aliases.
+        """
+        id_aliases = id_aliases or {}
+        operations: List[JSONPatchOperation] = []
+
+        _set_value(
+            operations,
+            "/header/professional_title",
+            original_cv.header.professional_title,
+            ai_suggestions.revised_professional_title,
+        )
+        revised_ps = ai_suggestions.revised_professional_summary
+        if revised_ps is not None:
+            for field in ("summary", "highlights"):
+                _set_value(
+                    operations,
+                    f"/professional_summary/{field}",
+                    getattr(original_cv.professional_summary, field),
+                    getattr(revised_ps, field),
+                )
+        _set_value(
+            operations, "/skills", original_cv.skills, ai_suggestions.revised_skills
+        )
+
+        for section, revised_section, fields in PATCHABLE_SECTIONS:
+            suggestions = getattr(ai_suggestions, revised_section)
+            if not suggestions:
+                continue
+            original_items = getattr(original_cv, section) or []
+            index_by_id = {item.id: index for index, item in enumerate(original_items)}
+            for suggestion in suggestions:
+                index = index_by_id.get(id_aliases.get(suggestion.id, suggestion.id))
+                if index is None:
+                    logger.warning(
+                        f"AI suggestion for {section} ID '{suggestion.id}' did not match any original item."
+                    )
+                    continue
+                original_item = original_items[index]
+                item_operations: List[JSONPatchOperation] = []
+                for field in fields:
+                    _set_value(
+                        item_operations,
+                        f"/{section}/{index}/{field}",
+                        getattr(original_item, field),
+                        getattr(suggestion, f"revised_{field}"),
+                    )
+                if item_operations:
+                    operations.append(
+                        JSONPatchOperation.model_validate(
+                            {
+                                "op": "test",
+                                "path": f"/{section}/{index}/id",
+                                "value": original_item.id,
+                            }
+                        )
+                    )
+                    operations.extend(item_operations)
+
+        return CVPatch(
+            operations=operations,
+            ai_general_explanations=ai_suggestions.explanations,
+            ai_suggestions=ai_suggestions.suggestions,
+        )
+
+
+def _pointer_tokens(pointer: str) -> List[str]:
+    if pointer == "":
+        return []
+    if not pointer.startswith("/"):
+        raise CVPatchError(f"Invalid JSON Pointer '{pointer}'.")
+    return [
+        token.replace("~1", "/").replace("~0", "~") for token in pointer[1:].split("/")
+    ]
+
+
+def _list_index(container: List[Any], token: str, pointer: str, append: bool) -> int:
+    if append and token == "-":
+        return len(container)
+    if not token.isdigit() or (token != "0" and token.startswith("0")):
+        raise CVPatchError(f"Invalid array index '{token}' in '{pointer}'.")
+    index = int(token)
+    if index > len(container) or (index == len(container) and not append):
+        raise CVPatchError(f"Array index out of range in '{pointer}'.")
+    return index
+
+
+def _child(container: Any, token: str, pointer: str) -> Any:
+    if isinstance(container, dict):
+        if token not in container:
+            raise CVPatchError(f"Path '{pointer}' does not exist.")
+        return container[token]
+    if isinstance(container, list):
+        return container[_list_index(container, token, pointer, append=False)]
+    raise CVPatchError(f"Path '{pointer}' does not exist.")
+
+
+def _resolve(document: Any, pointer: str) -> Any:
+    value = document
+    for token in _pointer_tokens(pointer):
+        value = _child(value, token, pointer)
+    return value
+
+
+def _parent(document: Any, pointer: str) -> Tuple[Any, str]:
+    tokens = _pointer_tokens(pointer)
+    parent = document
+    for token in tokens[:-1]:
+        parent = _child(parent, token, pointer)
+    if not isinstance(parent, (dict, list)):
+        raise CVPatchError(f"Path '{pointer}' does not exist.")
+    return parent, tokens[-1]
+
+
+def _add(document: Any, pointer: str, value: Any) -> Any:
+    if pointer == "":
+        return value
+    parent, token = _parent(document, pointer)
+    if isinstance(parent, dict):
+        parent[token] = value
+    else:
+        parent.insert(_list_index(parent, token, pointer, append=True), value)
+    return document
+
+
+def _remove(document: Any, pointer: str) -> Any:
+    if pointer == "":
+        raise CVPatchError("Cannot remove the whole document.")
+    parent, token = _parent(document, pointer)
+    if isinstance(parent, dict):
+        _child(parent, token, pointer)
+        del parent[token]
+    else:
+        del parent[_list_index(parent, token, pointer, append=False)]
+    return document
+
+
+def _replace(document: Any, pointer: str, value: Any) -> Any:
+    if pointer == "":
+        return value
+    parent, token = _parent(document, pointer)
+    if isinstance(parent, dict):
+        _child(parent, token, pointer)
+        parent[token] = value
+    else:
+        parent[_list_index(parent, token, pointer, append=False)] = value
+    return document
+
+
+def apply_json_patch(document: Any, operations: Iterable[JSONPatchOperation]) -> Any:
+    """
+    Applies RFC 6902 operations in order to a JSON-compatible document, which is
+    changed in place; the patched document is returned. Raises CVPatchError for
+    a failed test or a path that does not exist.
+    """
+    for operation in operations:
+        path = operation.path
+        if operation.op == "add":
+            document = _add(document, path, copy.deepcopy(operation.value))
+        elif operation.op == "remove":
+            document = _remove(document, path)
+        elif operation.op == "replace":
+            document = _replace(document, path, copy.deepcopy(operation.value))
+        elif operation.op == "test":
+            if _resolve(document, path) != operation.value:
+                raise CVPatchError(f"Test failed for '{path}'.")
+        else:
+            if operation.from_ is None:
+                raise CVPatchError(f"'{operation.op}' requires 'from'.")
+            value = copy.deepcopy(_resolve(document, operation.from_))
+            if operation.op == "move":
+                if path.startswith(operation.from_ + "/"):
+                    raise CVPatchError(
+                        f"Cannot move '{operation.from_}' into its own child '{path}'."
+                    )
+                document = _remove(document, operation.from_)
+            document = _add(document, path, value)
+    return document
+
+
+def apply_cv_patch(cv: CVBody, operations: Iterable[JSONPatchOperation]) -> CVBody:
+    """
+    The CV with the accepted operations applied. The result is validated, so an
+    operation producing an invalid CV raises pydantic's ValidationError.
+    """
+    return CVBody.model_validate(
+        apply_json_patch(cv.model_dump(mode="json"), operations)
+    )
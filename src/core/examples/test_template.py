@@ -1,12 +1,11 @@
-from jinja2 import Template
 
 from src.core.models.input_cv_fields import (AwardItem, CVBody, CVHeader, EducationItem,
                                              LanguageItem, Location,
                                              ProfessionalSummary, Profile, ProjectItem,
                                              PublicationItem, SkillItem, StudyType,
                                              WorkItem)
-from src.core.templates.md_cv_template import CV_TEMPLATE_MD
-from src.core.templates.md_cv_template_to_llm import CV_TEMPLATE_LLM_MD
+from src.core.templates.renderers.environment import CV_MD_TEMPLATE, render_template
+from src.core.templates.renderers.llm import TemplateLLMRenderer
 
 # ---
 
@@ -200,17 +199,14 @@ cv_dmytro = CVBody(
 
 if __name__ == "__main__":
 
-    template = Template(CV_TEMPLATE_MD)
     # 4. Render the template with the data.
-    rendered_md = template.render(cv=cv_dmytro)
+    rendered_md = render_template(CV_MD_TEMPLATE, cv=cv_dmytro)
 
     with open("cv.md", "w") as f:
         f.write(rendered_md)
 
 
-    template = Template(CV_TEMPLATE_LLM_MD)
-
-    rendered_md = template.render(cv=cv_dmytro)
+    rendered_md = TemplateLLMRenderer.cv_to_llm_format(cv_dmytro)
 
     with open("cv_4_llm.md", "w") as f:
         f.write(rendered_md)
@@ -70,3 +70,15 @@ class ComparisonCV(BaseModel):
 
     ai_general_explanations: str
     ai_suggestions: Optional[str] = None
+
+
+# What the slim response view leaves out: originals repeated in the comparison
+# fields. Slim responses are also serialized with exclude_none, which drops the
+# suggestions the AI did not make.
+SLIM_COMPARISON_CV_EXCLUDE = {
+    "original_header": {"professional_title"},
+    "work_experience": {"__all__": {"original_data": {"summary", "highlights"}}},
+    "projects": {"__all__": {"original_data": {"summary", "highlights"}}},
+    "awards": {"__all__": {"original_data": {"summary"}}},
+    "publications": {"__all__": {"original_data": {"summary"}}},
+}
@@ -0,0 +1,27 @@
+from typing import Any, List, Literal, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class JSONPatchOperation(BaseModel):
+    """One RFC 6902 JSON Patch operation. path and from are RFC 6901 JSON Pointers."""
+
+    op: Literal["add", "remove", "replace", "move", "copy", "test"]
+    path: str
+    value: Any = None
+    from_: Optional[str] = Field(None, alias="from")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class CVPatch(BaseModel):
+    """
+    AI suggestions as JSON Patch operations against the submitted CV. The
+    operations for each changed item start with a test of the item's id, so
+    applying them to a CV whose items were reordered fails instead of changing
+    the wrong item.
+    """
+
+    operations: List[JSONPatchOperation]
+    ai_general_explanations: str
+    ai_suggestions: Optional[str] = None
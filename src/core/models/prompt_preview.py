@@ -0,0 +1,11 @@
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class PromptPreview(BaseModel):
+    prompt: str
+    system_instruction: str
+    estimated_input_tokens: int
+    input_token_budget: Optional[int] = None
+    trimmed: List[str] = []
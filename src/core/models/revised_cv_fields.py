@@ -1,3 +1,4 @@
+import re
 from typing import Dict, List, Optional
 
 from google.genai.types import GenerateContentResponse
@@ -17,6 +18,22 @@ def validate_uuid_id(id: str) -> str:
     return id
 
 
+ID_ALIAS_PATTERN = re.compile(r"^[A-Z]{1,2}\d{1,4}$")
+
+
+def validate_item_id(id: str) -> str:
+    """
+    Validates that the provided ID is a valid UUID or a short alias (e.g. 'W1')
+    assigned when the CV was rendered for the LLM.
+    """
+    if isinstance(id, str) and ID_ALIAS_PATTERN.match(id):
+        return id
+    try:
+        return validate_uuid_id(id)
+    except ValueError:
+        raise ValueError(f"ID {id} should be valid UUID4 or a short alias such as W1")
+
+
 class RevisedWorkItem(BaseModel):
     """
     Represents a work experience item with AI-suggested revisions.
@@ -33,7 +50,7 @@ class RevisedWorkItem(BaseModel):
         None, description="AI-suggested revised highlights for this work experience."
     )
 
-    validate_id = field_validator("id", mode="before")(validate_uuid_id)
+    validate_id = field_validator("id", mode="before")(validate_item_id)
 
 
 class RevisedProjectItem(BaseModel):
@@ -50,7 +67,7 @@ class RevisedProjectItem(BaseModel):
         None, description="AI-suggested revised highlights for the project."
     )
 
-    validate_id = field_validator("id", mode="before")(validate_uuid_id)
+    validate_id = field_validator("id", mode="before")(validate_item_id)
 
 
 class RevisedAwardItem(BaseModel):
@@ -59,7 +76,7 @@ class RevisedAwardItem(BaseModel):
         None, description="AI-suggested revised summary for the award."
     )
 
-    validate_id = field_validator("id", mode="before")(validate_uuid_id)
+    validate_id = field_validator("id", mode="before")(validate_item_id)
 
 
 class RevisedPublicationItem(BaseModel):
@@ -68,7 +85,7 @@ class RevisedPublicationItem(BaseModel):
         None, description="AI-suggested revised summary for the publication."
     )
 
-    validate_id = field_validator("id", mode="before")(validate_uuid_id)
+    validate_id = field_validator("id", mode="before")(validate_item_id)
 
 
 class RevisedSkillItem(SkillItem):
@@ -114,6 +131,21 @@ class RevisedCVResponseSchema(BaseModel):
     )
 
 
+class RevisedCVSection(BaseModel):
+    index: int = Field(..., description="Index of the CV text piece being revised.")
+    revised_text: str = Field(..., description="The improved text of the piece.")
+
+
+class RevisedCVSectionsResponseSchema(BaseModel):
+    """
+    Schema for the AI's response when several CV text pieces are revised in one call.
+    """
+
+    sections: List[RevisedCVSection] = Field(
+        ..., description="One revised text for every provided CV text piece."
+    )
+
+
 class LLMResponse(BaseModel):
     response: Optional[GenerateContentResponse]
     metadata: Optional[Dict[str, Optional[int]]]
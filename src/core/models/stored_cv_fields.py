@@ -0,0 +1,36 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field, model_validator
+
+from src.core.models.input_cv_fields import CVBody
+
+
+class CVReference(BaseModel):
+    """
+    Request fields naming the CV: either the CV itself, or the ID of a CV in the
+    CV store with an optional ETag the stored CV must still match.
+    """
+
+    cv: Optional[CVBody] = None
+    cv_id: Optional[str] = Field(None, description="ID of a CV in the CV store.")
+    cv_etag: Optional[str] = Field(
+        None, description="ETag the stored CV must match, as returned by the store."
+    )
+
+    @model_validator(mode="after")
+    def check_cv_source(self) -> "CVReference":
+        if (self.cv is None) == (self.cv_id is None):
+            raise ValueError("Provide exactly one of 'cv' and 'cv_id'.")
+        if self.cv_etag is not None and self.cv_id is None:
+            raise ValueError("'cv_etag' requires 'cv_id'.")
+        return self
+
+
+class StoredCVInfo(BaseModel):
+    cv_id: str
+    version: int
+    etag: str
+
+
+class StoredCVResponse(StoredCVInfo):
+    cv: CVBody
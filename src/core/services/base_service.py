@@ -1,11 +1,26 @@
+import asyncio
+import time
 from abc import ABC
-from typing import Tuple, Type
+from contextlib import nullcontext
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    ContextManager,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
 
 from google import genai
 from google.genai import errors
 from google.genai.types import GenerateContentConfig, GenerateContentResponse
 from loguru import logger
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 from tenacity import (
     retry,
     retry_if_exception_type,
@@ -13,9 +28,46 @@ from tenacity import (
     wait_exponential,
 )
 
-from src.core.ai.helpers import postprocess_text_response
+from src.core.ai.circuit_breaker import CircuitBreaker
+from src.core.ai.context_cache import (
+    ContextCacheBackend,
+    ContextCacheManager,
+    GeminiContextCacheBackend,
+    LocalContextCacheBackend,
+)
+from src.core.ai.deadline import attempt_timeout, remaining_time, stop_before_deadline
+from src.core.ai.fake_client import FakeGeminiClient, FakeGeminiConfig
+from src.core.ai.generation_config import (
+    GenerationConfigRegistry,
+    parse_structured_response,
+)
+from src.core.ai.hedging import RequestHedger
+from src.core.ai.helpers import (
+    IncrementalTextPostprocessor,
+    format_prompt,
+    get_token_usage_metadata,
+    is_response_truncated,
+    postprocess_text_response,
+)
+from src.core.ai.model_cascade import ModelStatsRecorder
+from src.core.ai.offload import CPUExecutor
+from src.core.ai.rate_limiter import RateLimiter, RateLimitReservation
+from src.core.ai.response_cache import make_cache_key
+from src.core.ai.single_flight import SingleFlight
+from src.core.ai.token_budget import PromptFit, TokenEstimator, fit_prompt_to_budget
 from src.core.config import settings
+from src.core.models.input_cv_fields import CVBody
+from src.core.models.job_description_fields import JobDescriptionFields
+from src.core.models.prompt_preview import PromptPreview
 from src.core.templates.renderers.llm import TemplateLLMRenderer
+from src.core.utils.exceptions import (
+    CircuitOpenError,
+    DeadlineExceededError,
+    ResponseParsingError,
+    ResponseTruncatedError,
+)
+
+T = TypeVar("T")
 
 
 class BaseServiceConfig(BaseModel):
@@ -24,22 +76,147 @@ class BaseServiceConfig(BaseModel):
     retry_attempts: int = 3
     retry_min_wait: int = 4
     retry_max_wait: int = 10
+    model_cascade: List[str] = []
+    max_input_tokens: Optional[int] = None
+    request_timeout_seconds: float = 60
+    min_attempt_seconds: float = 1
+
+
+def is_upstream_failure(error: BaseException) -> bool:
+    """Errors that indicate Gemini itself is degraded, as opposed to a bad request."""
+    if isinstance(error, errors.ServerError):
+        return True
+    if isinstance(error, errors.ClientError):
+        return error.code == 429
+    return isinstance(error, asyncio.TimeoutError)
 
 
 class BaseAIService(ABC):
     retriable_errors: Tuple[Type[BaseException], ...] = (errors.ServerError,)
+    single_flight: SingleFlight = SingleFlight()
+    rate_limiter: Optional[RateLimiter] = (
+        RateLimiter(
+            requests_per_minute=settings.RATE_LIMIT_REQUESTS_PER_MINUTE,
+            input_tokens_per_minute=settings.RATE_LIMIT_INPUT_TOKENS_PER_MINUTE,
+            output_tokens_per_minute=settings.RATE_LIMIT_OUTPUT_TOKENS_PER_MINUTE,
+        )
+        if settings.RATE_LIMIT_ENABLED
+        else None
+    )
+    circuit_breaker: Optional[CircuitBreaker] = (
+        CircuitBreaker(
+            window_size=settings.CIRCUIT_BREAKER_WINDOW_SIZE,
+            min_calls=settings.CIRCUIT_BREAKER_MIN_CALLS,
+            failure_rate_threshold=settings.CIRCUIT_BREAKER_FAILURE_RATE,
+            slow_call_seconds=settings.CIRCUIT_BREAKER_SLOW_CALL_SECONDS,
+            slow_call_rate_threshold=settings.CIRCUIT_BREAKER_SLOW_CALL_RATE,
+            open_seconds=settings.CIRCUIT_BREAKER_OPEN_SECONDS,
+            half_open_max_calls=settings.CIRCUIT_BREAKER_HALF_OPEN_CALLS,
+            is_failure=is_upstream_failure,
+        )
+        if settings.CIRCUIT_BREAKER_ENABLED
+        else None
+    )
+    model_stats: ModelStatsRecorder = ModelStatsRecorder()
+    cpu_executor: CPUExecutor = CPUExecutor(
+        kind=settings.CPU_EXECUTOR_KIND,
+        max_workers=settings.CPU_EXECUTOR_MAX_WORKERS,
+        process_workers=settings.CPU_EXECUTOR_PROCESS_WORKERS,
+    )
+    token_estimator: TokenEstimator = TokenEstimator()
+    hedger: Optional[RequestHedger] = (
+        RequestHedger(
+            percentile=settings.HEDGING_PERCENTILE,
+            budget_ratio=settings.HEDGING_BUDGET_PERCENT / 100,
+            min_samples=settings.HEDGING_MIN_SAMPLES,
+            min_delay_seconds=settings.HEDGING_MIN_DELAY_MS / 1000,
+        )
+        if settings.HEDGING_ENABLED
+        else None
+    )
 
     def __init__(self, config: BaseServiceConfig):
         self.config = config
         logger.info(f"Loading client...")
-        self.client: genai.Client = genai.Client(api_key=settings.GOOGLE_API_KEY)
+        self.client: genai.Client = self._create_client()
         self.template_renderer: TemplateLLMRenderer = TemplateLLMRenderer()
+        self.context_cache: Optional[ContextCacheManager] = None
+        self.generation_configs: GenerationConfigRegistry = GenerationConfigRegistry()
+
+    @staticmethod
+    def _create_client() -> genai.Client:
+        if settings.GEMINI_BACKEND == "fake":
+            logger.warning("Using the offline fake Gemini client.")
+            fake_client = FakeGeminiClient(
+                FakeGeminiConfig(
+                    latency_median_ms=settings.FAKE_GEMINI_LATENCY_MEDIAN_MS,
+                    latency_sigma=settings.FAKE_GEMINI_LATENCY_SIGMA,
+                    server_error_rate=settings.FAKE_GEMINI_SERVER_ERROR_RATE,
+                    rate_limit_error_rate=settings.FAKE_GEMINI_RATE_LIMIT_ERROR_RATE,
+                    seed=settings.FAKE_GEMINI_SEED,
+                )
+            )
+            return cast(genai.Client, fake_client)
+        return genai.Client(api_key=settings.GOOGLE_API_KEY)
+
+    def _create_context_cache(self) -> Optional[ContextCacheManager]:
+        if not settings.CONTEXT_CACHE_ENABLED:
+            return None
+        backend: ContextCacheBackend = (
+            LocalContextCacheBackend()
+            if settings.CONTEXT_CACHE_BACKEND == "local"
+            else GeminiContextCacheBackend(self.client)
+        )
+        return ContextCacheManager(
+            backend,
+            ttl_seconds=settings.CONTEXT_CACHE_TTL_SECONDS,
+            max_entries=settings.CONTEXT_CACHE_MAX_ENTRIES,
+            min_tokens=settings.CONTEXT_CACHE_MIN_TOKENS,
+            failure_ttl_seconds=settings.CONTEXT_CACHE_FAILURE_TTL_SECONDS,
+            create_timeout_seconds=settings.CONTEXT_CACHE_CREATE_TIMEOUT_SECONDS,
+            circuit_breaker=self.circuit_breaker,
+        )
+
+    def _fit_cv_prompt(
+        self,
+        cv: CVBody,
+        job_description: JobDescriptionFields,
+        prompt_template: str,
+        system_instruction: str,
+        cv_string: Optional[str] = None,
+    ) -> PromptFit:
+        """Renders a CV + job description prompt trimmed to max_input_tokens."""
+        return fit_prompt_to_budget(
+            cv,
+            job_description,
+            render_cv=self.template_renderer.cv_to_llm_format,
+            render_job_description=self.template_renderer.job_description_to_llm_format,
+            build_prompt=lambda cv_string, job_description_string: format_prompt(
+                prompt_template,
+                cv=cv_string,
+                job_description=job_description_string,
+            ),
+            estimator=self.token_estimator,
+            max_tokens=self.config.max_input_tokens,
+            fixed_text=system_instruction,
+            cv_string=cv_string,
+        )
+
+    def _preview_prompt(self, fit: PromptFit, system_instruction: str) -> PromptPreview:
+        return PromptPreview(
+            prompt=fit.prompt,
+            system_instruction=system_instruction,
+            estimated_input_tokens=fit.estimated_tokens,
+            input_token_budget=self.config.max_input_tokens,
+            trimmed=fit.trimmed,
+        )
 
     def _create_retry_decorator(self):
         return retry(
             reraise=True,
-            retry=retry_if_exception_type(self.retriable_errors),
-            stop=stop_after_attempt(self.config.retry_attempts),
+            retry=retry_if_exception_type(self.retriable_errors + (TimeoutError,)),
+            stop=stop_after_attempt(self.config.retry_attempts)
+            | stop_before_deadline(self.config.min_attempt_seconds),
             wait=wait_exponential(
                 multiplier=1,
                 min=self.config.retry_min_wait,
@@ -68,17 +245,296 @@ class BaseAIService(ABC):
         )
 
     async def _make_api_call(
-        self, prompt: str, config: GenerateContentConfig, operation_name: str
+        self,
+        prompt: str,
+        config: GenerateContentConfig,
+        operation_name: str,
+        model_name: Optional[str] = None,
     ) -> GenerateContentResponse:
+        model_name = model_name or self.config.model_name
+        if not settings.SINGLE_FLIGHT_ENABLED:
+            return await self._make_hedged_api_call(
+                prompt, config, operation_name, model_name
+            )
+
+        key = make_cache_key(model_name, prompt, config)
+        return await self.single_flight.do(
+            key,
+            lambda: self._make_hedged_api_call(
+                prompt, config, operation_name, model_name
+            ),
+        )
+
+    async def _make_hedged_api_call(
+        self,
+        prompt: str,
+        config: GenerateContentConfig,
+        operation_name: str,
+        model_name: str,
+    ) -> GenerateContentResponse:
+        if self.hedger is None:
+            return await self._generate_content(
+                prompt, config, operation_name, model_name
+            )
+        return await self.hedger.run(
+            f"{operation_name} ({model_name})",
+            lambda: self._generate_content(prompt, config, operation_name, model_name),
+        )
+
+    async def _make_api_call_with_context_cache(
+        self,
+        prompt: str,
+        config: GenerateContentConfig,
+        operation_name: str,
+        cached_prefix: str,
+        prompt_suffix: str,
+        model_name: Optional[str] = None,
+    ) -> GenerateContentResponse:
+        """
+        Sends only prompt_suffix against explicit cached content holding the system
+        prompt and cached_prefix when possible; otherwise sends the full prompt.
+        """
+        model_name = model_name or self.config.model_name
+        if self.context_cache is not None:
+            system_instruction = str(config.system_instruction or "")
+            cached_content = await self.context_cache.get_or_create(
+                model_name, system_instruction, cached_prefix
+            )
+            if cached_content is not None:
+                cached_config = config.model_copy(
+                    update={
+                        "cached_content": cached_content,
+                        "system_instruction": None,
+                    }
+                )
+                try:
+                    return await self._make_api_call(
+                        prompt_suffix, cached_config, operation_name, model_name
+                    )
+                except errors.ClientError as e:
+                    if e.code not in (403, 404):
+                        raise
+                    logger.warning(
+                        f"Context cache {cached_content} is unusable, sending full prompt: {e}"
+                    )
+                    self.context_cache.invalidate(
+                        model_name, system_instruction, cached_prefix
+                    )
+
+        return await self._make_api_call(prompt, config, operation_name, model_name)
+
+    async def _make_cascading_api_call(
+        self,
+        operation_name: str,
+        call: Callable[[str], Awaitable[GenerateContentResponse]],
+        validate: Callable[[GenerateContentResponse], T],
+    ) -> T:
+        """
+        Runs call(model_name) on each model of the cascade in turn, moving to the
+        next model when the response is truncated or validate rejects it with
+        ResponseParsingError, ValidationError or ValueError (e.g. the empty text
+        _extract_text_response rejects). The last model's errors propagate,
+        while a truncated response that passes validation is accepted. validate
+        runs on the CPU executor.
+        """
+        models = self.config.model_cascade or [self.config.model_name]
+        for position, model_name in enumerate(models):
+            next_model = models[position + 1] if position + 1 < len(models) else None
+            started = time.perf_counter()
+            try:
+                response = await call(model_name)
+            except Exception:
+                self.model_stats.record_error(model_name)
+                raise
+            latency = time.perf_counter() - started
+            usage = get_token_usage_metadata(response)
+
+            try:
+                if next_model is not None and is_response_truncated(response):
+                    raise ResponseTruncatedError(
+                        "LLM response was cut off by the output token limit."
+                    )
+                result = await self.cpu_executor.run(validate, response)
+            except (ResponseParsingError, ValidationError, ValueError) as e:
+                if next_model is None:
+                    self.model_stats.record_response(
+                        model_name, latency, usage, "failure"
+                    )
+                    raise
+                self.model_stats.record_response(
+                    model_name, latency, usage, "escalation"
+                )
+                logger.warning(
+                    f"{model_name} failed {operation_name} ({e}), escalating to {next_model}."
+                )
+                continue
+
+            self.model_stats.record_response(model_name, latency, usage, "success")
+            return result
+
+        raise ValueError("Model cascade is empty.")
+
+    async def _reserve_rate_limit(
+        self, prompt: str, config: GenerateContentConfig
+    ) -> Optional[RateLimitReservation]:
+        if self.rate_limiter is None:
+            return None
+        return await self.rate_limiter.acquire(
+            input_tokens=self.token_estimator.estimate(
+                prompt + str(config.system_instruction or "")
+            ),
+            output_tokens=config.max_output_tokens or self.config.max_output_tokens,
+        )
+
+    def _reconcile_rate_limit(
+        self,
+        reservation: Optional[RateLimitReservation],
+        usage: Dict[str, Optional[int]],
+    ) -> None:
+        if self.rate_limiter is not None and reservation is not None:
+            self.rate_limiter.reconcile(reservation, usage)
+
+    def _release_rate_limit(self, reservation: Optional[RateLimitReservation]) -> None:
+        if self.rate_limiter is not None and reservation is not None:
+            self.rate_limiter.release(reservation)
+
+    def _circuit_breaker_guard(self) -> ContextManager[None]:
+        if self.circuit_breaker is None:
+            return nullcontext()
+        return self.circuit_breaker.guard()
+
+    def _attempt_deadline(self) -> float:
+        """Event loop time by which the next upstream call has to finish."""
+        timeout = attempt_timeout(
+            self.config.request_timeout_seconds, self.config.min_attempt_seconds
+        )
+        return asyncio.get_running_loop().time() + timeout
+
+    @staticmethod
+    def _timeout_error(operation_name: str) -> Exception:
+        remaining = remaining_time()
+        if remaining is not None and remaining <= 0:
+            return DeadlineExceededError(
+                f"Request deadline exceeded during {operation_name}."
+            )
+        return TimeoutError(f"Timed out during {operation_name}.")
+
+    async def _generate_content(
+        self,
+        prompt: str,
+        config: GenerateContentConfig,
+        operation_name: str,
+        model_name: Optional[str] = None,
+    ) -> GenerateContentResponse:
+        expires_at = self._attempt_deadline()
+        # Reserved before the guard, so waiting for the limiter is not timed as
+        # part of the upstream call.
+        reservation = await self._reserve_rate_limit(prompt, config)
         try:
-            logger.debug(f"Generating {operation_name}...")
-            response = await self.client.aio.models.generate_content(
-                model=self.config.model_name,
-                contents=prompt,
-                config=config,
+            with self._circuit_breaker_guard():
+                try:
+                    logger.debug(f"Generating {operation_name}...")
+                    async with asyncio.timeout_at(expires_at):
+                        response = await self.client.aio.models.generate_content(
+                            model=model_name or self.config.model_name,
+                            contents=prompt,
+                            config=config,
+                        )
+                    logger.success(f"Successfully generated {operation_name}.")
+                except errors.APIError as e:
+                    logger.error(f"Google API error during {operation_name}: {e}")
+                    self._reconcile_rate_limit(reservation, {"output_tokens_count": 0})
+                    raise
+                except TimeoutError as e:
+                    logger.error(f"Timed out during {operation_name}.")
+                    self._reconcile_rate_limit(reservation, {"output_tokens_count": 0})
+                    raise self._timeout_error(operation_name) from e
+                except asyncio.CancelledError:
+                    self._reconcile_rate_limit(reservation, {"output_tokens_count": 0})
+                    raise
+        except CircuitOpenError:
+            self._release_rate_limit(reservation)
+            raise
+
+        usage = get_token_usage_metadata(response)
+        self._reconcile_rate_limit(reservation, usage)
+        output_model = getattr(config, "output_model", None)
+        if output_model is not None:
+            # The SDK only parses into the model when it is given the model itself.
+            response.parsed = parse_structured_response(response, output_model)
+        if not config.cached_content:
+            self.token_estimator.observe(
+                len(prompt) + len(str(config.system_instruction or "")),
+                usage["input_tokens_count"],
             )
-            logger.success(f"Successfully generated {operation_name}.")
-            return response
-        except errors.APIError as e:
-            logger.error(f"Google API error during {operation_name}: {e}")
+        return response
+
+    async def _make_streaming_api_call(
+        self, prompt: str, config: GenerateContentConfig, operation_name: str
+    ) -> AsyncIterator[GenerateContentResponse]:
+        """
+        Opening the stream and waiting for each chunk are bounded by the attempt
+        deadline, so a stalled stream is cut off instead of hanging the request.
+        """
+        expires_at = self._attempt_deadline()
+        reservation = await self._reserve_rate_limit(prompt, config)
+        usage: Dict[str, Optional[int]] = {"output_tokens_count": 0}
+        try:
+            with self._circuit_breaker_guard():
+                try:
+                    logger.debug(f"Streaming {operation_name}...")
+                    async with asyncio.timeout_at(expires_at):
+                        stream = await self.client.aio.models.generate_content_stream(
+                            model=self.config.model_name,
+                            contents=prompt,
+                            config=config,
+                        )
+                    while True:
+                        try:
+                            async with asyncio.timeout_at(expires_at):
+                                chunk = await anext(stream)
+                        except StopAsyncIteration:
+                            break
+                        if chunk.usage_metadata:
+                            usage = get_token_usage_metadata(chunk)
+                        yield chunk
+                    logger.success(f"Successfully streamed {operation_name}.")
+                except errors.APIError as e:
+                    logger.error(f"Google API error during {operation_name}: {e}")
+                    raise
+                except TimeoutError as e:
+                    # A stream is not retried, so its attempt deadline is final.
+                    logger.error(f"Timed out during {operation_name}.")
+                    raise DeadlineExceededError(
+                        f"Deadline exceeded during {operation_name}."
+                    ) from e
+        except CircuitOpenError:
+            self._release_rate_limit(reservation)
+            reservation = None
             raise
+        finally:
+            self._reconcile_rate_limit(reservation, usage)
+
+    async def _stream_text_response(
+        self,
+        prompt: str,
+        config: GenerateContentConfig,
+        operation_name: str,
+        fallback_message: str = "Something unexpected happened. Please try again later.",
+    ) -> AsyncIterator[str]:
+        """Streams the model output with markdown stripped chunk by chunk."""
+        postprocessor = IncrementalTextPostprocessor()
+        has_output = False
+        async for chunk in self._make_streaming_api_call(
+            prompt, config, operation_name
+        ):
+            text = postprocessor.feed(chunk.text or "")
+            if text:
+                has_output = True
+                yield text
+
+        text = postprocessor.flush()
+        if text:
+            yield text
+        elif not has_output:
+            yield fallback_message
@@ -1,60 +1,120 @@
+from typing import AsyncIterator, Optional
+
 from google.genai.types import GenerateContentConfig
 from loguru import logger
 
-from src.core.ai.helpers import format_prompt, get_token_usage_metadata
+from src.core.ai.generation_config import StructuredGenerateContentConfig
+from src.core.ai.helpers import format_prompt
 from src.core.ai.prompts import (
+    CACHED_CV_PROMPT,
     GENERATE_COVER_LETTER_SYSTEM_PROMPT,
+    JOB_DESC_FOR_CACHED_CV_PROMPT,
     JOB_DESC_W_CV_PROMPT,
 )
+from src.core.ai.token_budget import PromptFit
 from src.core.models.input_cv_fields import CVBody
 from src.core.models.job_description_fields import JobDescriptionFields
+from src.core.models.prompt_preview import PromptPreview
 from src.core.services.base_service import BaseAIService, BaseServiceConfig
 
 
 class GenerateCoverLetterServiceConfig(BaseServiceConfig):
     max_output_tokens: int = 1024
+    max_input_tokens: Optional[int] = 12000
 
 
 class GenerateCoverLetterService(BaseAIService):
     def __init__(self):
         super().__init__(GenerateCoverLetterServiceConfig())
+        self.context_cache = self._create_context_cache()
+        self.generation_configs.register(
+            "cover_letter", self._build_cover_letter_config
+        )
 
-    def _get_cover_letter_config(self) -> GenerateContentConfig:
-        suggestion_config = GenerateContentConfig(
+    def _build_cover_letter_config(self) -> GenerateContentConfig:
+        return GenerateContentConfig(
             max_output_tokens=self.config.max_output_tokens,
             system_instruction=GENERATE_COVER_LETTER_SYSTEM_PROMPT,
         )
-        logger.info(f"Suggestion config: generated")
-        return suggestion_config
+
+    def _get_cover_letter_config(self) -> StructuredGenerateContentConfig:
+        return self.generation_configs.get("cover_letter")
+
+    def _fit_cover_letter_prompt(
+        self,
+        cv: CVBody,
+        job_description: JobDescriptionFields,
+        cv_string: Optional[str] = None,
+    ) -> PromptFit:
+        return self._fit_cv_prompt(
+            cv,
+            job_description,
+            JOB_DESC_W_CV_PROMPT,
+            GENERATE_COVER_LETTER_SYSTEM_PROMPT,
+            cv_string=cv_string,
+        )
+
+    def preview_prompt(
+        self,
+        cv: CVBody,
+        job_description: JobDescriptionFields,
+        cv_string: Optional[str] = None,
+    ) -> PromptPreview:
+        """The prompt generate_cover_letter would send, without calling the model."""
+        return self._preview_prompt(
+            self._fit_cover_letter_prompt(cv, job_description, cv_string),
+            GENERATE_COVER_LETTER_SYSTEM_PROMPT,
+        )
 
     async def generate_cover_letter(
-        self, cv: CVBody, job_description: JobDescriptionFields
+        self,
+        cv: CVBody,
+        job_description: JobDescriptionFields,
+        cv_string: Optional[str] = None,
     ) -> str:
+        """cv_string is cv already in the LLM format, which is then not rendered again."""
         retry_decorator = self._create_retry_decorator()
+        fit = await self.cpu_executor.run(
+            self._fit_cover_letter_prompt, cv, job_description, cv_string
+        )
 
         @retry_decorator
         async def _generate_letter():
-            cv_string: str = self.template_renderer.cv_to_llm_format(cv)
-            job_description_string: str = (
-                self.template_renderer.job_description_to_llm_format(job_description)
-            )
-            prompt: str = format_prompt(
-                JOB_DESC_W_CV_PROMPT,
-                cv=cv_string,
-                job_description=job_description_string,
-            )
+            prompt: str = fit.prompt
             cover_letter_config = self._get_cover_letter_config()
 
-            response = await self._make_api_call(
-                prompt, cover_letter_config, "cover letter"
+            return await self._make_cascading_api_call(
+                "cover letter",
+                lambda model_name: self._make_api_call_with_context_cache(
+                    prompt,
+                    cover_letter_config,
+                    "cover letter",
+                    cached_prefix=format_prompt(CACHED_CV_PROMPT, cv=fit.cv_string),
+                    prompt_suffix=format_prompt(
+                        JOB_DESC_FOR_CACHED_CV_PROMPT,
+                        job_description=fit.job_description_string,
+                    ),
+                    model_name=model_name,
+                ),
+                self._extract_text_response,
             )
 
-            metadata = get_token_usage_metadata(response)
-            logger.info(f"Metadata: {metadata}")
-
-            return self._extract_text_response(response)
-
         return await _generate_letter()
 
+    async def stream_cover_letter(
+        self,
+        cv: CVBody,
+        job_description: JobDescriptionFields,
+        cv_string: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        fit = await self.cpu_executor.run(
+            self._fit_cover_letter_prompt, cv, job_description, cv_string
+        )
+        prompt: str = fit.prompt
+        async for text in self._stream_text_response(
+            prompt, self._get_cover_letter_config(), "cover letter"
+        ):
+            yield text
+
 
 cover_letter_service = GenerateCoverLetterService()
@@ -1,24 +1,50 @@
-from typing import Tuple, Type
+import asyncio
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 from google.genai import errors
-from google.genai.types import GenerateContentConfig
+from google.genai.types import GenerateContentConfig, GenerateContentResponse
 from loguru import logger
+from pydantic import ValidationError
 
+from src.core.ai.generation_config import StructuredGenerateContentConfig
 from src.core.ai.helpers import format_prompt, get_token_usage_metadata
-from src.core.ai.prompts import JOB_DESC_W_CV_PROMPT, SUGGEST_IMPROVEMENTS_SYSTEM_PROMPT
+from src.core.ai.json_stream import IncrementalJSONObjectParser
+from src.core.ai.prompts import (
+    CACHED_CV_PROMPT,
+    JOB_DESC_FOR_CACHED_CV_PROMPT,
+    JOB_DESC_W_CV_PROMPT,
+    SUGGEST_IMPROVEMENTS_SYSTEM_PROMPT,
+)
+from src.core.ai.response_cache import ResponseCache, make_cache_key
+from src.core.config import settings
 from src.core.cv_builders.comparison_cv_builder import ComparisonCVBuilder
+from src.core.cv_builders.cv_patch_builder import CVPatchBuilder
+from src.core.models.comparison_cv_fields import ComparisonCV
+from src.core.models.cv_patch_fields import CVPatch
 from src.core.models.input_cv_fields import CVBody
 from src.core.models.job_description_fields import JobDescriptionFields
+from src.core.models.prompt_preview import PromptPreview
 from src.core.models.revised_cv_fields import (
     LLMResponse,
     RevisedCVResponseSchema,
 )
 from src.core.services.base_service import BaseAIService, BaseServiceConfig
-from src.core.utils.exceptions import ResponseParsingError
+from src.core.utils.exceptions import CircuitOpenError, ResponseParsingError
 
 
 class CVTailorServiceConfig(BaseServiceConfig):
     max_output_tokens: int = 2048
+    max_input_tokens: Optional[int] = 12000
 
 
 class CVTailorService(BaseAIService):
@@ -30,6 +56,7 @@ class CVTailorService(BaseAIService):
     def __init__(self):
         super().__init__(CVTailorServiceConfig())
         self.comparison_cv_builder: ComparisonCVBuilder = ComparisonCVBuilder()
+        self.cv_patch_builder: CVPatchBuilder = CVPatchBuilder()
         self.ai_suggestions_with_error = RevisedCVResponseSchema(
             explanations="ERROR: An error occurred. Please try again later.",
             suggestions="ERROR: An error occurred. Please try again later.",
@@ -41,8 +68,21 @@ class CVTailorService(BaseAIService):
             revised_publications=None,
             revised_skills=None,
         )
+        self.response_cache: Optional[ResponseCache] = (
+            ResponseCache(
+                max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+                ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS,
+                sqlite_path=settings.RESPONSE_CACHE_SQLITE_PATH,
+            )
+            if settings.RESPONSE_CACHE_ENABLED
+            else None
+        )
+        self.context_cache = self._create_context_cache()
+        self.generation_configs.register(
+            "suggest_improvements", self._build_suggest_improvements_config
+        )
 
-    def _get_suggest_improvements_config(self) -> GenerateContentConfig:
+    def _build_suggest_improvements_config(self) -> GenerateContentConfig:
         return GenerateContentConfig(
             max_output_tokens=self.config.max_output_tokens,
             system_instruction=SUGGEST_IMPROVEMENTS_SYSTEM_PROMPT,
@@ -50,19 +90,36 @@ class CVTailorService(BaseAIService):
             response_schema=RevisedCVResponseSchema,
         )
 
+    def _get_suggest_improvements_config(self) -> StructuredGenerateContentConfig:
+        return self.generation_configs.get("suggest_improvements")
+
+    def _get_cached_improvements(self, cache_key: str) -> Optional[LLMResponse]:
+        if self.response_cache is None:
+            return None
+        cached_value = self.response_cache.get(cache_key)
+        if cached_value is None:
+            return None
+
+        logger.info("CV improvements served from response cache.")
+        parsed = RevisedCVResponseSchema.model_validate_json(cached_value)
+        return LLMResponse(
+            response=GenerateContentResponse(parsed=parsed),
+            metadata={"input_tokens_count": None, "output_tokens_count": None},
+        )
+
     async def get_cv_improvements(self, job_description: str, cv: str) -> LLMResponse:
         retry_decorator = self._create_retry_decorator()
+        prompt: str = format_prompt(
+            JOB_DESC_W_CV_PROMPT, job_description=job_description, cv=cv
+        )
+        suggestion_config = self._get_suggest_improvements_config()
+        cache_key = make_cache_key(self.config.model_name, prompt, suggestion_config)
 
-        @retry_decorator
-        async def _get_improvements():
-            prompt: str = format_prompt(
-                JOB_DESC_W_CV_PROMPT, job_description=job_description, cv=cv
-            )
-            suggestion_config = self._get_suggest_improvements_config()
-            response = await self._make_api_call(
-                prompt, suggestion_config, "CV improvements"
-            )
+        cached_response = self._get_cached_improvements(cache_key)
+        if cached_response is not None:
+            return cached_response
 
+        def _validate(response: GenerateContentResponse) -> LLMResponse:
             if not response.parsed or response.parsed is None:
                 logger.error("LLM response could not be parsed or was empty.")
                 logger.info(f"LLM response: {response}")
@@ -73,15 +130,87 @@ class CVTailorService(BaseAIService):
             metadata = get_token_usage_metadata(response)
             return LLMResponse(response=response, metadata=metadata)
 
-        return await _get_improvements()
+        @retry_decorator
+        async def _get_improvements():
+            return await self._make_cascading_api_call(
+                "CV improvements",
+                lambda model_name: self._make_api_call_with_context_cache(
+                    prompt,
+                    suggestion_config,
+                    "CV improvements",
+                    cached_prefix=format_prompt(CACHED_CV_PROMPT, cv=cv),
+                    prompt_suffix=format_prompt(
+                        JOB_DESC_FOR_CACHED_CV_PROMPT, job_description=job_description
+                    ),
+                    model_name=model_name,
+                ),
+                _validate,
+            )
+
+        llm_response: LLMResponse = await _get_improvements()
+        if (
+            self.response_cache is not None
+            and llm_response.response is not None
+            and isinstance(llm_response.response.parsed, RevisedCVResponseSchema)
+        ):
+            self.response_cache.set(
+                cache_key, llm_response.response.parsed.model_dump_json()
+            )
+        return llm_response
 
     async def tailor_cv(
-        self, original_cv: CVBody, job_description: JobDescriptionFields
-    ):
-        cv_string: str = self.template_renderer.cv_to_llm_format(original_cv)
-        job_description_string: str = (
-            self.template_renderer.job_description_to_llm_format(job_description)
+        self,
+        original_cv: CVBody,
+        job_description: JobDescriptionFields,
+        cv_string: Optional[str] = None,
+        heavy: bool = False,
+    ) -> ComparisonCV:
+        """
+        heavy=True builds the comparison CV on the process pool when one is
+        configured, for batch work.
+        """
+        ai_suggestions, id_aliases = await self._get_ai_suggestions(
+            original_cv, job_description, cv_string
+        )
+        return await self._build_comparison_cv(
+            original_cv, ai_suggestions, id_aliases, heavy=heavy
+        )
+
+    async def tailor_cv_patch(
+        self,
+        original_cv: CVBody,
+        job_description: JobDescriptionFields,
+        cv_string: Optional[str] = None,
+    ) -> CVPatch:
+        """tailor_cv's suggestions as JSON Patch operations against original_cv."""
+        ai_suggestions, id_aliases = await self._get_ai_suggestions(
+            original_cv, job_description, cv_string
+        )
+        return self.cv_patch_builder.create_cv_patch(
+            original_cv, ai_suggestions, id_aliases
+        )
+
+    async def _get_ai_suggestions(
+        self,
+        original_cv: CVBody,
+        job_description: JobDescriptionFields,
+        cv_string: Optional[str] = None,
+    ) -> Tuple[RevisedCVResponseSchema, Optional[Dict[str, str]]]:
+        """
+        The AI suggestions for original_cv and the ID aliases they may use.
+        Unparsable responses and an open circuit give ai_suggestions_with_error.
+        """
+        fit = await self.cpu_executor.run(
+            self._fit_cv_prompt,
+            original_cv,
+            job_description,
+            JOB_DESC_W_CV_PROMPT,
+            SUGGEST_IMPROVEMENTS_SYSTEM_PROMPT,
+            cv_string=cv_string,
         )
+        cv_string = fit.cv_string
+        job_description_string = fit.job_description_string
+        id_aliases = self.template_renderer.cv_id_aliases(fit.cv)
 
         try:
             llm_data: LLMResponse = await self.get_cv_improvements(
@@ -94,18 +223,172 @@ class CVTailorService(BaseAIService):
             ai_suggestions: RevisedCVResponseSchema = llm_data.response.parsed
         except ResponseParsingError as e:
             logger.error(f"Failed to parse LLM response: {e}")
-            return self.comparison_cv_builder.create_comparison_cv(
-                original_cv, self.ai_suggestions_with_error
-            )
+            return self.ai_suggestions_with_error, None
+        except CircuitOpenError as e:
+            logger.warning(f"Skipping CV improvements: {e}")
+            return self.ai_suggestions_with_error, None
         except Exception as e:
-            logger.error(
-                f"Unexpected error during get_cv_improvements: {e}", exc_info=True
-            )
+            logger.exception(f"Unexpected error during get_cv_improvements: {e}")
             raise
 
-        return self.comparison_cv_builder.create_comparison_cv(
-            original_cv, ai_suggestions
+        return ai_suggestions, id_aliases
+
+    async def _build_comparison_cv(
+        self,
+        original_cv: CVBody,
+        ai_suggestions: RevisedCVResponseSchema,
+        id_aliases: Optional[Dict[str, str]] = None,
+        heavy: bool = False,
+    ) -> ComparisonCV:
+        if heavy and self.cpu_executor.uses_process_pool:
+            comparison_cv_json = await self.cpu_executor.run(
+                self.comparison_cv_builder.create_comparison_cv_json,
+                original_cv,
+                ai_suggestions,
+                id_aliases,
+                heavy=True,
+            )
+            return ComparisonCV.model_validate_json(comparison_cv_json)
+        return await self.cpu_executor.run(
+            self.comparison_cv_builder.create_comparison_cv,
+            original_cv,
+            ai_suggestions,
+            id_aliases,
+        )
+
+    def preview_prompt(
+        self,
+        original_cv: CVBody,
+        job_description: JobDescriptionFields,
+        cv_string: Optional[str] = None,
+    ) -> PromptPreview:
+        """The prompt tailor_cv would send, without calling the model."""
+        fit = self._fit_cv_prompt(
+            original_cv,
+            job_description,
+            JOB_DESC_W_CV_PROMPT,
+            SUGGEST_IMPROVEMENTS_SYSTEM_PROMPT,
+            cv_string=cv_string,
+        )
+        return self._preview_prompt(fit, SUGGEST_IMPROVEMENTS_SYSTEM_PROMPT)
+
+    async def tailor_cv_batch(
+        self,
+        original_cv: CVBody,
+        job_descriptions: List[JobDescriptionFields],
+        max_concurrency: int,
+    ) -> AsyncIterator[Tuple[int, Union[ComparisonCV, Exception]]]:
+        """
+        Tailors one CV against many job descriptions, rendering the CV only once.
+        Yields (job index, result or error) pairs in completion order.
+        """
+        cv_string: str = await self.cpu_executor.run(
+            self.template_renderer.cv_to_llm_format, original_cv
+        )
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _tailor_one(
+            index: int, job_description: JobDescriptionFields
+        ) -> Tuple[int, Union[ComparisonCV, Exception]]:
+            async with semaphore:
+                try:
+                    comparison_cv = await self.tailor_cv(
+                        original_cv, job_description, cv_string=cv_string, heavy=True
+                    )
+                    return index, comparison_cv
+                except Exception as e:
+                    logger.error(f"Batch item {index} failed: {e}")
+                    return index, e
+
+        tasks = [
+            asyncio.create_task(_tailor_one(index, job_description))
+            for index, job_description in enumerate(job_descriptions)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def stream_tailor_cv(
+        self,
+        original_cv: CVBody,
+        job_description: JobDescriptionFields,
+        cv_string: Optional[str] = None,
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Streams the tailored CV as ('section', partial ComparisonCV fields) events,
+        one per completed section of the AI response, followed by a single
+        ('complete', {'response': ComparisonCV}) event built from the full response.
+        """
+        fit = await self.cpu_executor.run(
+            self._fit_cv_prompt,
+            original_cv,
+            job_description,
+            JOB_DESC_W_CV_PROMPT,
+            SUGGEST_IMPROVEMENTS_SYSTEM_PROMPT,
+            cv_string=cv_string,
+        )
+        prompt: str = fit.prompt
+        id_aliases = self.template_renderer.cv_id_aliases(fit.cv)
+        suggestion_config = self._get_suggest_improvements_config()
+        cache_key = make_cache_key(self.config.model_name, prompt, suggestion_config)
+
+        cached_response = self._get_cached_improvements(cache_key)
+        if cached_response is not None and cached_response.response is not None:
+            yield (
+                "complete",
+                {
+                    "response": await self._build_comparison_cv(
+                        original_cv,
+                        # Cached responses are validated when they are read.
+                        cast(RevisedCVResponseSchema, cached_response.response.parsed),
+                        id_aliases,
+                    )
+                },
+            )
+            return
+
+        parser = IncrementalJSONObjectParser()
+        try:
+            async for chunk in self._make_streaming_api_call(
+                prompt, suggestion_config, "CV improvements"
+            ):
+                for event in parser.feed(chunk.text or ""):
+                    partial_cv = (
+                        self.comparison_cv_builder.create_partial_comparison_cv(
+                            original_cv, event, id_aliases
+                        )
+                    )
+                    if partial_cv:
+                        yield "section", partial_cv
+        except CircuitOpenError as e:
+            logger.warning(f"Skipping CV improvements: {e}")
+            yield (
+                "complete",
+                {
+                    "response": await self._build_comparison_cv(
+                        original_cv, self.ai_suggestions_with_error
+                    )
+                },
+            )
+            return
+
+        try:
+            ai_suggestions = await self.cpu_executor.run(
+                RevisedCVResponseSchema.model_validate_json, parser.buffer
+            )
+            if self.response_cache is not None:
+                self.response_cache.set(cache_key, ai_suggestions.model_dump_json())
+        except ValidationError as e:
+            logger.error(f"Failed to parse streamed LLM response: {e}")
+            ai_suggestions = self.ai_suggestions_with_error
+
+        comparison_cv: ComparisonCV = await self._build_comparison_cv(
+            original_cv, ai_suggestions, id_aliases
         )
+        yield "complete", {"response": comparison_cv}
 
 
 cv_tailor_service = CVTailorService()
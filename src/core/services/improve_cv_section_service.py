@@ -1,11 +1,26 @@
 from enum import Enum
+from typing import AsyncIterator, Dict, List, Tuple, Type
 
-from google.genai.types import GenerateContentConfig
+from google.genai import errors
+from google.genai.types import GenerateContentConfig, GenerateContentResponse
 from loguru import logger
 
-from src.core.ai.helpers import format_prompt, get_token_usage_metadata
-from src.core.ai.prompts import CV_SECTION_PROMPT, REWRITE_CV_SECTION_SYSTEM_PROMPT
+from src.core.ai.generation_config import StructuredGenerateContentConfig
+from src.core.ai.helpers import (
+    format_prompt,
+    get_token_usage_metadata,
+    postprocess_text_response,
+)
+from src.core.ai.prompts import (
+    CV_SECTION_ITEM_PROMPT,
+    CV_SECTION_PROMPT,
+    REWRITE_CV_SECTION_SYSTEM_PROMPT,
+    REWRITE_CV_SECTIONS_SYSTEM_PROMPT,
+)
+from src.core.config import settings
+from src.core.models.revised_cv_fields import RevisedCVSectionsResponseSchema
 from src.core.services.base_service import BaseAIService, BaseServiceConfig
+from src.core.utils.exceptions import ResponseParsingError
 
 
 class Instruction(str, Enum):
@@ -17,19 +32,55 @@ class Instruction(str, Enum):
 
 class ImproveCVSectionServiceConfig(BaseServiceConfig):
     max_output_tokens: int = 512
+    model_cascade: List[str] = [settings.LITE_MODEL_NAME, settings.MODEL_NAME]
+    max_output_tokens_per_section: int = 256
+    max_batch_output_tokens: int = 8192
 
 
 class ImproveCVSectionService(BaseAIService):
+    retriable_errors: Tuple[Type[BaseException], ...] = (
+        errors.ServerError,
+        ResponseParsingError,
+    )
+    config: ImproveCVSectionServiceConfig
+
     def __init__(self):
         super().__init__(ImproveCVSectionServiceConfig())
+        self.generation_configs.register(
+            "cv_section_improvements", self._build_cv_section_improvements_config
+        )
+        self.generation_configs.register(
+            "cv_sections_improvements",
+            self._build_cv_sections_improvements_config,
+            eager=False,
+        )
 
-    def _get_cv_section_improvements_config(self) -> GenerateContentConfig:
-        suggestion_config = GenerateContentConfig(
+    def _build_cv_section_improvements_config(self) -> GenerateContentConfig:
+        return GenerateContentConfig(
             max_output_tokens=self.config.max_output_tokens,
             system_instruction=REWRITE_CV_SECTION_SYSTEM_PROMPT,
         )
-        logger.info(f"Suggestion config: generated")
-        return suggestion_config
+
+    def _build_cv_sections_improvements_config(
+        self, sections_count: int
+    ) -> GenerateContentConfig:
+        return GenerateContentConfig(
+            max_output_tokens=min(
+                self.config.max_output_tokens_per_section * sections_count,
+                self.config.max_batch_output_tokens,
+            ),
+            system_instruction=REWRITE_CV_SECTIONS_SYSTEM_PROMPT,
+            response_mime_type="application/json",
+            response_schema=RevisedCVSectionsResponseSchema,
+        )
+
+    def _get_cv_section_improvements_config(self) -> StructuredGenerateContentConfig:
+        return self.generation_configs.get("cv_section_improvements")
+
+    def _get_cv_sections_improvements_config(
+        self, sections_count: int
+    ) -> StructuredGenerateContentConfig:
+        return self.generation_configs.get("cv_sections_improvements", sections_count)
 
     async def get_cv_section_improvements(
         self, cv_section: str, instruction: Instruction
@@ -45,16 +96,83 @@ class ImproveCVSectionService(BaseAIService):
 
             logger.info("Prompt: generated")
 
-            response = await self._make_api_call(
-                prompt, suggestion_config, "CV section improvements"
+            return await self._make_cascading_api_call(
+                "CV section improvements",
+                lambda model_name: self._make_api_call(
+                    prompt, suggestion_config, "CV section improvements", model_name
+                ),
+                self._extract_text_response,
             )
 
+        return await _get_improvements()
+
+    async def get_cv_sections_improvements(
+        self, sections: List[Tuple[str, Instruction]]
+    ) -> List[str]:
+        """
+        Rewrites several CV sections in a single structured-output call.
+        Returns the revised texts in the order of the input sections.
+        """
+        retry_decorator = self._create_retry_decorator()
+        prompt: str = "".join(
+            format_prompt(
+                CV_SECTION_ITEM_PROMPT,
+                index=index,
+                text=cv_section,
+                instruction=instruction.value,
+            )
+            for index, (cv_section, instruction) in enumerate(sections)
+        )
+        sections_config = self._get_cv_sections_improvements_config(len(sections))
+
+        def _validate(response: GenerateContentResponse) -> List[str]:
             metadata = get_token_usage_metadata(response)
             logger.info(f"Metadata: {metadata}")
 
-            return self._extract_text_response(response)
+            parsed = response.parsed
+            if not isinstance(parsed, RevisedCVSectionsResponseSchema):
+                logger.error("LLM response could not be parsed or was empty.")
+                logger.info(f"LLM response: {response}")
+                raise ResponseParsingError(
+                    "LLM response could not be parsed or was empty."
+                )
+
+            revised_by_index: Dict[int, str] = {
+                section.index: postprocess_text_response(section.revised_text)
+                for section in parsed.sections
+            }
+            missing = [i for i in range(len(sections)) if not revised_by_index.get(i)]
+            if missing:
+                logger.error(f"LLM response is missing sections: {missing}")
+                raise ResponseParsingError(
+                    f"LLM response is missing sections: {missing}"
+                )
+            return [revised_by_index[i] for i in range(len(sections))]
+
+        @retry_decorator
+        async def _get_improvements() -> List[str]:
+            return await self._make_cascading_api_call(
+                "CV sections improvements",
+                lambda model_name: self._make_api_call(
+                    prompt, sections_config, "CV sections improvements", model_name
+                ),
+                _validate,
+            )
 
         return await _get_improvements()
 
+    async def stream_cv_section_improvements(
+        self, cv_section: str, instruction: Instruction
+    ) -> AsyncIterator[str]:
+        prompt: str = format_prompt(
+            CV_SECTION_PROMPT, text=cv_section, instruction=instruction.value
+        )
+        async for text in self._stream_text_response(
+            prompt,
+            self._get_cv_section_improvements_config(),
+            "CV section improvements",
+        ):
+            yield text
+
 
 improve_cv_section_service = ImproveCVSectionService()
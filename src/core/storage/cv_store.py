@@ -0,0 +1,177 @@
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+from uuid import uuid4
+
+from loguru import logger
+from pydantic import BaseModel
+
+from src.core.models.input_cv_fields import CVBody
+from src.core.utils.exceptions import CVNotFoundError, CVPreconditionFailedError
+
+
+def cv_content_hash(cv: CVBody) -> str:
+    return hashlib.sha256(cv.model_dump_json().encode("utf-8")).hexdigest()
+
+
+class StoredCV(BaseModel):
+    cv_id: str
+    version: int
+    content_hash: str
+    cv: CVBody
+    cv_string: str
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.content_hash}"'
+
+    def matches(self, etag: str) -> bool:
+        """Whether etag (quoted, weak or bare, or '*') names this version."""
+        etag = etag.strip()
+        if etag == "*":
+            return True
+        return etag.removeprefix("W/").strip('"') == self.content_hash
+
+
+class CVStore:
+    """
+    Validated CVs kept with their LLM format and content hash, so requests can
+    refer to a CV by ID instead of uploading, validating and rendering it again.
+    SQLite holds every CV, in memory unless sqlite_path names a file; the parsed
+    CVs most recently used are kept in an in-memory LRU, and CVs read from SQLite
+    are validated once and promoted.
+    """
+
+    def __init__(
+        self,
+        render_cv: Callable[[CVBody], str],
+        sqlite_path: Optional[str] = None,
+        max_entries: int = 1024,
+    ):
+        self.render_cv = render_cv
+        self.max_entries = max_entries
+        self._memory: OrderedDict[str, StoredCV] = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+
+        sqlite_path = sqlite_path or ":memory:"
+        self._db = sqlite3.connect(sqlite_path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS cvs ("
+            "cv_id TEXT PRIMARY KEY, version INTEGER NOT NULL, "
+            "content_hash TEXT NOT NULL, cv_json TEXT NOT NULL, "
+            "cv_string TEXT NOT NULL, updated_at REAL NOT NULL)"
+        )
+        self._db.commit()
+        logger.info(f"CV store SQLite database: {sqlite_path}")
+
+    def create(self, cv: CVBody) -> StoredCV:
+        stored = self._stored_cv(uuid4().hex, 1, cv, cv_content_hash(cv))
+        with self._lock:
+            self._write(stored)
+        return stored
+
+    def update(
+        self, cv_id: str, cv: CVBody, if_match: Optional[str] = None
+    ) -> StoredCV:
+        """
+        Replaces the CV, raising CVPreconditionFailedError when if_match names
+        another version. An unchanged CV keeps its version.
+        """
+        content_hash = cv_content_hash(cv)
+        with self._lock:
+            current = self.get_matching(cv_id, if_match)
+            if content_hash == current.content_hash:
+                return current
+            stored = self._stored_cv(cv_id, current.version + 1, cv, content_hash)
+            self._write(stored)
+        return stored
+
+    def get(self, cv_id: str) -> Optional[StoredCV]:
+        with self._lock:
+            stored = self._memory.get(cv_id)
+            if stored is not None:
+                self._memory.move_to_end(cv_id)
+                self.hits += 1
+                self.memory_hits += 1
+                return stored
+
+            row = self._db.execute(
+                "SELECT version, content_hash, cv_json, cv_string FROM cvs "
+                "WHERE cv_id = ?",
+                (cv_id,),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            version, content_hash, cv_json, cv_string = row
+            stored = StoredCV(
+                cv_id=cv_id,
+                version=version,
+                content_hash=content_hash,
+                cv=CVBody.model_validate_json(cv_json),
+                cv_string=cv_string,
+            )
+            self._store_in_memory(stored)
+            self.hits += 1
+            self.disk_hits += 1
+            return stored
+
+    def get_matching(self, cv_id: str, etag: Optional[str] = None) -> StoredCV:
+        """The stored CV, checked against etag when one is given."""
+        stored = self.get(cv_id)
+        if stored is None:
+            raise CVNotFoundError(cv_id)
+        if etag is not None and not stored.matches(etag):
+            raise CVPreconditionFailedError(cv_id, stored.etag)
+        return stored
+
+    def _stored_cv(
+        self, cv_id: str, version: int, cv: CVBody, content_hash: str
+    ) -> StoredCV:
+        return StoredCV(
+            cv_id=cv_id,
+            version=version,
+            content_hash=content_hash,
+            cv=cv,
+            cv_string=self.render_cv(cv),
+        )
+
+    def _write(self, stored: StoredCV) -> None:
+        self._db.execute(
+            "INSERT OR REPLACE INTO cvs "
+            "(cv_id, version, content_hash, cv_json, cv_string, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                stored.cv_id,
+                stored.version,
+                stored.content_hash,
+                stored.cv.model_dump_json(),
+                stored.cv_string,
+                time.time(),
+            ),
+        )
+        self._db.commit()
+        self._store_in_memory(stored)
+
+    def _store_in_memory(self, stored: StoredCV) -> None:
+        self._memory[stored.cv_id] = stored
+        self._memory.move_to_end(stored.cv_id)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "memory_entries": len(self._memory),
+        }
@@ -1,100 +1,89 @@
-CV_TEMPLATE_LLM_MD = """
-{% set name = cv.header.full_name %}
-{% set title = cv.header.professional_title %}
+# The LLM format is rendered per section so each fragment can be memoized on
+# its own; TemplateLLMRenderer joins the fragments in this order.
 
-# {{ name }}
-## {{ title }}
+CV_LLM_HEADER_MD = """
+# {{ header.full_name }}
+## {{ header.professional_title }}
+"""
 
+CV_LLM_SUMMARY_MD = """
 ## Professional Summary
-{{ cv.professional_summary.summary }}
+{{ professional_summary.summary }}
 
 ### Highlights
-{% for highlight in cv.professional_summary.highlights %}
+{% for highlight in professional_summary.highlights %}
 * {{ highlight }}
 {% endfor %}
+"""
 
-{% if cv.skills %}
+CV_LLM_SKILLS_MD = """
 ## Skills
-{% for skill in cv.skills %}
+{% for skill in skills %}
 ### {{ skill.name }} {% if skill.level %}({{ skill.level.value }}){% endif %}
 {{ ', '.join(skill.keywords) }}
 {% endfor %}
-{% endif %}
+"""
 
-{% if cv.work_experience %}
-## Work Experience
-{% for work_item in cv.work_experience %}
+CV_LLM_WORK_ITEM_MD = """
 ### {{ work_item.company_name }}
-ID: {{ work_item.id }}
+ID: {{ alias }}
 
 {{ work_item.summary }}
 
 {% for highlight in work_item.highlights %}
 * {{ highlight }}
 {% endfor %}
-{% endfor %}
-{% endif %}
+"""
 
-{% if cv.projects %}
-## Projects
-{% for project_item in cv.projects %}
+CV_LLM_PROJECT_ITEM_MD = """
 ### {{ project_item.name }}
-ID: {{ project_item.id }}
+ID: {{ alias }}
 
 {{ project_item.summary }}
 
 {% for highlight in project_item.highlights %}
 * {{ highlight }}
 {% endfor %}
-{% endfor %}
-{% endif %}
+"""
 
-{% if cv.education %}
+CV_LLM_EDUCATION_MD = """
 ## Education
-{% for education_item in cv.education %}
+{% for education_item in education %}
 ### {{ education_item.institution }}
 **Area:** {{ education_item.area }} | **Type:** {{ education_item.study_type.value }}
 **Score:** {{ education_item.score }}
 **Courses:** {{ ', '.join(education_item.courses) }}
 {% endfor %}
-{% endif %}
+"""
 
-{% if cv.awards %}
-## Awards
-{% for award_item in cv.awards %}
+CV_LLM_AWARD_ITEM_MD = """
 ### {{ award_item.title }}
-ID: {{ award_item.id }}
+ID: {{ alias }}
 
 **Awarder:** {{ award_item.awarder_by }}
 {{ award_item.summary }}
-{% endfor %}
-{% endif %}
+"""
 
-{% if cv.certificates %}
+CV_LLM_CERTIFICATES_MD = """
 ## Certificates
-{% for certificate_item in cv.certificates %}
+{% for certificate_item in certificates %}
 ### {{ certificate_item.name }}
 **Issuer:** {{ certificate_item.issuer }}
 {% endfor %}
-{% endif %}
+"""
 
-{% if cv.publications %}
-## Publications
-{% for publication_item in cv.publications %}
+CV_LLM_PUBLICATION_ITEM_MD = """
 ### {{ publication_item.name }}
-ID: {{ publication_item.id }}
+ID: {{ alias }}
 
 **Publisher:** {{ publication_item.publisher }}
 {{ publication_item.summary }}
-{% endfor %}
-{% endif %}
+"""
 
-{% if cv.languages %}
+CV_LLM_LANGUAGES_MD = """
 ## Languages
-{% for language_item in cv.languages %}
+{% for language_item in languages %}
 ### {{ language_item.language }}
 **Fluency:** {{ language_item.fluency.value }}
 {% endfor %}
-{% endif %}
-
 """
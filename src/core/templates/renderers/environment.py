@@ -0,0 +1,94 @@
+import os
+from typing import Any, Dict, Optional
+
+from jinja2 import (
+    BytecodeCache,
+    DictLoader,
+    Environment,
+    FileSystemBytecodeCache,
+    Template,
+)
+
+from src.core.config import settings
+from src.core.templates.html_cv_template import CV_TEMPLATE_HTML
+from src.core.templates.md_cv_template import CV_TEMPLATE_MD
+from src.core.templates.md_cv_template_to_llm import (
+    CV_LLM_AWARD_ITEM_MD,
+    CV_LLM_CERTIFICATES_MD,
+    CV_LLM_EDUCATION_MD,
+    CV_LLM_HEADER_MD,
+    CV_LLM_LANGUAGES_MD,
+    CV_LLM_PROJECT_ITEM_MD,
+    CV_LLM_PUBLICATION_ITEM_MD,
+    CV_LLM_SKILLS_MD,
+    CV_LLM_SUMMARY_MD,
+    CV_LLM_WORK_ITEM_MD,
+)
+from src.core.templates.md_job_description_template import JOB_DESCRIPTION_TEMPLATE_MD
+from src.core.templates.md_revised_cv_template import REVISED_CV_TEMPLATE_MD
+
+CV_LLM_HEADER_TEMPLATE = "cv_llm/header.md"
+CV_LLM_SUMMARY_TEMPLATE = "cv_llm/summary.md"
+CV_LLM_SKILLS_TEMPLATE = "cv_llm/skills.md"
+CV_LLM_WORK_ITEM_TEMPLATE = "cv_llm/work_item.md"
+CV_LLM_PROJECT_ITEM_TEMPLATE = "cv_llm/project_item.md"
+CV_LLM_EDUCATION_TEMPLATE = "cv_llm/education.md"
+CV_LLM_AWARD_ITEM_TEMPLATE = "cv_llm/award_item.md"
+CV_LLM_CERTIFICATES_TEMPLATE = "cv_llm/certificates.md"
+CV_LLM_PUBLICATION_ITEM_TEMPLATE = "cv_llm/publication_item.md"
+CV_LLM_LANGUAGES_TEMPLATE = "cv_llm/languages.md"
+JOB_DESCRIPTION_TEMPLATE = "job_description.md"
+CV_MD_TEMPLATE = "cv.md"
+CV_HTML_TEMPLATE = "cv.html"
+REVISED_CV_MD_TEMPLATE = "revised_cv.md"
+
+TEMPLATE_SOURCES: Dict[str, str] = {
+    CV_LLM_HEADER_TEMPLATE: CV_LLM_HEADER_MD,
+    CV_LLM_SUMMARY_TEMPLATE: CV_LLM_SUMMARY_MD,
+    CV_LLM_SKILLS_TEMPLATE: CV_LLM_SKILLS_MD,
+    CV_LLM_WORK_ITEM_TEMPLATE: CV_LLM_WORK_ITEM_MD,
+    CV_LLM_PROJECT_ITEM_TEMPLATE: CV_LLM_PROJECT_ITEM_MD,
+    CV_LLM_EDUCATION_TEMPLATE: CV_LLM_EDUCATION_MD,
+    CV_LLM_AWARD_ITEM_TEMPLATE: CV_LLM_AWARD_ITEM_MD,
+    CV_LLM_CERTIFICATES_TEMPLATE: CV_LLM_CERTIFICATES_MD,
+    CV_LLM_PUBLICATION_ITEM_TEMPLATE: CV_LLM_PUBLICATION_ITEM_MD,
+    CV_LLM_LANGUAGES_TEMPLATE: CV_LLM_LANGUAGES_MD,
+    JOB_DESCRIPTION_TEMPLATE: JOB_DESCRIPTION_TEMPLATE_MD,
+    CV_MD_TEMPLATE: CV_TEMPLATE_MD,
+    CV_HTML_TEMPLATE: CV_TEMPLATE_HTML,
+    REVISED_CV_MD_TEMPLATE: REVISED_CV_TEMPLATE_MD,
+}
+
+
+def create_environment(bytecode_cache_dir: Optional[str] = None) -> Environment:
+    """
+    Jinja environment over the built-in templates. The sources never change at
+    runtime, so up-to-date checks are off; the optional bytecode cache only saves
+    compilation on the next process start.
+    """
+    bytecode_cache: Optional[BytecodeCache] = None
+    if bytecode_cache_dir:
+        os.makedirs(bytecode_cache_dir, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(bytecode_cache_dir)
+    return Environment(
+        loader=DictLoader(TEMPLATE_SOURCES),
+        bytecode_cache=bytecode_cache,
+        auto_reload=False,
+    )
+
+
+template_environment: Environment = create_environment(
+    settings.TEMPLATE_BYTECODE_CACHE_DIR
+)
+_compiled_templates: Dict[str, Template] = {
+    name: template_environment.get_template(name) for name in TEMPLATE_SOURCES
+}
+
+
+def get_template(name: str) -> Template:
+    """Returns a template compiled once at import time."""
+    return _compiled_templates[name]
+
+
+def render_template(name: str, **context: Any) -> str:
+    return _compiled_templates[name].render(**context)
@@ -1,25 +1,168 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from loguru import logger
+from pydantic import BaseModel
+
+from src.core.config import settings
 from src.core.models.input_cv_fields import CVBody
 from src.core.models.job_description_fields import JobDescriptionFields
-from src.core.templates.md_cv_template_to_llm import CV_TEMPLATE_LLM_MD
-from loguru import logger
-from jinja2 import Template
+from src.core.templates.renderers.environment import (
+    CV_LLM_AWARD_ITEM_TEMPLATE,
+    CV_LLM_CERTIFICATES_TEMPLATE,
+    CV_LLM_EDUCATION_TEMPLATE,
+    CV_LLM_HEADER_TEMPLATE,
+    CV_LLM_LANGUAGES_TEMPLATE,
+    CV_LLM_PROJECT_ITEM_TEMPLATE,
+    CV_LLM_PUBLICATION_ITEM_TEMPLATE,
+    CV_LLM_SKILLS_TEMPLATE,
+    CV_LLM_SUMMARY_TEMPLATE,
+    CV_LLM_WORK_ITEM_TEMPLATE,
+    JOB_DESCRIPTION_TEMPLATE,
+    render_template,
+)
+
+
+ID_ALIAS_PREFIXES: Dict[str, str] = {
+    "work_experience": "W",
+    "projects": "P",
+    "awards": "A",
+    "publications": "PB",
+}
+
+# CV sections in rendering order. Item sections are rendered one fragment per
+# item under a "## <heading>" line; the others are a single fragment.
+# (section, template, item variable name, heading)
+LLM_CV_SECTIONS: List[Tuple[str, str, Optional[str], Optional[str]]] = [
+    ("header", CV_LLM_HEADER_TEMPLATE, None, None),
+    ("professional_summary", CV_LLM_SUMMARY_TEMPLATE, None, None),
+    ("skills", CV_LLM_SKILLS_TEMPLATE, None, None),
+    ("work_experience", CV_LLM_WORK_ITEM_TEMPLATE, "work_item", "Work Experience"),
+    ("projects", CV_LLM_PROJECT_ITEM_TEMPLATE, "project_item", "Projects"),
+    ("education", CV_LLM_EDUCATION_TEMPLATE, None, None),
+    ("awards", CV_LLM_AWARD_ITEM_TEMPLATE, "award_item", "Awards"),
+    ("certificates", CV_LLM_CERTIFICATES_TEMPLATE, None, None),
+    (
+        "publications",
+        CV_LLM_PUBLICATION_ITEM_TEMPLATE,
+        "publication_item",
+        "Publications",
+    ),
+    ("languages", CV_LLM_LANGUAGES_TEMPLATE, None, None),
+]
+
+
+def _content_hash(template_name: str, context: Dict[str, Any]) -> bytes:
+    parts: List[bytes] = [template_name.encode("utf-8")]
+    for name, value in sorted(context.items()):
+        parts.append(name.encode("utf-8"))
+        for part in value if isinstance(value, list) else [value]:
+            if isinstance(part, BaseModel):
+                parts.append(part.__pydantic_serializer__.to_json(part))
+            else:
+                parts.append(repr(part).encode("utf-8"))
+    return hashlib.blake2b(b"\0".join(parts), digest_size=16).digest()
+
 
-from src.core.templates.md_job_description_template import JOB_DESCRIPTION_TEMPLATE_MD
+class FragmentCache:
+    """
+    Bounded LRU of rendered template fragments keyed by a content hash of the
+    template name and its context, so an unchanged submodel is never re-rendered.
+    max_entries=0 disables memoization.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 4096,
+        render: Callable[..., str] = render_template,
+    ):
+        self.max_entries = max_entries
+        self._render = render
+        self._fragments: OrderedDict[bytes, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, template_name: str, **context: Any) -> str:
+        if self.max_entries <= 0:
+            return self._render(template_name, **context)
+
+        key = _content_hash(template_name, context)
+        with self._lock:
+            fragment = self._fragments.get(key)
+            if fragment is not None:
+                self._fragments.move_to_end(key)
+                self.hits += 1
+                return fragment
+            self.misses += 1
+
+        fragment = self._render(template_name, **context)
+        with self._lock:
+            self._fragments[key] = fragment
+            self._fragments.move_to_end(key)
+            while len(self._fragments) > self.max_entries:
+                self._fragments.popitem(last=False)
+        return fragment
+
+    def clear(self) -> None:
+        with self._lock:
+            self._fragments.clear()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._fragments),
+        }
+
+
+fragment_cache = FragmentCache(settings.TEMPLATE_FRAGMENT_CACHE_MAX_ENTRIES)
 
 
 class TemplateLLMRenderer:
     @staticmethod
-    def cv_to_llm_format(cv: CVBody) -> str:
-        """Transform CV to LLM-readable format"""
-        cv_template = Template(CV_TEMPLATE_LLM_MD)
-        rendered_cv = cv_template.render(cv=cv)
+    def cv_id_aliases(cv: CVBody) -> Dict[str, str]:
+        """Short aliases (W1, P2, ...) used for item IDs in the LLM format, mapped to the original IDs"""
+        id_aliases: Dict[str, str] = {}
+        for section, prefix in ID_ALIAS_PREFIXES.items():
+            for index, item in enumerate(getattr(cv, section) or [], start=1):
+                id_aliases[f"{prefix}{index}"] = item.id
+        return id_aliases
+
+    @staticmethod
+    def cv_to_llm_format(cv: CVBody, cache: Optional[FragmentCache] = None) -> str:
+        """Transform CV to LLM-readable format, one memoized fragment per section or item"""
+        cache = cache if cache is not None else fragment_cache
+        fragments: List[str] = []
+        for section, template_name, item_name, heading in LLM_CV_SECTIONS:
+            value = getattr(cv, section)
+            if not value:
+                continue
+            if item_name is None:
+                fragments.append(cache.render(template_name, **{section: value}))
+                continue
+            fragments.append(f"## {heading}")
+            prefix = ID_ALIAS_PREFIXES[section]
+            for index, item in enumerate(value, start=1):
+                fragments.append(
+                    cache.render(
+                        template_name, **{item_name: item, "alias": f"{prefix}{index}"}
+                    )
+                )
+        rendered_cv = "\n\n".join(fragments) + "\n"
         logger.info(f"CV for LLM content: {rendered_cv[:100]}")
         return rendered_cv
 
     @staticmethod
     def job_description_to_llm_format(job_description: JobDescriptionFields) -> str:
         """Transform job description to LLM-readable format"""
-        job_description_template = Template(JOB_DESCRIPTION_TEMPLATE_MD)
-        rendered_job_description = job_description_template.render(job_description_data=job_description)
-        logger.info(f"Job description for LLM content: {rendered_job_description[:100]}")
+        rendered_job_description = render_template(
+            JOB_DESCRIPTION_TEMPLATE, job_description_data=job_description
+        )
+        logger.info(
+            f"Job description for LLM content: {rendered_job_description[:100]}"
+        )
         return rendered_job_description
@@ -35,3 +35,60 @@ class InvalidAPIKeyError(APIKeyError):
     """
 
     pass
+
+
+class CircuitOpenError(Exception):
+    """
+    Custom exception for calls rejected while the circuit breaker is open.
+    """
+
+    def __init__(self, retry_after: float):
+        super().__init__(
+            f"Gemini API is temporarily unavailable. Retry after {retry_after:.0f}s."
+        )
+        self.retry_after = retry_after
+
+
+class DeadlineExceededError(Exception):
+    """
+    Custom exception for calls that cannot finish before the request deadline.
+    """
+
+    pass
+
+
+class ResponseTruncatedError(ResponseParsingError):
+    """
+    Custom exception for LLM responses cut off by the output token limit.
+    """
+
+    pass
+
+
+class CVPatchError(Exception):
+    """
+    Custom exception for JSON Patch operations that cannot be applied to a CV.
+    """
+
+    pass
+
+
+class CVNotFoundError(Exception):
+    """
+    Custom exception for CV IDs that are not in the CV store.
+    """
+
+    def __init__(self, cv_id: str):
+        super().__init__(f"CV '{cv_id}' not found.")
+        self.cv_id = cv_id
+
+
+class CVPreconditionFailedError(Exception):
+    """
+    Custom exception for stored CVs whose ETag does not match the one expected.
+    """
+
+    def __init__(self, cv_id: str, etag: str):
+        super().__init__(f"CV '{cv_id}' has changed, its current ETag is {etag}.")
+        self.cv_id = cv_id
+        self.etag = etag
@@ -0,0 +1,95 @@
+import time
+
+import pytest
+
+from src.core.ai.circuit_breaker import CircuitBreaker, CircuitState
+from src.core.utils.exceptions import CircuitOpenError, DeadlineExceededError
+
+
+def _open_breaker() -> CircuitBreaker:
+    breaker = CircuitBreaker(window_size=4, min_calls=4, open_seconds=30)
+    for _ in range(2):
+        breaker.record_success(0.1)
+    for _ in range(2):
+        breaker.record_failure()
+    return breaker
+
+
+class TestCircuitBreaker:
+    def test_stays_closed_below_min_calls(self):
+        breaker = CircuitBreaker(min_calls=4)
+        for _ in range(3):
+            breaker.record_failure()
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_opens_on_failure_rate_and_rejects_calls(self):
+        breaker = _open_breaker()
+        assert breaker.state == CircuitState.OPEN
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.before_call()
+        assert 0 < exc_info.value.retry_after <= 30
+        assert breaker.stats["rejected"] == 1
+
+    def test_opens_on_slow_call_rate(self):
+        breaker = CircuitBreaker(
+            window_size=2, min_calls=2, slow_call_seconds=1, slow_call_rate_threshold=1
+        )
+        breaker.record_success(2)
+        breaker.record_success(3)
+        assert breaker.state == CircuitState.OPEN
+
+    def test_half_open_probe_closes_on_success(self):
+        breaker = _open_breaker()
+        breaker._opened_at = time.monotonic() - 31
+        assert breaker.state == CircuitState.HALF_OPEN
+
+        breaker.before_call()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+        breaker.record_success(0.1)
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_half_open_probe_failure_reopens(self):
+        breaker = _open_breaker()
+        breaker._opened_at = time.monotonic() - 31
+        with pytest.raises(RuntimeError):
+            with breaker.guard():
+                raise RuntimeError("still down")
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.stats["times_opened"] == 2
+
+    def test_non_failures_are_not_recorded(self):
+        breaker = CircuitBreaker(window_size=2, min_calls=2, is_failure=lambda e: False)
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                with breaker.guard():
+                    raise ValueError("bad request")
+        breaker.record_failure()
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_non_failure_frees_the_half_open_probe(self):
+        breaker = _open_breaker()
+        breaker.is_failure = lambda e: False
+        breaker._opened_at = time.monotonic() - 31
+        with pytest.raises(ValueError):
+            with breaker.guard():
+                raise ValueError("bad request")
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.retry_after() == 0
+
+    def test_deadline_counts_only_when_slow(self):
+        for slow_call_seconds, expected_state in (
+            (0, CircuitState.OPEN),
+            (30, CircuitState.CLOSED),
+        ):
+            breaker = CircuitBreaker(
+                window_size=1,
+                min_calls=1,
+                slow_call_seconds=slow_call_seconds,
+                slow_call_rate_threshold=1,
+                is_failure=lambda e: False,
+            )
+            with pytest.raises(DeadlineExceededError):
+                with breaker.guard():
+                    raise DeadlineExceededError("deadline")
+            assert breaker.state == expected_state
@@ -0,0 +1,124 @@
+import asyncio
+import time
+
+from src.core.ai.circuit_breaker import CircuitBreaker
+from src.core.ai.context_cache import ContextCacheManager, LocalContextCacheBackend
+from src.core.ai.deadline import set_deadline
+
+LONG_CV = "Experienced engineer. " * 100
+
+
+def _manager(**kwargs) -> ContextCacheManager:
+    kwargs.setdefault("min_tokens", 10)
+    return ContextCacheManager(LocalContextCacheBackend(), **kwargs)
+
+
+class TestContextCacheManager:
+    def test_reuses_cached_content_for_same_cv(self):
+        manager = _manager()
+
+        async def main():
+            first = await manager.get_or_create("model", "system", LONG_CV)
+            second = await manager.get_or_create("model", "system", LONG_CV)
+            return first, second
+
+        first, second = asyncio.run(main())
+        assert first is not None and first == second
+        assert manager.stats["misses"] == 1
+        assert manager.stats["hits"] == 1
+
+    def test_short_content_is_not_cached(self):
+        manager = _manager(min_tokens=10_000)
+        assert asyncio.run(manager.get_or_create("model", "system", "short")) is None
+        assert manager.stats["skipped"] == 1
+
+    def test_entries_close_to_expiry_are_recreated(self):
+        manager = _manager(ttl_seconds=30, refresh_margin_seconds=60)
+
+        async def main():
+            first = await manager.get_or_create("model", "system", LONG_CV)
+            second = await manager.get_or_create("model", "system", LONG_CV)
+            return first, second
+
+        first, second = asyncio.run(main())
+        assert first != second
+        assert manager.stats["misses"] == 2
+
+    def test_evicts_least_recently_used_upstream(self):
+        manager = _manager(max_entries=1)
+
+        async def main():
+            first = await manager.get_or_create("model", "system", LONG_CV)
+            await manager.get_or_create("model", "system", LONG_CV + "Other CV")
+            return first
+
+        first = asyncio.run(main())
+        assert first not in manager.backend.contents
+        assert len(manager.backend.contents) == 1
+
+    def test_concurrent_requests_create_once(self):
+        manager = _manager()
+
+        async def main():
+            return await asyncio.gather(
+                *(manager.get_or_create("model", "system", LONG_CV) for _ in range(5))
+            )
+
+        names = asyncio.run(main())
+        assert len(set(names)) == 1
+        assert len(manager.backend.contents) == 1
+
+    def test_backend_failure_falls_back_to_no_cache(self):
+        manager = _manager()
+
+        async def failing_create(*args):
+            raise RuntimeError("quota exceeded")
+
+        manager.backend.create = failing_create
+        assert asyncio.run(manager.get_or_create("model", "system", LONG_CV)) is None
+        assert manager.stats["errors"] == 1
+
+    def test_failed_creation_is_not_retried_until_it_expires(self):
+        calls = 0
+
+        async def failing_create(*args):
+            nonlocal calls
+            calls += 1
+            raise RuntimeError("content too small")
+
+        for failure_ttl_seconds, expected_calls in ((30, 1), (0, 3)):
+            calls = 0
+            manager = _manager(failure_ttl_seconds=failure_ttl_seconds)
+            manager.backend.create = failing_create
+            for _ in range(3):
+                assert (
+                    asyncio.run(manager.get_or_create("model", "system", LONG_CV))
+                    is None
+                )
+            assert calls == expected_calls
+            assert manager.stats["skipped"] == 3 - expected_calls
+
+    def test_slow_creation_is_bounded_by_the_deadline(self):
+        manager = _manager(create_timeout_seconds=5)
+
+        async def slow_create(*args):
+            await asyncio.sleep(5)
+
+        manager.backend.create = slow_create
+
+        async def main():
+            set_deadline(0.1)
+            started = time.monotonic()
+            name = await manager.get_or_create("model", "system", LONG_CV)
+            return name, time.monotonic() - started
+
+        name, elapsed = asyncio.run(main())
+        assert name is None and elapsed < 1
+        assert manager.stats["errors"] == 1
+
+    def test_open_circuit_skips_creation(self):
+        breaker = CircuitBreaker(min_calls=1)
+        breaker.record_failure()
+        manager = _manager(circuit_breaker=breaker)
+        assert asyncio.run(manager.get_or_create("model", "system", LONG_CV)) is None
+        assert not manager.backend.contents
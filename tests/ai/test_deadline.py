@@ -0,0 +1,126 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from tenacity import RetryCallState, Retrying
+
+from src.app.api.v1.streaming import events_to_sse
+from src.core.ai.deadline import (
+    attempt_timeout,
+    remaining_time,
+    set_deadline,
+    stop_before_deadline,
+)
+from src.core.services.improve_cv_section_service import (
+    ImproveCVSectionService,
+    Instruction,
+)
+from src.core.utils.exceptions import DeadlineExceededError
+
+
+def _retry_state(upcoming_sleep: float) -> RetryCallState:
+    retry_state = RetryCallState(Retrying(), None, (), {})
+    retry_state.upcoming_sleep = upcoming_sleep
+    return retry_state
+
+
+class TestDeadline:
+    def test_no_deadline_by_default(self):
+        async def main():
+            return remaining_time(), attempt_timeout(30)
+
+        assert asyncio.run(main()) == (None, 30)
+
+    def test_attempt_timeout_is_clipped_to_remaining_time(self):
+        async def main():
+            set_deadline(5)
+            return attempt_timeout(30)
+
+        assert 4 < asyncio.run(main()) <= 5
+
+    def test_attempt_without_enough_time_is_not_started(self):
+        async def main():
+            set_deadline(0.5)
+            return attempt_timeout(30, min_attempt_seconds=1)
+
+        with pytest.raises(DeadlineExceededError):
+            asyncio.run(main())
+
+    def test_stop_before_deadline_accounts_for_upcoming_sleep(self):
+        stop = stop_before_deadline(min_attempt_seconds=1)
+
+        async def main():
+            set_deadline(10)
+            return stop(_retry_state(4)), stop(_retry_state(9.5))
+
+        assert asyncio.run(main()) == (False, True)
+
+    def test_deadline_is_inherited_by_child_tasks(self):
+        async def main():
+            set_deadline(10)
+            return await asyncio.create_task(asyncio.to_thread(remaining_time))
+
+        assert asyncio.run(main()) is not None
+
+
+class TestServiceDeadline:
+    def test_slow_call_is_cut_at_the_deadline_without_retries(self, monkeypatch):
+        service = ImproveCVSectionService()
+        calls = 0
+
+        async def slow_generate_content(**kwargs):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(5)
+
+        monkeypatch.setattr(
+            service.client.aio.models, "generate_content", slow_generate_content
+        )
+        monkeypatch.setattr(service, "circuit_breaker", None)
+        monkeypatch.setattr(service, "hedger", None)
+        monkeypatch.setattr(service.config, "min_attempt_seconds", 0.05)
+
+        async def main():
+            set_deadline(0.2)
+            return await service.get_cv_section_improvements(
+                "Built things", Instruction.CONCISE
+            )
+
+        with pytest.raises(DeadlineExceededError):
+            asyncio.run(main())
+        assert calls == 1
+
+    def test_stalled_stream_is_cut_at_the_deadline(self, monkeypatch):
+        service = ImproveCVSectionService()
+
+        async def stalled_stream():
+            yield SimpleNamespace(text="Built", usage_metadata=None)
+            await asyncio.sleep(5)
+
+        async def generate_content_stream(**kwargs):
+            return stalled_stream()
+
+        monkeypatch.setattr(
+            service.client.aio.models,
+            "generate_content_stream",
+            generate_content_stream,
+        )
+        monkeypatch.setattr(service, "circuit_breaker", None)
+        monkeypatch.setattr(service.config, "min_attempt_seconds", 0.05)
+
+        async def main():
+            set_deadline(0.2)
+            chunks = service.stream_cv_section_improvements(
+                "Built things", Instruction.CONCISE
+            )
+            return [event async for event in events_to_sse(_as_events(chunks))]
+
+        events = asyncio.run(main())
+        assert events[-1].startswith("event: error\n")
+        assert "Deadline exceeded" in events[-1]
+        assert "Error interacting with Gemini API" not in events[-1]
+
+
+async def _as_events(chunks):
+    async for chunk in chunks:
+        yield None, {"text": chunk}
@@ -0,0 +1,68 @@
+import asyncio
+
+import pytest
+from google.genai import errors
+
+from src.core.ai.fake_client import FakeGeminiClient, FakeGeminiConfig
+from src.core.models.job_description_fields import get_job_description_example
+from src.core.services.cover_letter_service import GenerateCoverLetterService
+from src.core.services.cv_tailor_service import CVTailorService
+
+
+def _fake_client(**overrides) -> FakeGeminiClient:
+    return FakeGeminiClient(FakeGeminiConfig(latency_median_ms=1, seed=0, **overrides))
+
+
+class TestFakeGeminiClient:
+    def test_tailor_cv_returns_schema_valid_suggestions(self, full_cv_body):
+        service = CVTailorService()
+        service.response_cache = None
+        service.client = _fake_client()
+
+        comparison_cv = asyncio.run(
+            service.tailor_cv(full_cv_body, get_job_description_example())
+        )
+
+        assert comparison_cv.professional_title.suggested is not None
+        assert all(
+            item.summary.suggested is not None for item in comparison_cv.work_experience
+        )
+        assert comparison_cv.awards[0].summary.suggested is not None
+
+    def test_stream_cover_letter(self, full_cv_body):
+        service = GenerateCoverLetterService()
+        service.client = _fake_client(stream_chunk_chars=7)
+
+        async def main():
+            return [
+                chunk
+                async for chunk in service.stream_cover_letter(
+                    full_cv_body, get_job_description_example()
+                )
+            ]
+
+        chunks = asyncio.run(main())
+        assert len(chunks) > 1
+        assert "".join(chunks).startswith("Dear Hiring Manager, I am excited")
+
+    def test_reports_token_usage(self):
+        client = _fake_client()
+        response = asyncio.run(
+            client.aio.models.generate_content(model="model", contents="Prompt text")
+        )
+        assert response.usage_metadata.prompt_token_count > 0
+        assert response.usage_metadata.candidates_token_count > 0
+
+    @pytest.mark.parametrize(
+        "overrides, error_type",
+        [
+            ({"server_error_rate": 1.0}, errors.ServerError),
+            ({"rate_limit_error_rate": 1.0}, errors.ClientError),
+        ],
+    )
+    def test_configured_errors(self, overrides, error_type):
+        client = _fake_client(**overrides)
+        with pytest.raises(error_type):
+            asyncio.run(
+                client.aio.models.generate_content(model="model", contents="Prompt")
+            )
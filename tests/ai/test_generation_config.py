@@ -0,0 +1,166 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from google.genai.types import (
+    Candidate,
+    Content,
+    GenerateContentConfig,
+    GenerateContentResponse,
+    Part,
+    Schema,
+    Type,
+)
+
+from src.core.ai.generation_config import (
+    GenerationConfigRegistry,
+    StructuredGenerateContentConfig,
+    convert_response_schema,
+    parse_structured_response,
+)
+from src.core.ai.response_cache import make_cache_key
+from src.core.models.revised_cv_fields import RevisedCVResponseSchema
+from src.core.services.cv_tailor_service import CVTailorService
+
+
+def _structured_config(max_output_tokens: int = 2048) -> GenerateContentConfig:
+    return GenerateContentConfig(
+        max_output_tokens=max_output_tokens,
+        system_instruction="System prompt",
+        response_mime_type="application/json",
+        response_schema=RevisedCVResponseSchema,
+    )
+
+
+def _text_response(text: str) -> GenerateContentResponse:
+    return GenerateContentResponse(
+        candidates=[Candidate(content=Content(role="model", parts=[Part(text=text)]))]
+    )
+
+
+class TestGenerationConfigRegistry:
+    def test_config_is_built_once_with_a_converted_schema(self):
+        builds = []
+        registry = GenerationConfigRegistry()
+        registry.register("tailor", lambda: builds.append(1) or _structured_config())
+
+        config = registry.get("tailor")
+
+        assert registry.get("tailor") is config
+        assert len(builds) == 1
+        assert isinstance(config.response_schema, Schema)
+        assert config.output_model is RevisedCVResponseSchema
+        assert config.max_output_tokens == 2048
+
+    def test_configs_with_arguments_are_memoized_per_argument(self):
+        registry = GenerationConfigRegistry()
+        registry.register(
+            "sections",
+            lambda count: GenerateContentConfig(max_output_tokens=256 * count),
+            eager=False,
+        )
+
+        assert registry.get("sections", 2).max_output_tokens == 512
+        assert registry.get("sections", 2) is registry.get("sections", 2)
+        assert registry.get("sections", 3).max_output_tokens == 768
+        assert len(registry) == 2
+
+    def test_rebuild_picks_up_changed_prompts(self):
+        prompts = {"system": "First prompt"}
+        registry = GenerationConfigRegistry()
+        registry.register(
+            "letter",
+            lambda: GenerateContentConfig(system_instruction=prompts["system"]),
+        )
+        prompts["system"] = "Second prompt"
+
+        assert registry.get("letter").system_instruction == "First prompt"
+        registry.rebuild()
+        assert registry.get("letter").system_instruction == "Second prompt"
+
+    def test_unknown_config_raises(self):
+        with pytest.raises(KeyError):
+            GenerationConfigRegistry().get("missing")
+
+
+class TestConvertResponseSchema:
+    def test_references_are_inlined_and_optional_fields_nullable(self):
+        schema = convert_response_schema(RevisedCVResponseSchema)
+
+        assert schema.type == Type.OBJECT
+        assert schema.required == ["explanations"]
+        assert schema.property_ordering == list(RevisedCVResponseSchema.model_fields)
+        title = schema.properties["revised_professional_title"]
+        assert (title.type, title.nullable) == (Type.STRING, True)
+        work_item = schema.properties["revised_work_experience"].items
+        assert work_item.type == Type.OBJECT
+        assert work_item.title == "RevisedWorkItem"
+        assert work_item.properties["id"].type == Type.STRING
+        level = schema.properties["revised_skills"].items.properties["level"]
+        assert level.enum == ["Beginner", "Intermediate", "Advanced", "Expert"]
+
+
+class TestStructuredGenerateContentConfig:
+    def test_shared_instance_is_read_only_but_copies_are_not(self):
+        config = StructuredGenerateContentConfig.from_config(_structured_config())
+
+        with pytest.raises(TypeError, match="read-only"):
+            config.max_output_tokens = 1
+        copy = config.model_copy(update={"system_instruction": None})
+        copy.max_output_tokens = 1
+
+        assert config.max_output_tokens == 2048
+        assert config.system_instruction == "System prompt"
+        assert copy.output_model is RevisedCVResponseSchema
+
+    def test_cache_key_matches_the_unconverted_config(self):
+        config = StructuredGenerateContentConfig.from_config(_structured_config())
+
+        assert make_cache_key("model", "prompt", config) == make_cache_key(
+            "model", "prompt", _structured_config()
+        )
+        assert make_cache_key(
+            "model", "prompt", config.model_copy(update={"max_output_tokens": 1})
+        ) == make_cache_key("model", "prompt", _structured_config(max_output_tokens=1))
+
+    def test_response_text_is_parsed_into_the_output_model(self):
+        suggestions = RevisedCVResponseSchema(explanations="e", suggestions="s")
+
+        assert (
+            parse_structured_response(
+                _text_response(suggestions.model_dump_json()), RevisedCVResponseSchema
+            )
+            == suggestions
+        )
+        assert (
+            parse_structured_response(_text_response("{"), RevisedCVResponseSchema)
+            is None
+        )
+        assert (
+            parse_structured_response(
+                GenerateContentResponse(), RevisedCVResponseSchema
+            )
+            is None
+        )
+
+
+class TestServiceConfigs:
+    def test_services_pass_the_shared_config_and_parse_responses(self):
+        service = CVTailorService()
+        suggestions = RevisedCVResponseSchema(explanations="e", suggestions="s")
+        response = _text_response(suggestions.model_dump_json())
+        # The SDK leaves a dict in parsed when given a converted schema.
+        response.parsed = suggestions.model_dump()
+        generate_content = AsyncMock(return_value=response)
+        service.client.aio.models.generate_content = generate_content
+
+        result = asyncio.run(
+            service._generate_content(
+                "prompt", service._get_suggest_improvements_config(), "test"
+            )
+        )
+
+        assert result.parsed == suggestions
+        config = generate_content.await_args.kwargs["config"]
+        assert config is service._get_suggest_improvements_config()
+        assert isinstance(config.response_schema, Schema)
@@ -0,0 +1,128 @@
+import asyncio
+
+import pytest
+
+from src.core.ai.hedging import LatencyTracker, RequestHedger
+
+
+def _warm_up(hedger: RequestHedger, operation_name: str, latency: float, n: int):
+    tracker = hedger._tracker(operation_name)
+    for _ in range(n):
+        tracker.record(latency)
+    hedger.calls += n
+
+
+class TestLatencyTracker:
+    def test_percentile(self):
+        tracker = LatencyTracker()
+        assert tracker.percentile(95) is None
+        for latency in range(1, 101):
+            tracker.record(latency)
+        assert tracker.percentile(95) == 95
+        assert tracker.percentile(50) == 50
+
+    def test_window_drops_old_samples(self):
+        tracker = LatencyTracker(window_size=2)
+        for latency in (10, 1, 2):
+            tracker.record(latency)
+        assert len(tracker) == 2
+        assert tracker.percentile(100) == 2
+
+
+class TestRequestHedger:
+    def test_no_hedge_before_min_samples(self):
+        hedger = RequestHedger(min_samples=5, budget_ratio=1)
+        attempts = 0
+
+        async def call():
+            nonlocal attempts
+            attempts += 1
+            await asyncio.sleep(0.02)
+            return "result"
+
+        assert asyncio.run(hedger.run("op", call)) == "result"
+        assert attempts == 1
+        assert hedger.stats["hedged"] == 0
+
+    def test_slow_call_is_hedged_and_loser_cancelled(self):
+        hedger = RequestHedger(min_samples=5, budget_ratio=1)
+        _warm_up(hedger, "op", 0.01, 10)
+        attempts = 0
+        cancelled = []
+
+        async def call():
+            nonlocal attempts
+            attempts += 1
+            attempt = attempts
+            try:
+                await asyncio.sleep(1 if attempt == 1 else 0.01)
+            except asyncio.CancelledError:
+                cancelled.append(attempt)
+                raise
+            return attempt
+
+        assert asyncio.run(hedger.run("op", call)) == 2
+        assert cancelled == [1]
+        assert hedger.stats["hedged"] == 1
+        assert hedger.stats["hedge_wins"] == 1
+
+    def test_budget_caps_hedges(self):
+        hedger = RequestHedger(percentile=50, min_samples=5, budget_ratio=0.1)
+        _warm_up(hedger, "op", 0.001, 5)
+        attempts = 0
+
+        async def call():
+            nonlocal attempts
+            attempts += 1
+            await asyncio.sleep(0.01)
+            return "result"
+
+        async def main():
+            for _ in range(5):
+                await hedger.run("op", call)
+
+        asyncio.run(main())
+        assert hedger.stats["calls"] == 10
+        assert hedger.stats["hedged"] == 1
+        assert attempts == 6
+
+    def test_failed_attempt_falls_back_to_the_other(self):
+        hedger = RequestHedger(min_samples=5, budget_ratio=1)
+        _warm_up(hedger, "op", 0.01, 10)
+        attempts = 0
+
+        async def call():
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                await asyncio.sleep(0.03)
+                raise RuntimeError("primary failed")
+            await asyncio.sleep(0.05)
+            return "hedge"
+
+        assert asyncio.run(hedger.run("op", call)) == "hedge"
+
+    def test_all_attempts_failing_raises(self):
+        hedger = RequestHedger(min_samples=5, budget_ratio=1)
+        _warm_up(hedger, "op", 0.01, 10)
+
+        async def call():
+            await asyncio.sleep(0.02)
+            raise RuntimeError("failed")
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(hedger.run("op", call))
+
+    def test_hedge_win_records_latency_from_the_first_call(self):
+        hedger = RequestHedger(min_samples=5, budget_ratio=1)
+        _warm_up(hedger, "op", 0.05, 10)
+        attempts = 0
+
+        async def call():
+            nonlocal attempts
+            attempts += 1
+            await asyncio.sleep(1 if attempts == 1 else 0.01)
+            return attempts
+
+        assert asyncio.run(hedger.run("op", call)) == 2
+        assert hedger._tracker("op").percentile(100) >= 0.06
@@ -0,0 +1,79 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from src.core.ai.helpers import (
+    IncrementalTextPostprocessor,
+    postprocess_text_response,
+)
+
+COVER_LETTER_MD = """# Cover Letter
+
+Dear Hiring Manager,
+
+I am **very** excited to apply for the *Machine Learning Engineer* role at [Data Science UA](https://data-science-ua.com) .
+- Built and deployed models to production
+- Shipped _products_ quickly
+1. Led a team of three engineers
+> Quoted feedback from a colleague
+
+Best regards ,
+Dmytro"""
+
+
+GOLDEN_CORPUS = json.loads(
+    (Path(__file__).parent / "golden" / "postprocess_text_response.json").read_text()
+)
+
+
+def _stream(text: str, chunk_size: int) -> str:
+    postprocessor = IncrementalTextPostprocessor()
+    output = "".join(
+        postprocessor.feed(text[i : i + chunk_size])
+        for i in range(0, len(text), chunk_size)
+    )
+    return output + postprocessor.flush()
+
+
+class TestPostprocessTextResponse:
+    @pytest.mark.parametrize(
+        "case", GOLDEN_CORPUS, ids=[case["name"] for case in GOLDEN_CORPUS]
+    )
+    def test_golden_corpus(self, case):
+        assert postprocess_text_response(case["input"]) == case["expected"]
+
+    @pytest.mark.parametrize(
+        "case", GOLDEN_CORPUS, ids=[case["name"] for case in GOLDEN_CORPUS]
+    )
+    def test_golden_corpus_streamed(self, case):
+        for chunk_size in (1, 5, 32):
+            assert _stream(case["input"], chunk_size) == case["expected"]
+
+
+class TestIncrementalTextPostprocessor:
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 16, 64, 1000])
+    def test_matches_full_postprocessing(self, chunk_size: int):
+        assert _stream(COVER_LETTER_MD, chunk_size) == postprocess_text_response(
+            COVER_LETTER_MD
+        )
+
+    def test_emits_before_line_is_complete(self):
+        postprocessor = IncrementalTextPostprocessor()
+        assert postprocessor.feed("Dear Hiring Manager, I am wri") == (
+            "Dear Hiring Manager, I am"
+        )
+        assert postprocessor.feed("ting to apply") == " writing to"
+        assert postprocessor.flush() == " apply"
+
+    def test_holds_unclosed_markup(self):
+        postprocessor = IncrementalTextPostprocessor()
+        assert postprocessor.feed("I am *very excited ") == ""
+        assert postprocessor.feed("to* apply") == "I am very excited to"
+        assert postprocessor.flush() == " apply"
+
+    def test_headings_are_never_emitted(self):
+        postprocessor = IncrementalTextPostprocessor()
+        assert postprocessor.feed("# Cover letter title ") == ""
+        assert postprocessor.feed("\nBody") == ""
+        assert postprocessor.flush() == "Body"
@@ -0,0 +1,57 @@
+import json
+
+import pytest
+
+from src.core.ai.json_stream import IncrementalJSONObjectParser
+
+DOCUMENT = {
+    "explanations": 'Plan with "quotes", {braces} and [brackets]',
+    "revised_professional_title": "ML Engineer",
+    "revised_professional_summary": None,
+    "revised_work_experience": [
+        {"id": "a", "revised_highlights": ["First, highlight", "Second"]},
+        {"id": "b", "revised_summary": "Escaped \\ backslash"},
+    ],
+    "revised_skills": [],
+    "suggestions": "Add metrics.",
+}
+
+
+def _feed_in_chunks(text: str, chunk_size: int):
+    parser = IncrementalJSONObjectParser()
+    events = []
+    for i in range(0, len(text), chunk_size):
+        events.extend(parser.feed(text[i : i + chunk_size]))
+    return parser, events
+
+
+class TestIncrementalJSONObjectParser:
+    @pytest.mark.parametrize("chunk_size", [1, 3, 17, 10_000])
+    def test_reports_every_top_level_field(self, chunk_size: int):
+        text = json.dumps(DOCUMENT, indent=2)
+        parser, events = _feed_in_chunks(text, chunk_size)
+        fields = {event.key: event.value for event in events if not event.is_array_item}
+        assert fields == DOCUMENT
+        assert parser.buffer == text
+
+    def test_reports_array_items_before_array_closes(self):
+        parser = IncrementalJSONObjectParser()
+        events = parser.feed(
+            '{"explanations": "x", "revised_work_experience": [{"id": "a"}, {"id": '
+        )
+        assert [(e.key, e.value, e.is_array_item) for e in events] == [
+            ("explanations", "x", False),
+            ("revised_work_experience", {"id": "a"}, True),
+        ]
+
+    def test_reports_scalar_array_items(self):
+        _, events = _feed_in_chunks('{"tags": ["a", "b"]}', 2)
+        assert [(e.value, e.is_array_item) for e in events] == [
+            ("a", True),
+            ("b", True),
+            (["a", "b"], False),
+        ]
+
+    def test_incomplete_document_reports_nothing_for_open_field(self):
+        parser = IncrementalJSONObjectParser()
+        assert parser.feed('{"explanations": "still wri') == []
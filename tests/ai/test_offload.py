@@ -0,0 +1,104 @@
+import asyncio
+import contextvars
+import threading
+import time
+
+import pytest
+
+from src.core.ai.loop_lag import EventLoopLagMonitor
+from src.core.ai.offload import CPUExecutor
+
+request_id: contextvars.ContextVar[str] = contextvars.ContextVar("request_id")
+
+
+def _square(value: int) -> int:
+    return value * value
+
+
+class TestCPUExecutor:
+    def test_thread_kind_runs_off_the_loop_thread(self):
+        executor = CPUExecutor(kind="thread", max_workers=1)
+
+        async def main():
+            return await executor.run(threading.get_ident)
+
+        assert asyncio.run(main()) != threading.get_ident()
+        assert executor.stats["thread_calls"] == 1
+
+    def test_inline_kind_runs_on_the_loop_thread(self):
+        executor = CPUExecutor(kind="inline")
+
+        async def main():
+            return await executor.run(threading.get_ident)
+
+        assert asyncio.run(main()) == threading.get_ident()
+        assert executor.stats["inline_calls"] == 1
+
+    def test_context_and_errors_propagate(self):
+        executor = CPUExecutor(kind="thread", max_workers=1)
+
+        def fail():
+            raise ValueError(request_id.get())
+
+        async def main():
+            request_id.set("abc")
+            await executor.run(fail)
+
+        with pytest.raises(ValueError, match="abc"):
+            asyncio.run(main())
+
+    def test_heavy_work_uses_the_process_pool(self):
+        executor = CPUExecutor(kind="thread", process_workers=1)
+
+        async def main():
+            return await executor.run(_square, 7, heavy=True), await executor.run(
+                _square, 3
+            )
+
+        assert asyncio.run(main()) == (49, 9)
+        assert executor.stats["process_calls"] == 1
+        assert executor.stats["thread_calls"] == 1
+        executor.shutdown()
+
+    def test_shutdown_closes_the_pools_and_later_calls_start_new_ones(self):
+        executor = CPUExecutor(kind="thread", max_workers=1)
+
+        async def main():
+            return await executor.run(_square, 2)
+
+        assert asyncio.run(main()) == 4
+        pool = executor._thread_pool
+        executor.shutdown()
+        with pytest.raises(RuntimeError):
+            pool.submit(_square, 2)
+        assert asyncio.run(main()) == 4
+        executor.shutdown()
+
+
+class TestEventLoopLagMonitor:
+    def test_blocking_call_shows_up_as_lag(self):
+        monitor = EventLoopLagMonitor(interval_seconds=0.01)
+
+        async def main():
+            monitor.start()
+            await asyncio.sleep(0.03)
+            time.sleep(0.1)
+            await asyncio.sleep(0.03)
+            await monitor.stop()
+
+        asyncio.run(main())
+        assert monitor.stats["samples"] >= 2
+        assert monitor.stats["max_ms"] >= 50
+
+    def test_offloaded_call_does_not_block_the_loop(self):
+        monitor = EventLoopLagMonitor(interval_seconds=0.01)
+        executor = CPUExecutor(kind="thread", max_workers=1)
+
+        async def main():
+            monitor.start()
+            await asyncio.sleep(0.03)
+            await executor.run(time.sleep, 0.1)
+            await monitor.stop()
+
+        asyncio.run(main())
+        assert monitor.stats["max_ms"] < 50
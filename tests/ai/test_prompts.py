@@ -0,0 +1,16 @@
+from src.core.ai.helpers import format_prompt
+from src.core.ai.prompts import (
+    CACHED_CV_PROMPT,
+    JOB_DESC_FOR_CACHED_CV_PROMPT,
+    JOB_DESC_W_CV_PROMPT,
+)
+
+
+class TestPrompts:
+    def test_cached_prefix_and_suffix_make_up_the_uncached_prompt(self):
+        cv = "Experienced engineer."
+        job_description = "Data engineer wanted."
+
+        assert format_prompt(CACHED_CV_PROMPT, cv=cv) + format_prompt(
+            JOB_DESC_FOR_CACHED_CV_PROMPT, job_description=job_description
+        ) == format_prompt(JOB_DESC_W_CV_PROMPT, job_description=job_description, cv=cv)
@@ -0,0 +1,75 @@
+import asyncio
+import time
+
+from src.core.ai.rate_limiter import RateLimiter, TokenBucket
+
+
+class TestTokenBucket:
+    def test_starts_full(self):
+        bucket = TokenBucket(60)
+        assert bucket.time_until_available(60) == 0
+
+    def test_wait_time_after_consumption(self):
+        bucket = TokenBucket(60)
+        bucket.consume(60)
+        assert 0.9 < bucket.time_until_available(1) <= 1
+
+    def test_requests_larger_than_capacity_are_clamped(self):
+        bucket = TokenBucket(60)
+        assert bucket.time_until_available(1000) == 0
+
+    def test_refund_never_exceeds_capacity(self):
+        bucket = TokenBucket(60)
+        bucket.refund(100)
+        assert bucket.level == 60
+
+
+class TestRateLimiter:
+    def test_acquire_within_budget_does_not_wait(self):
+        limiter = RateLimiter(60, 1000, 1000)
+
+        async def main():
+            return await limiter.acquire(input_tokens=100, output_tokens=200)
+
+        reservation = asyncio.run(main())
+        assert reservation.input_tokens == 100
+        assert limiter.stats["throttled_calls"] == 0
+        assert limiter.stats["input_tokens_available"] == 900
+
+    def test_callers_queue_instead_of_failing(self):
+        limiter = RateLimiter(600, 1_000_000, 1_000_000)
+        limiter.requests.consume(600)
+
+        async def main():
+            started = time.monotonic()
+            await asyncio.gather(*(limiter.acquire(1, 1) for _ in range(2)))
+            return time.monotonic() - started
+
+        elapsed = asyncio.run(main())
+        assert elapsed >= 0.15
+        assert limiter.stats["throttled_calls"] >= 2
+
+    def test_reconcile_refunds_overestimate(self):
+        limiter = RateLimiter(60, 1000, 1000)
+
+        async def main():
+            return await limiter.acquire(input_tokens=500, output_tokens=500)
+
+        reservation = asyncio.run(main())
+        limiter.reconcile(
+            reservation, {"input_tokens_count": 100, "output_tokens_count": None}
+        )
+        assert limiter.stats["input_tokens_available"] == 900
+        assert limiter.stats["output_tokens_available"] == 500
+
+    def test_reconcile_charges_underestimate(self):
+        limiter = RateLimiter(60, 1000, 1000)
+
+        async def main():
+            return await limiter.acquire(input_tokens=100, output_tokens=100)
+
+        reservation = asyncio.run(main())
+        limiter.reconcile(
+            reservation, {"input_tokens_count": 1500, "output_tokens_count": 100}
+        )
+        assert limiter.stats["input_tokens_available"] == -500
@@ -0,0 +1,79 @@
+from typing import Optional, Type
+
+from google.genai.types import GenerateContentConfig
+from pydantic import BaseModel
+
+from src.core.ai.response_cache import ResponseCache, make_cache_key
+from src.core.models.revised_cv_fields import RevisedCVResponseSchema
+
+
+def _config(
+    max_output_tokens: int = 2048,
+    system_instruction: str = "System prompt",
+    response_schema: Optional[Type[BaseModel]] = RevisedCVResponseSchema,
+) -> GenerateContentConfig:
+    return GenerateContentConfig(
+        max_output_tokens=max_output_tokens,
+        system_instruction=system_instruction,
+        response_mime_type="application/json",
+        response_schema=response_schema,
+    )
+
+
+class TestMakeCacheKey:
+    def test_identical_inputs_produce_identical_keys(self):
+        assert make_cache_key("model", "prompt", _config()) == make_cache_key(
+            "model", "prompt", _config()
+        )
+
+    def test_key_depends_on_every_component(self):
+        base_key = make_cache_key("model", "prompt", _config())
+        assert make_cache_key("other-model", "prompt", _config()) != base_key
+        assert make_cache_key("model", "other prompt", _config()) != base_key
+        assert (
+            make_cache_key("model", "prompt", _config(system_instruction="Other"))
+            != base_key
+        )
+        assert (
+            make_cache_key("model", "prompt", _config(max_output_tokens=512))
+            != base_key
+        )
+        assert (
+            make_cache_key("model", "prompt", _config(response_schema=None)) != base_key
+        )
+
+
+class TestResponseCache:
+    def test_miss_then_hit(self):
+        cache = ResponseCache()
+        assert cache.get("key") is None
+        cache.set("key", "value")
+        assert cache.get("key") == "value"
+        assert cache.stats["hits"] == 1
+        assert cache.stats["misses"] == 1
+
+    def test_lru_eviction(self):
+        cache = ResponseCache(max_entries=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")
+        cache.set("c", "3")
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert cache.get("c") == "3"
+
+    def test_expired_entries_are_misses(self):
+        cache = ResponseCache(ttl_seconds=-1)
+        cache.set("key", "value")
+        assert cache.get("key") is None
+        assert cache.stats["memory_entries"] == 0
+
+    def test_sqlite_tier_survives_new_instance(self, tmp_path):
+        db_path = str(tmp_path / "cache.sqlite")
+        ResponseCache(sqlite_path=db_path).set("key", "value")
+
+        cache = ResponseCache(sqlite_path=db_path)
+        assert cache.get("key") == "value"
+        assert cache.get("key") == "value"
+        assert cache.stats["disk_hits"] == 1
+        assert cache.stats["memory_hits"] == 1
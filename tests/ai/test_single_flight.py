@@ -0,0 +1,116 @@
+import asyncio
+
+import pytest
+
+from src.core.ai.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    def test_concurrent_identical_calls_share_one_upstream_call(self):
+        single_flight = SingleFlight()
+        upstream_calls = 0
+
+        async def upstream():
+            nonlocal upstream_calls
+            upstream_calls += 1
+            await asyncio.sleep(0.01)
+            return "result"
+
+        async def main():
+            return await asyncio.gather(
+                *(single_flight.do("key", upstream) for _ in range(5))
+            )
+
+        assert asyncio.run(main()) == ["result"] * 5
+        assert upstream_calls == 1
+        assert single_flight.stats == {"leaders": 1, "coalesced": 4, "in_flight": 0}
+
+    def test_different_keys_are_not_coalesced(self):
+        single_flight = SingleFlight()
+
+        async def main():
+            return await asyncio.gather(
+                single_flight.do("a", lambda: asyncio.sleep(0, "a")),
+                single_flight.do("b", lambda: asyncio.sleep(0, "b")),
+            )
+
+        assert asyncio.run(main()) == ["a", "b"]
+        assert single_flight.stats["leaders"] == 2
+
+    def test_errors_propagate_to_all_waiters(self):
+        single_flight = SingleFlight()
+
+        async def upstream():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        async def main():
+            return await asyncio.gather(
+                single_flight.do("key", upstream),
+                single_flight.do("key", upstream),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(main())
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    def test_cancelled_waiter_does_not_cancel_shared_call(self):
+        single_flight = SingleFlight()
+
+        async def upstream():
+            await asyncio.sleep(0.02)
+            return "result"
+
+        async def main():
+            first = asyncio.create_task(single_flight.do("key", upstream))
+            second = asyncio.create_task(single_flight.do("key", upstream))
+            await asyncio.sleep(0.005)
+            first.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await first
+            return await second
+
+        assert asyncio.run(main()) == "result"
+
+    def test_last_waiter_cancellation_cancels_shared_call(self):
+        single_flight = SingleFlight()
+        finished = False
+
+        async def upstream():
+            nonlocal finished
+            await asyncio.sleep(0.05)
+            finished = True
+
+        async def main():
+            waiter = asyncio.create_task(single_flight.do("key", upstream))
+            await asyncio.sleep(0.005)
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+            await asyncio.sleep(0.06)
+
+        asyncio.run(main())
+        assert finished is False
+        assert single_flight.stats["in_flight"] == 0
+
+    def test_request_after_last_waiter_cancelled_starts_a_new_call(self):
+        single_flight = SingleFlight()
+        upstream_calls = 0
+
+        async def upstream():
+            nonlocal upstream_calls
+            upstream_calls += 1
+            await asyncio.sleep(0.02)
+            return "result"
+
+        async def main():
+            waiter = asyncio.create_task(single_flight.do("key", upstream))
+            await asyncio.sleep(0.005)
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+            return await single_flight.do("key", upstream)
+
+        assert asyncio.run(main()) == "result"
+        assert upstream_calls == 2
+        assert single_flight.stats["leaders"] == 2
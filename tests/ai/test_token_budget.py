@@ -0,0 +1,70 @@
+from src.core.ai.token_budget import TokenEstimator, fit_prompt_to_budget
+from src.core.models.job_description_fields import get_job_description_example
+from src.core.services.cv_tailor_service import CVTailorService
+
+
+def _fit(cv, max_tokens, estimator=None):
+    return fit_prompt_to_budget(
+        cv,
+        get_job_description_example(),
+        render_cv=lambda cv: cv.model_dump_json(exclude_none=True),
+        render_job_description=lambda jd: jd.model_dump_json(exclude_none=True),
+        build_prompt=lambda cv_string, jd_string: f"{jd_string}\n{cv_string}",
+        estimator=estimator or TokenEstimator(),
+        max_tokens=max_tokens,
+    )
+
+
+class TestTokenEstimator:
+    def test_calibrates_towards_observed_counts(self):
+        estimator = TokenEstimator(tokens_per_char=0.25, smoothing=0.5)
+        estimator.observe(chars=1000, actual_tokens=500)
+        assert estimator.tokens_per_char == 0.375
+        assert estimator.estimate("x" * 100) == 39
+
+    def test_ignores_missing_counts(self):
+        estimator = TokenEstimator()
+        estimator.observe(chars=1000, actual_tokens=None)
+        assert estimator.observations == 0
+
+
+class TestFitPromptToBudget:
+    def test_prompt_within_budget_is_untouched(self, full_cv_body):
+        fit = _fit(full_cv_body, max_tokens=None)
+        assert fit.trimmed == []
+        assert fit.cv is full_cv_body
+
+    def test_lowest_priority_content_is_trimmed_first(self, full_cv_body):
+        full = _fit(full_cv_body, max_tokens=None)
+        fit = _fit(full_cv_body, max_tokens=full.estimated_tokens - 1)
+
+        assert fit.trimmed == ["job_description.other"]
+        assert fit.job_description.job_description.other is None
+        assert fit.estimated_tokens <= full.estimated_tokens - 1
+
+    def test_keeps_most_recent_work_item(self, full_cv_body):
+        fit = _fit(full_cv_body, max_tokens=1)
+
+        assert fit.trimmed[:3] == [
+            "job_description.other",
+            "job_description.nice_to_have",
+            "job_description.about_company",
+        ]
+        assert fit.cv.publications is None
+        assert fit.cv.awards is None
+        assert fit.cv.projects is None
+        assert len(fit.cv.work_experience) == 1
+        assert len(full_cv_body.work_experience) == 3
+
+
+class TestPromptPreview:
+    def test_preview_reports_budget_and_trims(self, full_cv_body, monkeypatch):
+        service = CVTailorService()
+        monkeypatch.setattr(service.config, "max_input_tokens", 1)
+
+        preview = service.preview_prompt(full_cv_body, get_job_description_example())
+
+        assert preview.input_token_budget == 1
+        assert "job_description.other" in preview.trimmed
+        assert preview.estimated_input_tokens > 1
+        assert preview.system_instruction
@@ -0,0 +1,113 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.app.dependencies.cv_store import get_cv_store
+from src.app.main import create_app
+from src.core.models.job_description_fields import get_job_description_example
+from src.core.storage.cv_store import CVStore
+from src.core.templates.renderers.llm import TemplateLLMRenderer
+
+
+@pytest.fixture
+def client():
+    store = CVStore(render_cv=TemplateLLMRenderer.cv_to_llm_format)
+    app = create_app()
+    app.dependency_overrides[get_cv_store] = lambda: store
+    return TestClient(app)
+
+
+@pytest.fixture
+def job_description():
+    return json.loads(get_job_description_example().model_dump_json())
+
+
+def _cv_json(cv):
+    return json.loads(cv.model_dump_json())
+
+
+class TestCVStoreRoutes:
+    def test_create_get_and_conditional_update(self, client, full_cv_body):
+        created = client.post("/api/v1/cvs", json=_cv_json(full_cv_body))
+        cv_id = created.json()["cv_id"]
+        edited = _cv_json(full_cv_body)
+        edited["header"]["professional_title"] = "Senior Data Scientist"
+
+        fetched = client.get(f"/api/v1/cvs/{cv_id}")
+        updated = client.put(
+            f"/api/v1/cvs/{cv_id}",
+            json=edited,
+            headers={"If-Match": created.headers["ETag"]},
+        )
+        stale = client.put(
+            f"/api/v1/cvs/{cv_id}",
+            json=_cv_json(full_cv_body),
+            headers={"If-Match": created.headers["ETag"]},
+        )
+
+        assert created.status_code == 201
+        assert created.headers["Location"] == f"/api/v1/cvs/{cv_id}"
+        assert fetched.json()["cv"] == _cv_json(full_cv_body)
+        assert fetched.headers["ETag"] == created.json()["etag"]
+        assert updated.json()["version"] == 2
+        assert stale.status_code == 412
+        assert stale.headers["ETag"] == updated.headers["ETag"]
+        assert client.get("/api/v1/cvs/missing").status_code == 404
+
+
+class TestStoredCVRequests:
+    def test_cv_id_skips_rendering_and_gives_the_same_prompt(
+        self, client, full_cv_body, job_description, monkeypatch
+    ):
+        created = client.post("/api/v1/cvs", json=_cv_json(full_cv_body)).json()
+        by_value = client.post(
+            "/api/v1/tailor_cv/dry_run",
+            json={"cv": _cv_json(full_cv_body), "job_description": job_description},
+        )
+
+        def fail_render(*args, **kwargs):
+            raise AssertionError("stored CVs are not rendered again")
+
+        monkeypatch.setattr(TemplateLLMRenderer, "cv_to_llm_format", fail_render)
+        by_id = client.post(
+            "/api/v1/tailor_cv/dry_run",
+            json={
+                "cv_id": created["cv_id"],
+                "cv_etag": created["etag"],
+                "job_description": job_description,
+            },
+        )
+        cover_letter = client.post(
+            "/api/v1/cover_letter/dry_run",
+            json={"cv_id": created["cv_id"], "job_description": job_description},
+        )
+
+        assert by_id.status_code == 200
+        assert by_id.json() == by_value.json()
+        assert cover_letter.status_code == 200
+
+    @pytest.mark.parametrize(
+        "fields, status_code",
+        [
+            ({"cv_id": "missing"}, 404),
+            ({"cv_etag": '"stale"'}, 412),
+            ({"cv": "FULL_CV"}, 422),
+            ({"cv_id": None}, 422),
+        ],
+    )
+    def test_invalid_cv_references(
+        self, client, full_cv_body, job_description, fields, status_code
+    ):
+        created = client.post("/api/v1/cvs", json=_cv_json(full_cv_body)).json()
+        body = {"cv_id": created["cv_id"], "job_description": job_description}
+        body.update(
+            {
+                k: _cv_json(full_cv_body) if v == "FULL_CV" else v
+                for k, v in fields.items()
+            }
+        )
+
+        response = client.post("/api/v1/tailor_cv/dry_run", json=body)
+
+        assert response.status_code == status_code
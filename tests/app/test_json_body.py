@@ -0,0 +1,95 @@
+import json
+import re
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from src.app.api.v1.endpoints.tailor_cv import ChatRequest
+from src.app.dependencies.json_body import JSONBody
+from src.app.main import create_app
+from src.core.ai.offload import CPUExecutor
+from src.core.models.job_description_fields import get_job_description_example
+
+
+@pytest.fixture
+def chat_request_json(full_cv_body):
+    return json.loads(
+        ChatRequest(
+            cv=full_cv_body, job_description=get_job_description_example()
+        ).model_dump_json()
+    )
+
+
+def _client(json_body: JSONBody) -> TestClient:
+    """One route with FastAPI's own body parameter and one using json_body."""
+    app = FastAPI()
+
+    @app.post("/fastapi")
+    def fastapi_body(request: ChatRequest):
+        return request.job_description.job_title
+
+    @app.post("/json_body")
+    def raw_body(request: ChatRequest = Depends(json_body)):
+        return request.job_description.job_title
+
+    return TestClient(app)
+
+
+class TestJSONBody:
+    def test_responses_match_fastapi_body_validation(self, chat_request_json):
+        client = _client(JSONBody(ChatRequest))
+        invalid = json.loads(json.dumps(chat_request_json))
+        invalid["cv"]["work_experience"][0]["summary"] = 5
+        invalid["cv"]["skills"] = "Python"
+        del invalid["job_description"]["job_title"]
+        json_headers = {"content-type": "application/json"}
+
+        for request in (
+            {"json": chat_request_json},
+            {"json": invalid},
+            {"json": [1]},
+            {"content": b'{"cv": ', "headers": json_headers},
+            {"content": b"", "headers": json_headers},
+            {"content": b'{"cv": "\xff"}', "headers": json_headers},
+            {"content": b"cv=1", "headers": {"content-type": "text/plain"}},
+        ):
+            expected = client.post("/fastapi", **request)
+            actual = client.post("/json_body", **request)
+
+            assert actual.status_code == expected.status_code
+            assert actual.json() == expected.json()
+
+    def test_invalid_large_body_is_parsed_once(self, chat_request_json, monkeypatch):
+        json_body = JSONBody(ChatRequest, validate_json_min_bytes=1)
+        monkeypatch.setattr(JSONBody, "_decode", None)
+        monkeypatch.setattr(json_body.adapter, "validate_python", None)
+        invalid = json.loads(json.dumps(chat_request_json))
+        invalid["cv"]["work_experience"][0]["summary"] = 5
+
+        response = _client(json_body).post("/json_body", json=invalid)
+
+        assert response.status_code == 422
+        [detail] = response.json()["detail"]
+        assert detail["loc"] == ["body", "cv", "work_experience", 0, "summary"]
+        assert detail["type"] == "string_type"
+
+    def test_large_bodies_are_validated_on_the_executor(self, chat_request_json):
+        executor = CPUExecutor(kind="thread", max_workers=1)
+        json_body = JSONBody(ChatRequest, executor=executor, offload_min_bytes=1)
+
+        response = _client(json_body).post("/json_body", json=chat_request_json)
+
+        assert response.status_code == 200
+        assert executor.stats["thread_calls"] == 1
+
+    def test_openapi_documents_the_request_bodies(self):
+        document = create_app().openapi()
+        request_body = document["paths"]["/api/v1/tailor_cv"]["post"]["requestBody"]
+        refs = set(re.findall(r'"#/components/schemas/([^"]+)"', json.dumps(document)))
+
+        assert request_body["content"]["application/json"]["schema"] == {
+            "$ref": "#/components/schemas/ChatRequest"
+        }
+        assert {"ChatRequest", "CoverLetterChatRequest", "CVBody"} <= refs
+        assert refs <= set(document["components"]["schemas"])
@@ -0,0 +1,287 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+from google.genai import errors
+
+from src.app.api.v1.endpoints.cover_letter import CoverLetterChatRequest
+from src.app.api.v1.endpoints.improve_section import CVSectionChatRequest
+from src.app.api.v1.endpoints.tailor_cv import BatchChatRequest, ChatRequest
+from src.app.dependencies.common import (
+    get_cv_tailor_service,
+    get_generate_cover_letter_service,
+    get_improve_cv_section_service,
+)
+from src.app.main import create_app
+from src.core.ai.circuit_breaker import CircuitBreaker
+from src.core.ai.fake_client import FAKE_HIGHLIGHT, FakeGeminiClient, FakeGeminiConfig
+from src.core.config import settings
+from src.core.models.job_description_fields import get_job_description_example
+from src.core.services.base_service import BaseAIService
+from src.core.services.cover_letter_service import GenerateCoverLetterService
+from src.core.services.cv_tailor_service import CVTailorService
+from src.core.services.improve_cv_section_service import (
+    ImproveCVSectionService,
+    Instruction,
+)
+
+
+def _fake_client(**overrides) -> FakeGeminiClient:
+    return FakeGeminiClient(FakeGeminiConfig(latency_median_ms=1, seed=0, **overrides))
+
+
+def _sse_events(text):
+    """(event name, decoded data) pairs of a Server-Sent Events body."""
+    events = []
+    for message in text.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in message.splitlines())
+        events.append((fields.get("event"), json.loads(fields["data"])))
+    return events
+
+
+def _fail_mid_stream(monkeypatch, client: FakeGeminiClient, chunks_before_error=3):
+    generate_content_stream = client.aio.models.generate_content_stream
+
+    async def failing_generate_content_stream(**kwargs):
+        chunks = await generate_content_stream(**kwargs)
+
+        async def _stream():
+            for _ in range(chunks_before_error):
+                yield await anext(chunks)
+            raise errors.ServerError(
+                503, {"error": {"message": "Fake overload.", "status": "UNAVAILABLE"}}
+            )
+
+        return _stream()
+
+    monkeypatch.setattr(
+        client.aio.models, "generate_content_stream", failing_generate_content_stream
+    )
+
+
+def _post(app, path, body):
+    return TestClient(app).post(
+        path,
+        content=body.model_dump_json(),
+        headers={"content-type": "application/json"},
+    )
+
+
+@pytest.fixture
+def tailor_cv_stream(full_cv_body, monkeypatch):
+    service = CVTailorService()
+    service.response_cache = None
+    monkeypatch.setattr(service, "circuit_breaker", None)
+    app = create_app()
+    app.dependency_overrides[get_cv_tailor_service] = lambda: service
+    body = ChatRequest(cv=full_cv_body, job_description=get_job_description_example())
+
+    def post(**overrides):
+        service.client = _fake_client(**overrides)
+        return _post(app, "/api/v1/tailor_cv/stream", body)
+
+    return post
+
+
+class TestTailorCVStream:
+    def test_sections_are_followed_by_complete_and_done(
+        self, tailor_cv_stream, full_cv_body
+    ):
+        response = tailor_cv_stream(stream_chunk_chars=64)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = _sse_events(response.text)
+        names = [name for name, _ in events]
+        assert names[-2:] == ["complete", "done"]
+        assert set(names[:-2]) == {"section"}
+        assert len(names) - 2 > 1
+
+        streamed_ids = [
+            item["id"]
+            for name, data in events
+            if name == "section"
+            for item in data.get("work_experience", [])
+        ]
+        assert streamed_ids == [item.id for item in full_cv_body.work_experience]
+        complete = events[-2][1]["response"]
+        assert complete["professional_title"]["suggested"] is not None
+
+    def test_upstream_error_is_reported_as_an_error_event(self, tailor_cv_stream):
+        response = tailor_cv_stream(server_error_rate=1.0)
+
+        assert response.status_code == 200
+        events = _sse_events(response.text)
+        assert [name for name, _ in events] == ["error"]
+        assert events[0][1]["detail"].startswith("Error interacting with Gemini API")
+
+    def test_open_circuit_is_rejected_before_streaming(
+        self, tailor_cv_stream, monkeypatch
+    ):
+        circuit_breaker = CircuitBreaker(min_calls=1, open_seconds=30)
+        circuit_breaker.record_failure()
+        monkeypatch.setattr(BaseAIService, "circuit_breaker", circuit_breaker)
+
+        response = tailor_cv_stream()
+
+        assert response.status_code == 503
+        assert 0 < int(response.headers["retry-after"]) <= 30
+
+
+@pytest.fixture
+def text_stream_routes(full_cv_body, monkeypatch):
+    """(path, body, dependency, service) for each plain text streaming route."""
+    cover_letter_service = GenerateCoverLetterService()
+    improve_cv_section_service = ImproveCVSectionService()
+    routes = {
+        "cover_letter": (
+            "/api/v1/cover_letter",
+            CoverLetterChatRequest(
+                cv=full_cv_body, job_description=get_job_description_example()
+            ),
+            get_generate_cover_letter_service,
+            cover_letter_service,
+        ),
+        "improve_section": (
+            "/api/v1/improve_section",
+            CVSectionChatRequest(
+                cv_section="Built data pipelines.", instruction=Instruction.DETAILED
+            ),
+            get_improve_cv_section_service,
+            improve_cv_section_service,
+        ),
+    }
+    for _, _, _, service in routes.values():
+        monkeypatch.setattr(service, "circuit_breaker", None)
+        if hasattr(service, "response_cache"):
+            service.response_cache = None
+        service.client = _fake_client(stream_chunk_chars=7)
+    return routes
+
+
+@pytest.mark.parametrize("route", ["cover_letter", "improve_section"])
+class TestTextStreams:
+    def test_joined_text_matches_the_non_streamed_response(
+        self, text_stream_routes, route
+    ):
+        path, body, dependency, service = text_stream_routes[route]
+        app = create_app()
+        app.dependency_overrides[dependency] = lambda: service
+
+        streamed = _post(app, f"{path}/stream", body)
+        complete = _post(app, path, body)
+
+        assert streamed.status_code == complete.status_code == 200
+        events = _sse_events(streamed.text)
+        assert [name for name, _ in events][-1] == "done"
+        chunks = [data["text"] for name, data in events if name is None]
+        assert len(chunks) > 1
+        assert "".join(chunks) == complete.json()["response"]
+
+    def test_error_mid_stream_ends_with_an_error_event(
+        self, text_stream_routes, route, monkeypatch
+    ):
+        path, body, dependency, service = text_stream_routes[route]
+        _fail_mid_stream(monkeypatch, service.client)
+        app = create_app()
+        app.dependency_overrides[dependency] = lambda: service
+
+        response = _post(app, f"{path}/stream", body)
+
+        assert response.status_code == 200
+        events = _sse_events(response.text)
+        assert events[0][0] is None and events[0][1]["text"]
+        assert events[-1][0] == "error"
+        assert "Fake overload" in events[-1][1]["detail"]
+        assert "done" not in [name for name, _ in events]
+
+
+@pytest.fixture
+def tailor_cv_batch(full_cv_body, monkeypatch):
+    service = CVTailorService()
+    service.response_cache = None
+    service.client = _fake_client()
+    monkeypatch.setattr(service, "circuit_breaker", None)
+    generate_content = service.client.aio.models.generate_content
+
+    async def rejecting_generate_content(**kwargs):
+        if "Rejected Role" in kwargs["contents"]:
+            raise errors.ClientError(
+                400, {"error": {"message": "Fake bad request.", "status": "INVALID"}}
+            )
+        return await generate_content(**kwargs)
+
+    monkeypatch.setattr(
+        service.client.aio.models, "generate_content", rejecting_generate_content
+    )
+    app = create_app()
+    app.dependency_overrides[get_cv_tailor_service] = lambda: service
+
+    def post(job_titles):
+        body = BatchChatRequest.model_construct(
+            cv=full_cv_body,
+            job_descriptions=[
+                get_job_description_example().model_copy(update={"job_title": title})
+                for title in job_titles
+            ],
+        )
+        return _post(app, "/api/v1/tailor_cv/batch", body)
+
+    return post
+
+
+class TestTailorCVBatchRoute:
+    def test_each_result_is_one_ndjson_line(self, tailor_cv_batch):
+        job_titles = ["Data Engineer", "Rejected Role", "ML Engineer"]
+
+        response = tailor_cv_batch(job_titles)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert response.text.endswith("\n")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert sorted(line["index"] for line in lines) == [0, 1, 2]
+        by_title = {line["job_title"]: line for line in lines}
+        assert by_title.keys() == set(job_titles)
+        rejected = by_title.pop("Rejected Role")
+        assert rejected["response"] is None
+        assert "Fake bad request" in rejected["error"]
+        for line in by_title.values():
+            assert line["error"] is None
+            assert line["response"]["professional_title"]["suggested"] is not None
+
+    def test_too_many_job_descriptions_are_rejected(self, tailor_cv_batch):
+        response = tailor_cv_batch(
+            ["Data Engineer"] * (settings.BATCH_MAX_JOB_DESCRIPTIONS + 1)
+        )
+
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["loc"][-1] == "job_descriptions"
+
+
+class TestImproveSectionBatchRoute:
+    def _post(self, sections_count, monkeypatch):
+        service = ImproveCVSectionService()
+        service.client = _fake_client()
+        monkeypatch.setattr(service, "circuit_breaker", None)
+        app = create_app()
+        app.dependency_overrides[get_improve_cv_section_service] = lambda: service
+        body = {
+            "sections": [
+                {"cv_section": f"Built pipeline {index}.", "instruction": "Concise"}
+                for index in range(sections_count)
+            ]
+        }
+        return TestClient(app).post("/api/v1/improve_section/batch", json=body)
+
+    def test_one_rewrite_per_section(self, monkeypatch):
+        response = self._post(3, monkeypatch)
+
+        assert response.status_code == 200
+        assert response.json() == {"responses": [FAKE_HIGHLIGHT] * 3}
+
+    def test_too_many_sections_are_rejected(self, monkeypatch):
+        response = self._post(51, monkeypatch)
+
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["loc"] == ["body", "sections"]
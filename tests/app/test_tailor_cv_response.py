@@ -0,0 +1,120 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.app.api.v1.endpoints.tailor_cv import ChatRequest, ChatResponse
+from src.app.dependencies.common import get_cv_tailor_service
+from src.app.main import create_app
+from src.core.cv_builders.comparison_cv_builder import ComparisonCVBuilder
+from src.core.models.job_description_fields import get_job_description_example
+from src.core.models.revised_cv_fields import RevisedCVResponseSchema, RevisedWorkItem
+from src.core.templates.renderers.llm import TemplateLLMRenderer
+
+
+@pytest.fixture
+def comparison_cv(full_cv_body):
+    ai_suggestions = RevisedCVResponseSchema(
+        explanations="Plan",
+        revised_work_experience=[
+            RevisedWorkItem(id="W2", revised_summary="Revised second.")
+        ],
+    )
+    return ComparisonCVBuilder().create_comparison_cv(
+        full_cv_body, ai_suggestions, TemplateLLMRenderer.cv_id_aliases(full_cv_body)
+    )
+
+
+@pytest.fixture
+def client(full_cv_body, comparison_cv):
+    class StubService:
+        async def tailor_cv(self, cv, job_description, cv_string=None):
+            return comparison_cv
+
+    app = create_app()
+    app.dependency_overrides[get_cv_tailor_service] = StubService
+    body = ChatRequest(cv=full_cv_body, job_description=get_job_description_example())
+
+    def post(**params):
+        return TestClient(app).post(
+            "/api/v1/tailor_cv",
+            content=body.model_dump_json(),
+            headers={"content-type": "application/json"},
+            params=params,
+        )
+
+    return post
+
+
+class TestTailorCVResponse:
+    def test_full_view_matches_the_response_model(self, client, comparison_cv):
+        response = client()
+
+        assert response.status_code == 200
+        assert response.json() == json.loads(
+            ChatResponse(response=comparison_cv).model_dump_json()
+        )
+
+    def test_slim_view_omits_repeated_originals_and_nulls(self, client, comparison_cv):
+        full = client(view="full")
+        slim = client(view="slim")
+
+        assert len(slim.content) < len(full.content)
+        cv = slim.json()["response"]
+        assert "professional_title" not in cv["original_header"]
+        assert cv["professional_title"]["original"] == (
+            comparison_cv.original_header.professional_title
+        )
+        first, second = cv["work_experience"][:2]
+        assert "summary" not in first["original_data"]
+        assert "highlights" not in first["original_data"]
+        assert first["original_data"]["company_name"] == (
+            comparison_cv.work_experience[0].original_data.company_name
+        )
+        assert "suggested" not in first["summary"]
+        assert second["summary"]["suggested"] == "Revised second."
+
+    def test_unknown_view_is_rejected(self, client):
+        assert client(view="compact").status_code == 422
+
+
+class TestCVPatchRoutes:
+    def _apply(self, full_cv_body, operations):
+        body = {
+            "cv": full_cv_body.model_dump(mode="json"),
+            "operations": operations,
+        }
+        return TestClient(create_app()).post("/api/v1/tailor_cv/patch/apply", json=body)
+
+    def test_accepted_operations_are_applied(self, full_cv_body):
+        first = full_cv_body.work_experience[0]
+        response = self._apply(
+            full_cv_body,
+            [
+                {"op": "test", "path": "/work_experience/0/id", "value": first.id},
+                {
+                    "op": "replace",
+                    "path": "/work_experience/0/highlights",
+                    "value": ["Led the migration to a streaming pipeline."],
+                },
+            ],
+        )
+
+        assert response.status_code == 200
+        assert response.json()["work_experience"][0]["highlights"] == [
+            "Led the migration to a streaming pipeline."
+        ]
+
+    def test_failed_test_conflicts_and_invalid_result_is_rejected(self, full_cv_body):
+        conflict = self._apply(
+            full_cv_body,
+            [{"op": "test", "path": "/work_experience/0/id", "value": "other"}],
+        )
+        invalid = self._apply(
+            full_cv_body,
+            [{"op": "replace", "path": "/work_experience/0/summary", "value": "Short"}],
+        )
+
+        assert conflict.status_code == 409
+        assert invalid.status_code == 422
+        assert invalid.json()["detail"][0]["loc"] == ["work_experience", 0, "summary"]
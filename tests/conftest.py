@@ -1,12 +1,21 @@
+import os
 from uuid import uuid4
 
 import pytest
 
+os.environ.setdefault("GOOGLE_API_KEY", "test-api-key")
+os.environ.setdefault("CV_STORE_SQLITE_PATH", ":memory:")
+
 from src.core.models.input_cv_fields import (
+    AwardItem,
     CVBody,
     CVHeader,
     Location,
     ProfessionalSummary,
+    ProjectItem,
+    PublicationItem,
+    SkillItem,
+    WorkItem,
 )
 
 
@@ -55,3 +64,51 @@ def valid_highlights_data():
 def valid_id():
     """Provides valid ID data for tests."""
     yield uuid4().hex
+
+
+@pytest.fixture(scope="session")
+def full_cv_body(valid_summary_data, valid_highlights_data):
+    """Provides a CVBody with every comparable section filled in."""
+    return CVBody(
+        header=CVHeader(
+            full_name="Dmytro Kovalenko",
+            professional_title="Data Scientist",
+            email_address="dmytro.kovalenko@email.com",
+            phone_number="+380679876543",
+            github_url="http://github.com/dmytrodata",
+            linkedin_url="http://linkedin.com/in/dmytrokovalenko",
+        ),
+        professional_summary=ProfessionalSummary(
+            summary=valid_summary_data, highlights=valid_highlights_data
+        ),
+        skills=[SkillItem(name="Python", level="Expert", keywords=["pandas"])],
+        work_experience=[
+            WorkItem(
+                company_name=f"Company {i}",
+                job_title="Data Scientist",
+                start_date="2020-01-01",
+                summary=valid_summary_data,
+                highlights=valid_highlights_data,
+            )
+            for i in range(3)
+        ],
+        projects=[
+            ProjectItem(
+                name="Churn model",
+                summary=valid_summary_data,
+                highlights=valid_highlights_data,
+            )
+        ],
+        awards=[
+            AwardItem(
+                title="Kaggle Gold", date="2022-05-01", summary=valid_summary_data
+            )
+        ],
+        publications=[
+            PublicationItem(
+                name="Churn prediction",
+                releaseDate="2023-01-01",
+                summary=valid_summary_data,
+            )
+        ],
+    )
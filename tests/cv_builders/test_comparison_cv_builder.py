@@ -0,0 +1,118 @@
+from src.core.ai.json_stream import JSONStreamEvent
+from src.core.cv_builders.comparison_cv_builder import ComparisonCVBuilder
+from src.core.models.comparison_cv_fields import ComparisonWorkItem
+from src.core.models.revised_cv_fields import (
+    RevisedCVResponseSchema,
+    RevisedPublicationItem,
+    RevisedWorkItem,
+)
+from src.core.templates.renderers.llm import TemplateLLMRenderer
+
+
+class TestCreatePartialComparisonCV:
+    def test_work_item_is_compared_with_its_original(self, full_cv_body):
+        original_item = full_cv_body.work_experience[1]
+        event = JSONStreamEvent(
+            key="revised_work_experience",
+            value={"id": original_item.id, "revised_summary": "Revised summary."},
+            is_array_item=True,
+        )
+        partial = ComparisonCVBuilder().create_partial_comparison_cv(
+            full_cv_body, event
+        )
+        [work_item] = partial["work_experience"]
+        assert isinstance(work_item, ComparisonWorkItem)
+        assert work_item.id == original_item.id
+        assert work_item.summary.original == original_item.summary
+        assert work_item.summary.suggested == "Revised summary."
+
+    def test_complete_item_list_is_skipped(self, full_cv_body):
+        event = JSONStreamEvent(key="revised_work_experience", value=[])
+        assert (
+            ComparisonCVBuilder().create_partial_comparison_cv(full_cv_body, event)
+            is None
+        )
+
+    def test_unknown_item_id_is_skipped(self, full_cv_body, valid_id):
+        event = JSONStreamEvent(
+            key="revised_projects", value={"id": valid_id}, is_array_item=True
+        )
+        assert (
+            ComparisonCVBuilder().create_partial_comparison_cv(full_cv_body, event)
+            is None
+        )
+
+    def test_invalid_section_is_skipped(self, full_cv_body):
+        event = JSONStreamEvent(
+            key="revised_awards", value={"id": "not-a-uuid"}, is_array_item=True
+        )
+        assert (
+            ComparisonCVBuilder().create_partial_comparison_cv(full_cv_body, event)
+            is None
+        )
+
+    def test_professional_title(self, full_cv_body):
+        event = JSONStreamEvent(key="revised_professional_title", value="ML Engineer")
+        partial = ComparisonCVBuilder().create_partial_comparison_cv(
+            full_cv_body, event
+        )
+        assert partial["professional_title"].original == "Data Scientist"
+        assert partial["professional_title"].suggested == "ML Engineer"
+
+    def test_explanations(self, full_cv_body):
+        event = JSONStreamEvent(key="explanations", value="Plan")
+        assert ComparisonCVBuilder().create_partial_comparison_cv(
+            full_cv_body, event
+        ) == {"ai_general_explanations": "Plan"}
+
+    def test_aliased_item_id_is_mapped_back(self, full_cv_body):
+        id_aliases = TemplateLLMRenderer.cv_id_aliases(full_cv_body)
+        event = JSONStreamEvent(
+            key="revised_work_experience",
+            value={"id": "W2", "revised_summary": "Revised summary."},
+            is_array_item=True,
+        )
+        partial = ComparisonCVBuilder().create_partial_comparison_cv(
+            full_cv_body, event, id_aliases
+        )
+        [work_item] = partial["work_experience"]
+        assert work_item.id == full_cv_body.work_experience[1].id
+
+
+class TestCreateComparisonCV:
+    def test_aliased_suggestions_are_matched_to_originals(self, full_cv_body):
+        id_aliases = TemplateLLMRenderer.cv_id_aliases(full_cv_body)
+        ai_suggestions = RevisedCVResponseSchema(
+            explanations="Plan",
+            revised_work_experience=[
+                RevisedWorkItem(id="W3", revised_summary="Revised third.")
+            ],
+            revised_publications=[
+                RevisedPublicationItem(id="PB1", revised_summary="Revised paper.")
+            ],
+        )
+
+        comparison_cv = ComparisonCVBuilder().create_comparison_cv(
+            full_cv_body, ai_suggestions, id_aliases
+        )
+
+        summaries = [item.summary.suggested for item in comparison_cv.work_experience]
+        assert summaries == [None, None, "Revised third."]
+        assert comparison_cv.work_experience[2].id == full_cv_body.work_experience[2].id
+        assert comparison_cv.publications[0].summary.suggested == "Revised paper."
+
+
+class TestCVIdAliases:
+    def test_rendered_cv_uses_aliases_instead_of_ids(self, full_cv_body):
+        rendered_cv = TemplateLLMRenderer.cv_to_llm_format(full_cv_body)
+
+        assert TemplateLLMRenderer.cv_id_aliases(full_cv_body) == {
+            "W1": full_cv_body.work_experience[0].id,
+            "W2": full_cv_body.work_experience[1].id,
+            "W3": full_cv_body.work_experience[2].id,
+            "P1": full_cv_body.projects[0].id,
+            "A1": full_cv_body.awards[0].id,
+            "PB1": full_cv_body.publications[0].id,
+        }
+        assert "ID: W3" in rendered_cv and "ID: PB1" in rendered_cv
+        assert full_cv_body.work_experience[0].id not in rendered_cv
@@ -0,0 +1,177 @@
+import pytest
+
+from src.core.cv_builders.comparison_cv_builder import ComparisonCVBuilder
+from src.core.cv_builders.cv_patch_builder import (
+    CVPatchBuilder,
+    apply_cv_patch,
+    apply_json_patch,
+)
+from src.core.models.cv_patch_fields import JSONPatchOperation
+from src.core.models.revised_cv_fields import (
+    RevisedAwardItem,
+    RevisedCVResponseSchema,
+    RevisedPublicationItem,
+    RevisedWorkItem,
+)
+from src.core.templates.renderers.llm import TemplateLLMRenderer
+from src.core.utils.exceptions import CVPatchError
+
+
+@pytest.fixture
+def ai_suggestions(full_cv_body):
+    return RevisedCVResponseSchema(
+        explanations="Plan",
+        revised_professional_title="ML Engineer",
+        revised_work_experience=[
+            RevisedWorkItem(
+                id="W1", revised_summary=full_cv_body.work_experience[0].summary
+            ),
+            RevisedWorkItem(
+                id="W3",
+                revised_summary="Revised third role, now leading with the machine learning work.",
+                revised_highlights=["Shipped a ranking model."],
+            ),
+            RevisedWorkItem(id="W9", revised_summary="No such item."),
+        ],
+        revised_awards=[
+            RevisedAwardItem(
+                id="A1",
+                revised_summary="Award for the search ranking model used by millions of people.",
+            )
+        ],
+        revised_publications=[
+            RevisedPublicationItem(
+                id="PB1",
+                revised_summary="Paper on learning to rank, revised to match the job description.",
+            )
+        ],
+    )
+
+
+def _patch(full_cv_body, ai_suggestions):
+    return CVPatchBuilder.create_cv_patch(
+        full_cv_body, ai_suggestions, TemplateLLMRenderer.cv_id_aliases(full_cv_body)
+    )
+
+
+def _op(op, path, **fields):
+    return JSONPatchOperation(op=op, path=path, **fields)
+
+
+class TestCreateCVPatch:
+    def test_operations_change_only_what_the_ai_revised(
+        self, full_cv_body, ai_suggestions
+    ):
+        cv_patch = _patch(full_cv_body, ai_suggestions)
+        third = full_cv_body.work_experience[2]
+
+        assert [(op.op, op.path) for op in cv_patch.operations] == [
+            ("replace", "/header/professional_title"),
+            ("test", "/work_experience/2/id"),
+            ("replace", "/work_experience/2/summary"),
+            ("replace", "/work_experience/2/highlights"),
+            ("test", "/awards/0/id"),
+            (
+                "add" if full_cv_body.awards[0].summary is None else "replace",
+                "/awards/0/summary",
+            ),
+            ("test", "/publications/0/id"),
+            ("replace", "/publications/0/summary"),
+        ]
+        assert cv_patch.operations[1].value == third.id
+        assert cv_patch.ai_general_explanations == "Plan"
+
+    def test_applied_patch_matches_the_suggested_comparison_values(
+        self, full_cv_body, ai_suggestions
+    ):
+        cv_patch = _patch(full_cv_body, ai_suggestions)
+        comparison_cv = ComparisonCVBuilder().create_comparison_cv(
+            full_cv_body,
+            ai_suggestions,
+            TemplateLLMRenderer.cv_id_aliases(full_cv_body),
+        )
+
+        patched = apply_cv_patch(full_cv_body, cv_patch.operations)
+
+        assert patched.header.professional_title == "ML Engineer"
+        for patched_item, compared in zip(
+            patched.work_experience, comparison_cv.work_experience
+        ):
+            assert patched_item.summary == (
+                compared.summary.suggested or compared.summary.original
+            )
+            assert patched_item.highlights == (
+                compared.highlights.suggested or compared.highlights.original
+            )
+        assert patched.publications[0].summary == (
+            comparison_cv.publications[0].summary.suggested
+        )
+        assert patched.projects == full_cv_body.projects
+
+    def test_patch_is_much_smaller_than_the_comparison_cv(
+        self, full_cv_body, ai_suggestions
+    ):
+        cv_patch = _patch(full_cv_body, ai_suggestions)
+        comparison_cv = ComparisonCVBuilder().create_comparison_cv(
+            full_cv_body,
+            ai_suggestions,
+            TemplateLLMRenderer.cv_id_aliases(full_cv_body),
+        )
+
+        patch_size = len(cv_patch.model_dump_json(exclude_unset=True))
+        assert patch_size * 3 < len(comparison_cv.model_dump_json())
+
+
+class TestApplyCVPatch:
+    def test_reordered_items_fail_the_id_test(self, full_cv_body, ai_suggestions):
+        cv_patch = _patch(full_cv_body, ai_suggestions)
+        reordered = full_cv_body.model_copy(
+            update={"work_experience": full_cv_body.work_experience[::-1]}
+        )
+
+        with pytest.raises(CVPatchError, match="Test failed"):
+            apply_cv_patch(reordered, cv_patch.operations)
+
+    def test_accepted_subset_is_applied(self, full_cv_body, ai_suggestions):
+        cv_patch = _patch(full_cv_body, ai_suggestions)
+
+        patched = apply_cv_patch(full_cv_body, cv_patch.operations[1:3])
+
+        assert patched.header == full_cv_body.header
+        assert patched.work_experience[2].summary == cv_patch.operations[2].value
+
+
+class TestApplyJSONPatch:
+    def test_rfc_6902_operations(self):
+        document = {"a": {"b": [1, 2]}, "c~/d": 1}
+
+        result = apply_json_patch(
+            document,
+            [
+                _op("add", "/a/b/-", value=3),
+                _op("add", "/a/b/0", value=0),
+                _op("remove", "/a/b/1"),
+                _op("replace", "/c~0~1d", value=2),
+                _op("copy", "/e", from_="/a/b"),
+                _op("move", "/f", **{"from": "/a"}),
+                _op("test", "/e", value=[0, 2, 3]),
+            ],
+        )
+
+        assert result == {"c~/d": 2, "e": [0, 2, 3], "f": {"b": [0, 2, 3]}}
+
+    @pytest.mark.parametrize(
+        "operation",
+        [
+            _op("replace", "/missing", value=1),
+            _op("remove", "/a/5"),
+            _op("add", "/a/01", value=1),
+            _op("add", "a", value=1),
+            _op("test", "/a/0", value=2),
+            _op("move", "/a/0", from_="/a"),
+            _op("copy", "/b"),
+        ],
+    )
+    def test_invalid_operations_raise(self, operation):
+        with pytest.raises(CVPatchError):
+            apply_json_patch({"a": [1]}, [operation])
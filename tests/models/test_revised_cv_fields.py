@@ -73,6 +73,16 @@ class TestRevisedWorkItem:
         )
         assert UUID(item.id, version=4)
 
+    def test_id_short_alias(
+        self, valid_summary_data: str, valid_highlights_data: List[str]
+    ):
+        item = RevisedWorkItem(
+            id="W12",
+            revised_summary=valid_summary_data,
+            revised_highlights=valid_highlights_data,
+        )
+        assert item.id == "W12"
+
     def test_id_invalid_uuid(
         self, valid_summary_data: str, valid_highlights_data: List[str]
     ):
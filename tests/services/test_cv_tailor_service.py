@@ -0,0 +1,210 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+from google.genai.types import GenerateContentResponse
+
+from src.core.ai.circuit_breaker import CircuitBreaker
+from src.core.ai.context_cache import ContextCacheManager, LocalContextCacheBackend
+from src.core.ai.offload import CPUExecutor
+from src.core.ai.rate_limiter import RateLimiter
+from src.core.models.comparison_cv_fields import ComparisonCV
+from src.core.models.job_description_fields import get_job_description_example
+from src.core.models.revised_cv_fields import (
+    LLMResponse,
+    RevisedCVResponseSchema,
+    RevisedWorkItem,
+)
+from src.core.services.cv_tailor_service import CVTailorService
+
+
+class TestTailorCVBatch:
+    def test_results_in_completion_order_with_bounded_concurrency(
+        self, full_cv_body, monkeypatch
+    ):
+        service = CVTailorService()
+        job_descriptions = [
+            get_job_description_example().model_copy(update={"job_title": title})
+            for title in ("slow", "fails", "fast")
+        ]
+        delays = {"slow": 0.05, "fails": 0.01, "fast": 0.0}
+        in_flight = 0
+        max_in_flight = 0
+        rendered_cvs = []
+
+        async def fake_tailor_cv(
+            original_cv, job_description, cv_string=None, heavy=False
+        ):
+            nonlocal in_flight, max_in_flight
+            rendered_cvs.append(cv_string)
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(delays[job_description.job_title])
+            in_flight -= 1
+            if job_description.job_title == "fails":
+                raise RuntimeError("boom")
+            return job_description.job_title
+
+        monkeypatch.setattr(service, "tailor_cv", fake_tailor_cv)
+
+        async def main():
+            return [
+                item
+                async for item in service.tailor_cv_batch(
+                    full_cv_body, job_descriptions, max_concurrency=2
+                )
+            ]
+
+        results = asyncio.run(main())
+        assert [index for index, _ in results] == [1, 2, 0]
+        assert isinstance(results[0][1], RuntimeError)
+        assert results[2][1] == "slow"
+        assert max_in_flight == 2
+        assert len(set(rendered_cvs)) == 1
+
+
+class TestHeavyTailorCV:
+    def test_comparison_cv_is_built_on_the_process_pool(
+        self, full_cv_body, monkeypatch
+    ):
+        service = CVTailorService()
+        service.response_cache = None
+        executor = CPUExecutor(kind="thread", process_workers=1)
+        monkeypatch.setattr(service, "cpu_executor", executor)
+        ai_suggestions = RevisedCVResponseSchema(
+            explanations="Plan",
+            revised_work_experience=[
+                RevisedWorkItem(
+                    id="W2",
+                    revised_summary="Second role, rewritten around the job's data platform needs.",
+                )
+            ],
+        )
+        monkeypatch.setattr(
+            service,
+            "get_cv_improvements",
+            AsyncMock(
+                return_value=LLMResponse(
+                    response=GenerateContentResponse(parsed=ai_suggestions),
+                    metadata=None,
+                )
+            ),
+        )
+
+        try:
+            comparison_cv = asyncio.run(
+                service.tailor_cv(
+                    full_cv_body, get_job_description_example(), heavy=True
+                )
+            )
+        finally:
+            executor.shutdown()
+
+        assert isinstance(comparison_cv, ComparisonCV)
+        assert executor.stats["process_calls"] == 1
+        assert comparison_cv.work_experience[1].summary.suggested == (
+            ai_suggestions.revised_work_experience[0].revised_summary
+        )
+
+
+class TestContextCachedImprovements:
+    def test_only_job_description_is_sent_against_cached_cv(self, monkeypatch):
+        service = CVTailorService()
+        service.response_cache = None
+        service.context_cache = ContextCacheManager(
+            LocalContextCacheBackend(), min_tokens=10
+        )
+        service._make_api_call = AsyncMock(
+            return_value=GenerateContentResponse(
+                parsed=RevisedCVResponseSchema(explanations="Plan")
+            )
+        )
+        cv = "Experienced engineer. " * 100
+
+        asyncio.run(service.get_cv_improvements("Job description", cv))
+        asyncio.run(service.get_cv_improvements("Other job description", cv))
+
+        assert service._make_api_call.await_count == 2
+        prompts = [call.args[0] for call in service._make_api_call.await_args_list]
+        configs = [call.args[1] for call in service._make_api_call.await_args_list]
+        assert all(cv not in prompt for prompt in prompts)
+        assert "Other job description" in prompts[1]
+        assert configs[0].cached_content == configs[1].cached_content
+        assert configs[0].system_instruction is None
+        assert service.context_cache.stats["hits"] == 1
+
+
+class TestCircuitOpen:
+    def test_tailor_cv_returns_error_comparison_without_calling_gemini(
+        self, full_cv_body, monkeypatch
+    ):
+        service = CVTailorService()
+        service.response_cache = None
+        breaker = CircuitBreaker(min_calls=1)
+        breaker.record_failure()
+        monkeypatch.setattr(service, "circuit_breaker", breaker)
+        generate_content = AsyncMock()
+        monkeypatch.setattr(
+            service.client.aio.models, "generate_content", generate_content
+        )
+
+        comparison_cv = asyncio.run(
+            service.tailor_cv(full_cv_body, get_job_description_example())
+        )
+
+        generate_content.assert_not_awaited()
+        assert comparison_cv.ai_general_explanations == (
+            service.ai_suggestions_with_error.explanations
+        )
+
+    def test_rate_limit_reservation_is_returned_when_the_circuit_is_open(
+        self, full_cv_body, monkeypatch
+    ):
+        service = CVTailorService()
+        service.response_cache = None
+        breaker = CircuitBreaker(min_calls=1)
+        breaker.record_failure()
+        monkeypatch.setattr(service, "circuit_breaker", breaker)
+        limiter = RateLimiter(60, 10_000_000, 10_000_000)
+        monkeypatch.setattr(service, "rate_limiter", limiter)
+
+        asyncio.run(service.tailor_cv(full_cv_body, get_job_description_example()))
+
+        assert limiter.stats["requests_available"] == 60
+        assert limiter.stats["input_tokens_available"] == 10_000_000
+        assert limiter.stats["output_tokens_available"] == 10_000_000
+
+
+class TestTailorCVPatch:
+    def test_aliased_suggestions_become_operations_on_the_submitted_cv(
+        self, full_cv_body, monkeypatch
+    ):
+        service = CVTailorService()
+        ai_suggestions = RevisedCVResponseSchema(
+            explanations="Plan",
+            revised_work_experience=[
+                RevisedWorkItem(
+                    id="W2",
+                    revised_summary="Second role, rewritten around the job's data platform needs.",
+                )
+            ],
+        )
+        monkeypatch.setattr(
+            service,
+            "get_cv_improvements",
+            AsyncMock(
+                return_value=LLMResponse(
+                    response=GenerateContentResponse(parsed=ai_suggestions),
+                    metadata=None,
+                )
+            ),
+        )
+
+        cv_patch = asyncio.run(
+            service.tailor_cv_patch(full_cv_body, get_job_description_example())
+        )
+
+        assert [(op.op, op.path) for op in cv_patch.operations] == [
+            ("test", "/work_experience/1/id"),
+            ("replace", "/work_experience/1/summary"),
+        ]
+        assert cv_patch.operations[0].value == full_cv_body.work_experience[1].id
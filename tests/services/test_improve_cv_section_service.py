@@ -0,0 +1,155 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from google.genai.types import (
+    Candidate,
+    Content,
+    FinishReason,
+    GenerateContentResponse,
+    Part,
+)
+
+from src.core.ai.model_cascade import ModelStatsRecorder
+from src.core.models.revised_cv_fields import (
+    RevisedCVSection,
+    RevisedCVSectionsResponseSchema,
+)
+from src.core.services.improve_cv_section_service import (
+    ImproveCVSectionService,
+    Instruction,
+)
+from src.core.utils.exceptions import ResponseParsingError
+
+
+@pytest.fixture
+def service():
+    service = ImproveCVSectionService()
+    service.config.retry_attempts = 1
+    return service
+
+
+def _response(*sections: RevisedCVSection) -> GenerateContentResponse:
+    return GenerateContentResponse(
+        parsed=RevisedCVSectionsResponseSchema(sections=list(sections))
+    )
+
+
+class TestGetCVSectionsImprovements:
+    def test_single_call_returns_rewrites_in_input_order(self, service):
+        service._make_api_call = AsyncMock(
+            return_value=_response(
+                RevisedCVSection(index=1, revised_text="**Second** rewrite"),
+                RevisedCVSection(index=0, revised_text="First rewrite"),
+            )
+        )
+
+        result = asyncio.run(
+            service.get_cv_sections_improvements(
+                [("first", Instruction.CONCISE), ("second", Instruction.DETAILED)]
+            )
+        )
+
+        assert result == ["First rewrite", "Second rewrite"]
+        service._make_api_call.assert_awaited_once()
+        prompt, config, _, model_name = service._make_api_call.await_args.args
+        assert model_name == service.config.model_cascade[0]
+        assert "### Piece 0" in prompt and "Make it more Detailed." in prompt
+        assert (
+            config.max_output_tokens == 2 * service.config.max_output_tokens_per_section
+        )
+
+    def test_missing_section_raises(self, service):
+        service._make_api_call = AsyncMock(
+            return_value=_response(RevisedCVSection(index=0, revised_text="Only one"))
+        )
+
+        with pytest.raises(ResponseParsingError, match=r"missing sections: \[1\]"):
+            asyncio.run(
+                service.get_cv_sections_improvements(
+                    [("first", Instruction.CONCISE), ("second", Instruction.CONCISE)]
+                )
+            )
+
+
+class TestModelCascade:
+    def test_escalates_to_next_model_on_invalid_response(self, service, monkeypatch):
+        monkeypatch.setattr(service, "model_stats", ModelStatsRecorder())
+        lite_model, main_model = service.config.model_cascade
+        responses = {
+            lite_model: _response(RevisedCVSection(index=0, revised_text="Only one")),
+            main_model: _response(
+                RevisedCVSection(index=0, revised_text="First"),
+                RevisedCVSection(index=1, revised_text="Second"),
+            ),
+        }
+        service._make_api_call = AsyncMock(
+            side_effect=lambda prompt, config, operation_name, model_name: (
+                responses[model_name]
+            )
+        )
+
+        result = asyncio.run(
+            service.get_cv_sections_improvements(
+                [("first", Instruction.CONCISE), ("second", Instruction.CONCISE)]
+            )
+        )
+
+        assert result == ["First", "Second"]
+        assert service.model_stats.stats[lite_model]["escalations"] == 1
+        assert service.model_stats.stats[main_model]["successes"] == 1
+
+    def test_truncated_response_escalates(self, service, monkeypatch):
+        monkeypatch.setattr(service, "model_stats", ModelStatsRecorder())
+        lite_model, main_model = service.config.model_cascade
+
+        def _text_response(text: str, finish_reason: FinishReason):
+            return GenerateContentResponse(
+                candidates=[
+                    Candidate(
+                        content=Content(parts=[Part(text=text)]),
+                        finish_reason=finish_reason,
+                    )
+                ]
+            )
+
+        responses = {
+            lite_model: _text_response("Cut o", FinishReason.MAX_TOKENS),
+            main_model: _text_response("Complete rewrite.", FinishReason.STOP),
+        }
+        service._make_api_call = AsyncMock(
+            side_effect=lambda prompt, config, operation_name, model_name: (
+                responses[model_name]
+            )
+        )
+
+        result = asyncio.run(
+            service.get_cv_section_improvements("Built things", Instruction.CONCISE)
+        )
+
+        assert result == "Complete rewrite."
+        assert service.model_stats.stats[lite_model]["escalations"] == 1
+
+    def test_empty_text_response_escalates(self, service, monkeypatch):
+        monkeypatch.setattr(service, "model_stats", ModelStatsRecorder())
+        lite_model, main_model = service.config.model_cascade
+        responses = {
+            lite_model: GenerateContentResponse(candidates=[Candidate()]),
+            main_model: GenerateContentResponse(
+                candidates=[
+                    Candidate(content=Content(parts=[Part(text="Complete rewrite.")]))
+                ]
+            ),
+        }
+        service._make_api_call = AsyncMock(
+            side_effect=lambda prompt, config, operation_name, model_name: (
+                responses[model_name]
+            )
+        )
+
+        result = asyncio.run(
+            service.get_cv_section_improvements("Built things", Instruction.CONCISE)
+        )
+
+        assert result == "Complete rewrite."
+        assert service.model_stats.stats[lite_model]["escalations"] == 1
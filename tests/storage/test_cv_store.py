@@ -0,0 +1,71 @@
+import pytest
+
+from src.core.storage.cv_store import CVStore
+from src.core.templates.renderers.llm import TemplateLLMRenderer
+from src.core.utils.exceptions import CVNotFoundError, CVPreconditionFailedError
+
+
+def _store(**kwargs) -> CVStore:
+    return CVStore(render_cv=TemplateLLMRenderer.cv_to_llm_format, **kwargs)
+
+
+def _edited(cv, title="Senior Data Scientist"):
+    return cv.model_copy(
+        update={"header": cv.header.model_copy(update={"professional_title": title})}
+    )
+
+
+class TestCVStore:
+    def test_created_cv_is_kept_rendered_and_hashed(self, full_cv_body):
+        store = _store()
+
+        stored = store.create(full_cv_body)
+
+        assert store.get(stored.cv_id) is stored
+        assert stored.cv is full_cv_body
+        assert stored.cv_string == TemplateLLMRenderer.cv_to_llm_format(full_cv_body)
+        assert stored.version == 1
+        assert stored.etag == f'"{stored.content_hash}"'
+        assert stored.matches(stored.etag) and stored.matches(f"W/{stored.etag}")
+
+    def test_update_versions_changed_content_only(self, full_cv_body):
+        store = _store()
+        created = store.create(full_cv_body)
+
+        unchanged = store.update(created.cv_id, full_cv_body.model_copy())
+        updated = store.update(
+            created.cv_id, _edited(full_cv_body), if_match=created.etag
+        )
+
+        assert unchanged is created
+        assert updated.version == 2
+        assert updated.content_hash != created.content_hash
+        assert "Senior Data Scientist" in updated.cv_string
+        assert store.get(created.cv_id) is updated
+
+    def test_stale_etag_and_unknown_id_raise(self, full_cv_body):
+        store = _store()
+        created = store.create(full_cv_body)
+        store.update(created.cv_id, _edited(full_cv_body))
+
+        with pytest.raises(CVPreconditionFailedError):
+            store.update(created.cv_id, full_cv_body, if_match=created.etag)
+        with pytest.raises(CVPreconditionFailedError):
+            store.get_matching(created.cv_id, created.etag)
+        with pytest.raises(CVNotFoundError):
+            store.update("missing", full_cv_body)
+        assert store.get("missing") is None
+
+    def test_cvs_survive_restarts_and_eviction(self, full_cv_body, tmp_path):
+        path = str(tmp_path / "cvs.sqlite3")
+        first = _store(sqlite_path=path, max_entries=1)
+        created = first.create(full_cv_body)
+        other = first.create(_edited(full_cv_body, title="Analyst"))
+
+        reloaded = _store(sqlite_path=path).get(created.cv_id)
+
+        assert reloaded.cv == full_cv_body
+        assert reloaded.cv_string == created.cv_string
+        assert first.get(created.cv_id).content_hash == created.content_hash
+        assert first.stats["disk_hits"] == 1
+        assert first.get(other.cv_id) is not None
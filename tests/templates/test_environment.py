@@ -0,0 +1,32 @@
+from jinja2 import Template
+
+from src.core.models.job_description_fields import get_job_description_example
+from src.core.templates.md_job_description_template import (
+    JOB_DESCRIPTION_TEMPLATE_MD,
+)
+from src.core.templates.renderers.environment import (
+    JOB_DESCRIPTION_TEMPLATE,
+    TEMPLATE_SOURCES,
+    create_environment,
+    get_template,
+    render_template,
+)
+
+
+class TestTemplateEnvironment:
+    def test_every_template_is_compiled_once(self):
+        for name in TEMPLATE_SOURCES:
+            assert get_template(name) is get_template(name)
+
+    def test_output_matches_compiling_from_source(self):
+        job_description = get_job_description_example()
+        assert render_template(
+            JOB_DESCRIPTION_TEMPLATE, job_description_data=job_description
+        ) == Template(JOB_DESCRIPTION_TEMPLATE_MD).render(
+            job_description_data=job_description
+        )
+
+    def test_bytecode_cache_is_written(self, tmp_path):
+        environment = create_environment(str(tmp_path / "jinja"))
+        environment.get_template(JOB_DESCRIPTION_TEMPLATE)
+        assert any((tmp_path / "jinja").iterdir())
@@ -0,0 +1,52 @@
+from src.core.templates.renderers.environment import CV_LLM_WORK_ITEM_TEMPLATE
+from src.core.templates.renderers.llm import FragmentCache, TemplateLLMRenderer
+
+
+class TestFragmentCache:
+    def test_memoized_output_matches_fresh_render(self, full_cv_body):
+        cache = FragmentCache()
+        first = TemplateLLMRenderer.cv_to_llm_format(full_cv_body, cache)
+        second = TemplateLLMRenderer.cv_to_llm_format(full_cv_body, cache)
+
+        assert first == second
+        assert first == TemplateLLMRenderer.cv_to_llm_format(
+            full_cv_body, FragmentCache(max_entries=0)
+        )
+        assert cache.stats["hits"] == cache.stats["misses"]
+
+    def test_single_edit_re_renders_only_that_fragment(self, full_cv_body):
+        cache = FragmentCache()
+        TemplateLLMRenderer.cv_to_llm_format(full_cv_body, cache)
+        misses = cache.stats["misses"]
+
+        work_experience = list(full_cv_body.work_experience)
+        work_experience[1] = work_experience[1].model_copy(
+            update={"summary": "Edited summary."}
+        )
+        edited_cv = full_cv_body.model_copy(update={"work_experience": work_experience})
+        rendered_cv = TemplateLLMRenderer.cv_to_llm_format(edited_cv, cache)
+
+        assert cache.stats["misses"] == misses + 1
+        assert "Edited summary." in rendered_cv
+        assert rendered_cv == TemplateLLMRenderer.cv_to_llm_format(
+            edited_cv, FragmentCache(max_entries=0)
+        )
+
+    def test_alias_is_part_of_the_key(self, full_cv_body):
+        cache = FragmentCache()
+        item = full_cv_body.work_experience[0]
+        first = cache.render(CV_LLM_WORK_ITEM_TEMPLATE, work_item=item, alias="W1")
+        second = cache.render(CV_LLM_WORK_ITEM_TEMPLATE, work_item=item, alias="W2")
+
+        assert "ID: W1" in first and "ID: W2" in second
+
+    def test_least_recently_used_fragment_is_evicted(self, full_cv_body):
+        cache = FragmentCache(max_entries=2)
+        for alias in ("W1", "W2", "W3"):
+            cache.render(
+                CV_LLM_WORK_ITEM_TEMPLATE,
+                work_item=full_cv_body.work_experience[0],
+                alias=alias,
+            )
+
+        assert cache.stats["entries"] == 2